@@ -0,0 +1,110 @@
+"""
+Benchmark: sequential vs concurrent monthly archive downloads.
+
+Serves recorded archive JSON files from a local HTTP server (with an artificial per-request delay
+standing in for the Chess.com round trip) and times the old one-archive-at-a-time loop against
+`fetch_archives_concurrently`.
+
+Usage:
+    python benchmarks/archive_fetch.py [--archives-dir DIR] [--months 150] [--latency 0.15] [--workers 8]
+
+If --archives-dir is not given (or is empty), synthetic archives are generated instead.
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import fetch
+from utils.fetch import HostRateLimiter, fetch_archives_concurrently, get_games_from_archive
+
+
+def load_recorded_archives(archives_dir, months):
+    """Returns a list of archive bodies (bytes), recorded files first, synthetic padding after."""
+    bodies = []
+    if archives_dir and os.path.isdir(archives_dir):
+        for name in sorted(os.listdir(archives_dir)):
+            if name.endswith('.json'):
+                with open(os.path.join(archives_dir, name), 'rb') as f:
+                    bodies.append(f.read())
+
+    while len(bodies) < months:
+        month = len(bodies)
+        games = [{
+            "url": f"https://www.chess.com/game/live/{month * 1000 + i}",
+            "pgn": f'[Event "Live Chess"]\n[Date "2020.01.{i % 28 + 1:02d}"]\n[Round "-"]\n'
+                   f'[ECOUrl "https://www.chess.com/openings/Sicilian-Defense-2.Nf3"]\n\n1. e4 c5 2. Nf3 *',
+            "time_control": "180",
+            "time_class": "blitz",
+            "rules": "chess",
+            "white": {"rating": 2800, "result": "win", "username": "Hikaru"},
+            "black": {"rating": 2700, "result": "resigned", "username": "opponent"},
+        } for i in range(300)]
+        bodies.append(json.dumps({"games": games}).encode())
+
+    return bodies[:months]
+
+
+def start_server(bodies, latency):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(latency)
+            index = int(self.path.rsplit('/', 1)[-1])
+            body = bodies[index]
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--archives-dir', default=None)
+    parser.add_argument('--months', type=int, default=150)
+    parser.add_argument('--latency', type=float, default=0.15, help='Simulated server delay per request (seconds).')
+    parser.add_argument('--workers', type=int, default=8)
+    args = parser.parse_args()
+
+    bodies = load_recorded_archives(args.archives_dir, args.months)
+    server = start_server(bodies, args.latency)
+    host, port = server.server_address
+    urls = [f"http://{host}:{port}/archive/{i}" for i in range(len(bodies))]
+
+    # The local server needs no rate limit; both loops would otherwise be capped by the shared limiter
+    fetch.api_rate_limiter = HostRateLimiter(0)
+
+    start = time.perf_counter()
+    sequential = []
+    for url in urls:
+        sequential.append(get_games_from_archive(url))
+    sequential_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    concurrent = fetch_archives_concurrently(urls, max_workers=args.workers)
+    concurrent_time = time.perf_counter() - start
+
+    server.shutdown()
+
+    assert concurrent == sequential, "Concurrent fetch must return archives in the same order"
+
+    print(f"Archives: {len(urls)}  (simulated latency {args.latency * 1000:.0f} ms)")
+    print(f"Sequential loop:          {sequential_time:8.2f} s")
+    print(f"Concurrent ({args.workers} workers):  {concurrent_time:8.2f} s")
+    print(f"Speedup:                  {sequential_time / concurrent_time:8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
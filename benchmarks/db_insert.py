@@ -0,0 +1,92 @@
+"""
+Benchmark: per-row `cursor.execute` vs batched `insert_player_games` into player_game_data.
+
+Uses a local SQLite database as a stand-in for SQL Server and reports rows per second for both paths.
+
+Usage:
+    python benchmarks/db_insert.py [--rows 60000] [--batch-size 1000]
+"""
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.db import PLAYER_GAME_COLUMNS, insert_player_games
+
+CREATE_TABLE = f"""
+    CREATE TABLE player_game_data (
+        {', '.join(f'{column} TEXT' for column in PLAYER_GAME_COLUMNS)},
+        last_updated TEXT
+    )
+"""
+
+
+def make_games(rows):
+    return pd.DataFrame({
+        'player_name': 'hikaru',
+        'game_url': [f"https://www.chess.com/game/live/{i}" for i in range(rows)],
+        'game_date': '2024.01.01',
+        'game_time_control': '180',
+        'game_time_class': 'blitz',
+        'game_variant': 'chess',
+        'opening': 'Sicilian-Defense',
+        'white_rating': 3000,
+        'white_result': 'win',
+        'white_username': 'Hikaru',
+        'white_accuracy': 91.5,
+        'black_rating': 2900,
+        'black_result': 'resigned',
+        'black_username': 'opponent',
+        'black_accuracy': 85.2,
+    })
+
+
+def insert_row_by_row(df, conn):
+    """The previous implementation: one cursor.execute per game, one commit at the end."""
+    cursor = conn.cursor()
+    insert_query = f"""
+        INSERT INTO player_game_data ({', '.join(PLAYER_GAME_COLUMNS)}, last_updated)
+        VALUES ({', '.join(['?'] * (len(PLAYER_GAME_COLUMNS) + 1))})
+    """
+    for index, row in df.iterrows():
+        cursor.execute(insert_query, tuple(row[column] for column in PLAYER_GAME_COLUMNS) + (datetime.now().date().isoformat(),))
+    conn.commit()
+
+
+def timed(label, insert, df):
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = sqlite3.connect(os.path.join(tmp, 'bench.db'))
+        conn.execute(CREATE_TABLE)
+        start = time.perf_counter()
+        insert(df, conn)
+        elapsed = time.perf_counter() - start
+        count = conn.execute("SELECT COUNT(*) FROM player_game_data").fetchone()[0]
+        conn.close()
+
+    assert count == len(df)
+    print(f"{label:<28} {elapsed:8.2f} s   {len(df) / elapsed:12,.0f} rows/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=60000)
+    parser.add_argument('--batch-size', type=int, default=1000)
+    args = parser.parse_args()
+
+    sqlite3.register_adapter(type(datetime.now().date()), lambda d: d.isoformat())
+    df = make_games(args.rows)
+
+    print(f"Rows: {args.rows}")
+    timed('Row by row (iterrows)', insert_row_by_row, df)
+    timed(f'Batched (batch={args.batch_size})', lambda df, conn: insert_player_games(df, conn, args.batch_size), df)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmark: building a player's charts on every rerun vs serving them from the figure cache.
+
+Times the charts of one page view (win/draw/loss pies, both stacked bars and the three rating tabs)
+built from pandas and Plotly each time (the previous behaviour, via the builders' `__wrapped__`) against
+repeat views answered by `cached_figure`, and checks the cached figures serialize to the same JSON.
+
+Usage:
+    python benchmarks/figure_cache.py [--games 200000] [--repeat 5]
+"""
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from player_stats import PLAYER, best_of, make_games
+from utils.charts import (create_horizontal_stacked_bar_chart, create_rating_chart, get_figure_cache_stats,
+                          player_draw_chart, player_loss_chart, player_win_chart)
+from utils.stats import build_rating_series, compute_player_stats, get_player_games
+
+TIME_PERIODS = ['Last 1 Year', 'Last 3 Years', 'All Time']
+
+
+def page_charts(games, rating_series, stats, uncached=False):
+    build = (lambda chart: chart.__wrapped__) if uncached else (lambda chart: chart)
+    figures = [build(chart)(games, PLAYER, 400, 300) for chart in (player_win_chart, player_draw_chart, player_loss_chart)]
+    for color in (stats.white, stats.black):
+        figures.append(build(create_horizontal_stacked_bar_chart)(color.win_ratio, color.draw_ratio, color.loss_ratio,
+                                                                   color.wins, color.draws, color.losses, 100, 400))
+    figures += [build(create_rating_chart)(rating_series, PLAYER, PLAYER, {}, 800, 400, time_period)
+                for time_period in TIME_PERIODS]
+    return [json.loads(fig.to_json()) for fig in figures]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--games', type=int, default=200_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    games = get_player_games(make_games(args.games, openings=400), PLAYER)
+    rating_series = build_rating_series(games)
+    stats = compute_player_stats(games)
+
+    built_time, built = best_of(args.repeat, page_charts, games, rating_series, stats, True)
+    page_charts(games, rating_series, stats)  # First view fills the cache
+    cached_time, cached = best_of(args.repeat, page_charts, games, rating_series, stats)
+
+    assert cached == built, "Cached figures must match freshly built ones"
+
+    cache = get_figure_cache_stats()
+    print(f"Games: {len(games):,}  Charts per view: {len(built)}  (best of {args.repeat}, incl. to_json)")
+    print(f"Built every rerun (previous): {built_time * 1000:8.1f} ms")
+    print(f"Figure cache hits:            {cached_time * 1000:8.1f} ms   ({built_time / cached_time:.1f}x)")
+    print(f"Cache: {cache['entries']} entries, {cache['bytes'] / 1024:.1f} KB, {cache['hits']} hits, {cache['misses']} misses")
+
+
+if __name__ == '__main__':
+    main()
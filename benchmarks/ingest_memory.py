@@ -0,0 +1,121 @@
+"""
+Benchmark: peak memory of building a player's game DataFrame from their archives.
+
+Serves synthetic monthly archives (Chess.com-style PGNs with clock comments) from a local HTTP server
+and measures, with tracemalloc, the peak Python memory of the previous pipeline (every raw game in
+`all_games`, then a `formatted_games` list, then a DataFrame) against the streaming `ingest_archives`.
+
+Usage:
+    python benchmarks/ingest_memory.py [--months 120] [--games-per-month 500] [--moves 60]
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from archive_fetch import start_server
+from pgn_headers import make_pgn
+from utils import fetch
+from utils.fetch import fetch_archives_concurrently, ingest_archives
+from utils.parse import get_opening_name, parse_pgn_headers
+
+
+def make_archives(months, games_per_month, moves):
+    bodies = []
+    for month in range(months):
+        games = [{
+            "url": f"https://www.chess.com/game/live/{month * games_per_month + i}",
+            "pgn": make_pgn(month * games_per_month + i, moves),
+            "time_control": "180",
+            "time_class": "blitz",
+            "rules": "chess",
+            "accuracies": {"white": 91.3, "black": 84.7},
+            "white": {"rating": 3200, "result": "win", "username": "Hikaru", "@id": "https://api.chess.com/pub/player/hikaru"},
+            "black": {"rating": 3000, "result": "resigned", "username": f"opponent{i}", "@id": "https://api.chess.com/pub/player/x"},
+            "tcn": "mC0Kgv5Qlt9IbsZRcM" * moves,
+            "fen": "8/8/8/8/8/8/8/8 w - -",
+        } for i in range(games_per_month)]
+        bodies.append(json.dumps({"games": games}).encode())
+    return bodies
+
+
+def legacy_ingest(archive_urls):
+    """The previous get_player_stats body: all raw games, then all formatted games, then the DataFrame."""
+    all_games = []
+    for games in fetch_archives_concurrently(archive_urls):
+        all_games.extend(games)
+
+    formatted_games = []
+    for game in all_games:
+        if isinstance(game, dict):
+            headers = parse_pgn_headers(game.get("pgn"))
+            formatted_games.append({
+                "game_url": game.get("url"),
+                "game_date": headers.get('Date'),
+                "game_time_control": game.get("time_control"),
+                "game_time_class": game.get("time_class"),
+                "game_variant": game.get("rules"),
+                "opening": get_opening_name(headers.get('ECOUrl')),
+                "white_rating": game.get("white", {}).get("rating"),
+                "white_result": game.get("white", {}).get("result"),
+                "white_username": game.get("white", {}).get("username"),
+                "white_accuracy": game.get("accuracies", {}).get("white"),
+                "black_rating": game.get("black", {}).get("rating"),
+                "black_result": game.get("black", {}).get("result"),
+                "black_username": game.get("black", {}).get("username"),
+                "black_accuracy": game.get("accuracies", {}).get("black")
+            })
+
+    return pd.DataFrame(formatted_games)
+
+
+def measure(func, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, peak, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--months', type=int, default=120)
+    parser.add_argument('--games-per-month', type=int, default=500)
+    parser.add_argument('--moves', type=int, default=60)
+    args = parser.parse_args()
+
+    bodies = make_archives(args.months, args.games_per_month, args.moves)
+    server = start_server(bodies, latency=0)
+    host, port = server.server_address
+    urls = [f"http://{host}:{port}/archive/{i}" for i in range(len(bodies))]
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        # Keep the archive cache out of the working tree
+        fetch.ARCHIVE_CACHE_DIR = cache_dir
+
+        legacy, legacy_peak, legacy_time = measure(legacy_ingest, urls)
+        streamed, streamed_peak, streamed_time = measure(ingest_archives, urls)
+
+    server.shutdown()
+
+    pd.testing.assert_frame_equal(streamed, legacy)
+
+    mb = 1024 * 1024
+    print(f"Archives: {len(urls)}  Games: {len(streamed):,}  (~{args.moves} moves each)")
+    print(f"Result DataFrame:                  {streamed.memory_usage(deep=True).sum() / mb:8.1f} MB")
+    print(f"Peak, all_games + list (previous): {legacy_peak / mb:8.1f} MB   {legacy_time:6.2f} s")
+    print(f"Peak, ingest_archives:             {streamed_peak / mb:8.1f} MB   {streamed_time:6.2f} s   "
+          f"({legacy_peak / streamed_peak:.1f}x lower)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+"""
+Benchmark: chained `str.split` over the whole PGN vs `parse_pgn_headers`.
+
+Times the previous `get_date` + `get_openings_2` (split the full PGN text, moves included, twice per
+game) against parsing the tag section once per game, over a recorded monthly archive, and checks both
+extract the same dates and openings.
+
+Usage:
+    python benchmarks/pgn_headers.py [--archive FILE.json] [--games 20000] [--moves 60] [--repeat 5]
+
+FILE.json is a saved response of https://api.chess.com/pub/player/<user>/games/<yyyy>/<mm>. Without
+it, games with Chess.com-style PGNs (clock comments on every move) are generated instead.
+"""
+import argparse
+import json
+import os
+import re
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from player_stats import best_of
+from utils.parse import get_opening_name, parse_pgn_headers
+
+OPENINGS = ['Sicilian-Defense-2.Nf3', 'Queens-Gambit-Declined', 'Caro-Kann-Defense-Advance-Variation-3...Bf5',
+            'Kings-Pawn-Opening', 'Ruy-Lopez-Opening-Morphy-Defense-4.Ba4']
+
+
+def make_pgn(i, moves=60):
+    move_text = ' '.join(f'{n}. e4 {{[%clk 0:02:{59 - n % 60:02d}.9]}} {n}... e5 {{[%clk 0:02:{58 - n % 59:02d}.1]}}'
+                         for n in range(1, moves + 1))
+    return (f'[Event "Live Chess"]\n[Site "Chess.com"]\n[Date "2024.01.{i % 28 + 1:02d}"]\n[Round "-"]\n'
+            f'[White "Hikaru"]\n[Black "opponent{i}"]\n[Result "1-0"]\n[CurrentPosition "8/8/8/8/8/8/8/8 w - -"]\n'
+            f'[Timezone "UTC"]\n[ECO "B40"]\n[ECOUrl "https://www.chess.com/openings/{OPENINGS[i % len(OPENINGS)]}"]\n'
+            f'[UTCDate "2024.01.{i % 28 + 1:02d}"]\n[UTCTime "10:00:00"]\n[WhiteElo "3200"]\n[BlackElo "3000"]\n'
+            f'[TimeControl "180"]\n[Termination "Hikaru won by resignation"]\n[StartTime "10:00:00"]\n'
+            f'[EndDate "2024.01.{i % 28 + 1:02d}"]\n[EndTime "10:07:12"]\n'
+            f'[Link "https://www.chess.com/game/live/{i}"]\n\n{move_text} 1-0\n')
+
+
+def load_games(archive, games, moves):
+    if archive:
+        with open(archive) as f:
+            return json.load(f).get('games', [])
+    return [{'pgn': make_pgn(i, moves)} for i in range(games)]
+
+
+def split_date(pgn):
+    """The previous get_date."""
+    return pgn.split('[Date ')[1].split(']\n[Round')[0].replace('"', '')
+
+
+def split_opening(game):
+    """The previous get_openings_2."""
+    try:
+        pgn = game.get("pgn", "")
+        if "ECOUrl" in pgn:
+            opening_name = pgn.split('ECOUrl')[1].split('openings/')[1].split('"]')[0]
+            return re.split(r'-(\d)', opening_name)[0].replace('"]', '').split("\n")[0]
+        return None
+    except IndexError:
+        return None
+
+
+def with_split(games):
+    return [(split_date(game['pgn']), split_opening(game)) for game in games]
+
+
+def with_parser(games):
+    parsed = []
+    for game in games:
+        headers = parse_pgn_headers(game.get('pgn'))
+        parsed.append((headers.get('Date'), get_opening_name(headers.get('ECOUrl'))))
+    return parsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--archive', default=None)
+    parser.add_argument('--games', type=int, default=20_000)
+    parser.add_argument('--moves', type=int, default=60, help='Moves per synthetic game.')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    games = [game for game in load_games(args.archive, args.games, args.moves) if '[Date ' in game.get('pgn', '')]
+    pgn_bytes = sum(len(game['pgn']) for game in games)
+
+    split_time, split_result = best_of(args.repeat, with_split, games)
+    parser_time, parser_result = best_of(args.repeat, with_parser, games)
+
+    assert parser_result == split_result, "parse_pgn_headers must extract the same dates and openings"
+
+    print(f"Games: {len(games):,}  ({pgn_bytes / len(games):,.0f} PGN bytes per game, best of {args.repeat})")
+    print(f"str.split on the full PGN (previous): {split_time * 1000:8.1f} ms")
+    print(f"parse_pgn_headers (all tags):         {parser_time * 1000:8.1f} ms   ({split_time / parser_time:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""
+Benchmark: row-wise `DataFrame.apply` vs vectorized column selection in the pie charts and best win.
+
+Times the previous win/draw/loss pie charts and `get_best_win` (which picked the opponent's result,
+rating and name with `df.apply(lambda row: ..., axis=1)`) against the current versions reading the
+player perspective table, and checks both produce the same chart slices and best win.
+
+Usage:
+    python benchmarks/pie_charts.py [--games 200000] [--repeat 3]
+"""
+import argparse
+import os
+import sys
+
+import pandas as pd
+import plotly.graph_objects as go
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from player_stats import PLAYER, best_of, make_games
+from utils.charts import player_draw_chart, player_loss_chart, player_win_chart
+from utils.stats import get_best_win, lose_conditions, normalise_player_games, win_conditions
+
+CHART_DRAW_CONDITIONS = ['stalemate', 'insufficient material', 'repetition', '50-move rule', 'agreed draw', 'timeout draw']
+
+
+def player_games_with(df, player, conditions):
+    return df[((df['white_username'] == player) & (df['white_result'].isin(conditions))) |
+              ((df['black_username'] == player) & (df['black_result'].isin(conditions)))].copy()
+
+
+def legacy_slices(df, player):
+    """The previous pie chart slices: one Python call per game to pick a side, then one per game to label it."""
+    won_games = player_games_with(df, player, win_conditions)
+    won_games['reason'] = won_games.apply(
+        lambda row: row['black_result'] if row['white_username'] == player else row['white_result'], axis=1)
+    won = won_games['reason'].apply(lambda x: x if x in lose_conditions else 'other').value_counts(normalize=True) * 100
+
+    drawn_games = player_games_with(df, player, CHART_DRAW_CONDITIONS)
+    drawn_games['reason'] = drawn_games.apply(
+        lambda row: row['white_result'] if row['white_username'] == player else row['black_result'], axis=1)
+    drawn = drawn_games['reason'].apply(lambda x: x if x in CHART_DRAW_CONDITIONS else 'other').value_counts(normalize=True) * 100
+
+    lost_games = player_games_with(df, player, lose_conditions)
+    lost_games['reason'] = lost_games.apply(
+        lambda row: row['white_result'] if row['white_username'] == player else row['black_result'], axis=1)
+    lost = lost_games['reason'].apply(lambda x: x if x in lose_conditions else 'other').value_counts(normalize=True) * 100
+
+    return [as_slices(pie(won)), as_slices(pie(drawn)), as_slices(pie(lost))]
+
+
+def legacy_best_win(df, player):
+    """The previous best win: two row-wise applies for the opponent's rating and name."""
+    win_df = player_games_with(df, player, win_conditions)
+    win_df['opponent_rating'] = win_df.apply(
+        lambda row: row['black_rating'] if row['white_username'] == player else row['white_rating'], axis=1)
+    win_df['opponent_name'] = win_df.apply(
+        lambda row: row['black_username'] if row['white_username'] == player else row['white_username'], axis=1)
+    best_win = win_df.loc[win_df['opponent_rating'].idxmax()]
+    return best_win['opponent_name'].capitalize(), best_win['opponent_rating']
+
+
+def pie(counts):
+    return go.Figure(data=[go.Pie(labels=counts.index, values=counts, hole=0.5)])
+
+
+def as_slices(fig):
+    counts = pd.Series(fig.data[0].values, index=fig.data[0].labels)
+    return list(zip(map(str, counts.index), counts.round(6)))
+
+
+def legacy(df, player):
+    return legacy_slices(df, player), legacy_best_win(df, player)
+
+
+def current(games, player):
+    # Unwrapped builders: the figure cache would answer every repeat after the first
+    slices = [as_slices(chart.__wrapped__(games, player, 400, 300))
+              for chart in (player_win_chart, player_draw_chart, player_loss_chart)]
+    return slices, get_best_win(games, win_conditions)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--games', type=int, default=200_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    df = make_games(args.games, openings=400)
+    games = normalise_player_games(df, PLAYER)
+
+    legacy_time, legacy_result = best_of(args.repeat, legacy, df, PLAYER)
+    current_time, current_result = best_of(args.repeat, current, games, PLAYER)
+
+    assert current_result == legacy_result, "Vectorized charts must match the row-wise ones"
+
+    print(f"Games: {len(df):,}  (best of {args.repeat}, 3 pie charts + best win)")
+    print(f"Row-wise apply (previous): {legacy_time * 1000:8.1f} ms")
+    print(f"Vectorized:                {current_time * 1000:8.1f} ms   ({legacy_time / current_time:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+"""
+Benchmark: mask-per-number player stats vs the single-pass `compute_player_stats`.
+
+Builds a synthetic frame of games for one player and times the previous `display_player_stats`
+(one boolean mask over the whole frame for every count, plus three opening groupbys) against
+`compute_player_stats` on the player perspective table, and checks both return the same numbers.
+
+Usage:
+    python benchmarks/player_stats.py [--games 500000] [--openings 400] [--repeat 5]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.stats import compute_player_stats, draw_conditions, lose_conditions, normalise_player_games, win_conditions
+
+PLAYER = 'Hikaru'
+RESULTS = win_conditions + lose_conditions + draw_conditions
+
+
+def make_games(games, openings, seed=0):
+    rng = np.random.default_rng(seed)
+    is_white = rng.random(games) < 0.5
+    opponents = np.array([f'opponent{i}' for i in range(1000)])[rng.integers(0, 1000, games)]
+    player_result = np.array(RESULTS)[rng.integers(0, len(RESULTS), games)]
+    opponent_result = np.where(np.isin(player_result, win_conditions), 'resigned',
+                               np.where(np.isin(player_result, lose_conditions), 'win', player_result))
+    player_accuracy = np.where(rng.random(games) < 0.2, 0, rng.uniform(50, 99, games).round(2))
+    opponent_accuracy = np.where(rng.random(games) < 0.2, 0, rng.uniform(50, 99, games).round(2))
+
+    return pd.DataFrame({
+        'game_url': [f"https://www.chess.com/game/live/{i}" for i in range(games)],
+        'game_date': pd.Timestamp('2015-01-01') + pd.to_timedelta(rng.integers(0, 3650, games), unit='D'),
+        'game_time_control': '180',
+        'game_time_class': np.array(['rapid', 'blitz', 'bullet'])[rng.integers(0, 3, games)],
+        'game_variant': 'chess',
+        'opening': np.array([f'Opening-{i}' for i in range(openings)])[rng.integers(0, openings, games)],
+        'white_username': np.where(is_white, PLAYER, opponents),
+        'white_rating': rng.integers(2000, 3300, games),
+        'white_result': np.where(is_white, player_result, opponent_result),
+        'white_accuracy': np.where(is_white, player_accuracy, opponent_accuracy),
+        'black_username': np.where(is_white, opponents, PLAYER),
+        'black_rating': rng.integers(2000, 3300, games),
+        'black_result': np.where(is_white, opponent_result, player_result),
+        'black_accuracy': np.where(is_white, opponent_accuracy, player_accuracy),
+    })
+
+
+def get_openings_as(df, player, color):
+    """The previous per-colour opening ranking."""
+    df2 = df[(df[f'{color}_username'] == player)]
+    temp_df = df2.groupby(['opening']).agg({'game_variant': 'count', f'{color}_accuracy': 'mean'})
+    most_played_openings = list(temp_df.sort_values(by='game_variant', ascending=False).reset_index()['opening'])[:5]
+    most_accurate_openings = list(temp_df.sort_values(by=f'{color}_accuracy', ascending=False).reset_index()['opening'])[:5]
+    return most_played_openings, most_accurate_openings
+
+
+def display_player_stats(df, player):
+    """The previous implementation: a fresh boolean mask over the full frame for every number."""
+    df2 = df[(df['white_username'] == player) | (df['black_username'] == player)]
+
+    total_games = len(df[(df['white_username'] == player) | (df['black_username'] == player)])
+    opening_lines = len(df[(df['white_username'] == player) | (df['black_username'] == player)]['opening'].unique())
+    white_accuracy = round(df[(df['white_username'] == player) & (df['white_accuracy'] != 0)]['white_accuracy'].mean(), 2)
+    black_accuracy = round(df[(df['black_username'] == player) & (df['black_accuracy'] != 0)]['black_accuracy'].mean(), 2)
+
+    stats = {}
+    for color in ['white', 'black']:
+        wins = len(df[(df[f'{color}_username'] == player) & (df[f'{color}_result'].isin(win_conditions))])
+        losses = len(df[(df[f'{color}_username'] == player) & (df[f'{color}_result'].isin(lose_conditions))])
+        draws = len(df[(df[f'{color}_username'] == player) & (df[f'{color}_result'].isin(draw_conditions))])
+        total = len(df[(df[f'{color}_username'] == player)])
+        stats[color] = (wins, losses, draws, total,
+                        round((wins / total) * 100, 2), round((losses / total) * 100, 2), round((draws / total) * 100, 2))
+
+    df2.groupby(['opening']).agg({'game_variant': 'count', 'white_accuracy': 'mean'})
+
+    return (total_games, white_accuracy, black_accuracy, *stats['white'], *stats['black'], opening_lines,
+            *get_openings_as(df, player, 'white'), *get_openings_as(df, player, 'black'))
+
+
+def as_tuple(stats):
+    white, black = stats.white, stats.black
+    return (stats.total_games, white.accuracy, black.accuracy,
+            white.wins, white.losses, white.draws, white.total_games, white.win_ratio, white.loss_ratio, white.draw_ratio,
+            black.wins, black.losses, black.draws, black.total_games, black.win_ratio, black.loss_ratio, black.draw_ratio,
+            stats.opening_lines, white.most_played_openings, white.most_accurate_openings,
+            black.most_played_openings, black.most_accurate_openings)
+
+
+def best_of(repeat, func, *args):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--games', type=int, default=500_000)
+    parser.add_argument('--openings', type=int, default=400)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    df = make_games(args.games, args.openings)
+
+    legacy_time, legacy = best_of(args.repeat, display_player_stats, df, PLAYER)
+    normalise_time, games = best_of(args.repeat, normalise_player_games, df, PLAYER)
+    engine_time, stats = best_of(args.repeat, compute_player_stats, games)
+
+    assert as_tuple(stats) == legacy, "compute_player_stats must match the previous stats"
+
+    print(f"Games: {len(df):,}  (best of {args.repeat})")
+    print(f"Mask per number (previous):      {legacy_time * 1000:8.1f} ms")
+    print(f"compute_player_stats:            {engine_time * 1000:8.1f} ms   ({legacy_time / engine_time:.1f}x)")
+    print(f"  + normalise_player_games once: {(normalise_time + engine_time) * 1000:8.1f} ms   "
+          f"({legacy_time / (normalise_time + engine_time):.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark: JSON payload of the rating chart with every daily point vs LTTB downsampled.
+
+Builds the All Time rating chart of a player with a decade of daily games once with every point
+(the previous behaviour) and once capped at RATING_CHART_POINTS_PER_PIXEL points per pixel of chart
+width, and reports the bytes Streamlit sends to the browser (the figure's JSON) for both. Checks that
+the curve's extremes and the "Highest Rating" annotation are kept.
+
+Usage:
+    python benchmarks/rating_chart_payload.py [--games 500000] [--width 800]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from player_stats import PLAYER, make_games
+from utils import charts
+from utils.charts import create_rating_chart
+from utils.stats import build_rating_series, normalise_player_games
+
+
+def chart_payload(rating_series, width):
+    fig = create_rating_chart(rating_series, PLAYER, PLAYER, {}, width, 400, 'All Time')
+    start = time.perf_counter()
+    payload = fig.to_json()
+    return fig, len(payload.encode()), time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--games', type=int, default=500_000)
+    parser.add_argument('--width', type=int, default=800)
+    args = parser.parse_args()
+
+    rating_series = build_rating_series(normalise_player_games(make_games(args.games, openings=400), PLAYER))
+
+    points_per_pixel = charts.RATING_CHART_POINTS_PER_PIXEL
+    charts.RATING_CHART_POINTS_PER_PIXEL = len(rating_series)  # No cap
+    full, full_bytes, full_time = chart_payload(rating_series, args.width)
+    charts.RATING_CHART_POINTS_PER_PIXEL = points_per_pixel
+    sampled, sampled_bytes, sampled_time = chart_payload(rating_series, args.width)
+
+    full_y, sampled_y = full.data[0].y, sampled.data[0].y
+    assert (max(sampled_y), min(sampled_y)) == (max(full_y), min(full_y)), "The curve's extremes must be kept"
+    assert sampled.layout.annotations[0].text == full.layout.annotations[0].text, "The highest rating must be kept"
+
+    kb = 1024
+    print(f"Playing days: {len(rating_series):,}  Chart width: {args.width}px")
+    print(f"Every daily point (previous): {len(full_y):6,} points  {full_bytes / kb:8.1f} KB   to_json {full_time * 1000:6.1f} ms")
+    print(f"LTTB downsampled:             {len(sampled_y):6,} points  {sampled_bytes / kb:8.1f} KB   to_json {sampled_time * 1000:6.1f} ms   "
+          f"({full_bytes / sampled_bytes:.1f}x smaller)")
+
+
+if __name__ == '__main__':
+    main()
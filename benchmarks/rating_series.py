@@ -0,0 +1,71 @@
+"""
+Benchmark: rebuilding the daily rating series for every rating tab vs slicing a precomputed one.
+
+Times the previous data preparation of `render_rating_chart_with_tabs` (each of the three tabs converted
+every game date, took the daily maximum and smoothed it from scratch) against building the series once
+with `build_rating_series` and slicing it per tab, and checks the All Time curves match.
+
+Usage:
+    python benchmarks/rating_series.py [--games 500000] [--repeat 5]
+"""
+import argparse
+import os
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from player_stats import PLAYER, best_of, make_games
+from utils.stats import build_rating_series, filter_data_by_time_period, normalise_player_games
+
+TIME_PERIODS = ['Last 1 Year', 'Last 3 Years', 'All Time']
+
+
+def legacy_tab(games, time_period):
+    """The previous per-tab preparation in create_rating_chart."""
+    filtered_df = games[['game_date', 'my_rating']].rename(columns={'my_rating': 'rating'})
+    filtered_df['game_date'] = pd.to_datetime(filtered_df['game_date'])
+    filtered_df = filter_data_by_time_period(filtered_df, time_period)
+    max_rating_per_day = filtered_df.groupby('game_date')['rating'].max().reset_index()
+    max_rating_per_day['smoothed_rating'] = max_rating_per_day['rating'].rolling(window=12).mean()
+    return max_rating_per_day.dropna(subset=['smoothed_rating'])
+
+
+def legacy(games):
+    return [legacy_tab(games, time_period) for time_period in TIME_PERIODS]
+
+
+def slice_tabs(rating_series):
+    return [filter_data_by_time_period(rating_series[['game_date', 'rating', 'smoothed_rating']], time_period)
+            .dropna(subset=['smoothed_rating']) for time_period in TIME_PERIODS]
+
+
+def current(games):
+    return slice_tabs(build_rating_series(games))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--games', type=int, default=500_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    games = normalise_player_games(make_games(args.games, openings=400), PLAYER)
+    games['game_date'] = games['game_date'].dt.strftime('%Y.%m.%d')  # As stored by the live extraction
+
+    legacy_time, legacy_result = best_of(args.repeat, legacy, games)
+    current_time, current_result = best_of(args.repeat, current, games)
+    rating_series = build_rating_series(games)
+    slice_time, _ = best_of(args.repeat, slice_tabs, rating_series)
+
+    pd.testing.assert_frame_equal(current_result[-1].reset_index(drop=True), legacy_result[-1].reset_index(drop=True))
+
+    print(f"Games: {len(games):,}  Playing days: {len(rating_series):,}  (best of {args.repeat}, 3 tabs)")
+    print(f"Rebuilt per tab (previous):    {legacy_time * 1000:8.1f} ms")
+    print(f"Built once + 3 slices:         {current_time * 1000:8.1f} ms   ({legacy_time / current_time:.1f}x)")
+    print(f"  3 slices of a cached series: {slice_time * 1000:8.1f} ms   ({legacy_time / slice_time:.0f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+"""
+Benchmark: cold-start import time of main.py with every page imported up front vs pages loaded on selection.
+
+Runs each import set in a fresh interpreter under `python -X importtime` and sums the cumulative time of
+the top-level imports. "Every page" is what main.py used to import before drawing the menu; "main.py"
+is what it imports now; each page row is the extra cost paid the first time that page is selected.
+
+Usage:
+    python benchmarks/startup_time.py [--repeat 5] [--baseline REV]
+
+With --baseline, the "every page" set is also timed on a git revision of the tree (e.g. the commit before
+utils/functions.py was split), extracted to a temporary directory with `git archive`.
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+import tarfile
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MAIN_IMPORTS = ['streamlit', 'streamlit_option_menu']
+PAGES = {
+    'Top Jr Players': 'templates.jr',
+    'Top Sr Players': 'templates.sr',
+    'Player Wiki': 'templates.player_info',
+    'Live Stats': 'templates.live',
+    'About Project': 'templates.about_project',
+}
+IMPORT_TIME = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)')
+
+
+def import_time(modules, cwd, preloaded=()):
+    """Cumulative microseconds of the top-level imports of `modules`, after importing `preloaded` untimed."""
+    # Mark where the preloaded imports end so only the timed ones are counted
+    code = ''.join(f'import {module}\n' for module in preloaded)
+    code += "import sys\nprint('--timed--', file=sys.stderr)\n"
+    code += ''.join(f'import {module}\n' for module in modules)
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=cwd,
+                            capture_output=True, text=True, env={**os.environ, 'PYTHONDONTWRITEBYTECODE': '1'})
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+    lines = result.stderr.splitlines()
+    lines = lines[lines.index('--timed--') + 1:]
+
+    total = 0
+    for line in lines:
+        match = IMPORT_TIME.match(line)
+        # Only top-level entries; nested ones are already part of their parent's cumulative time
+        if match and not match.group(3):
+            total += int(match.group(2))
+    return total
+
+
+def best_of(repeat, modules, cwd, preloaded=()):
+    return min(import_time(modules, cwd, preloaded) for _ in range(repeat))
+
+
+def extract_revision(revision, directory):
+    archive = subprocess.run(['git', 'archive', '--format=tar', revision], cwd=ROOT, capture_output=True, check=True)
+    path = os.path.join(directory, 'tree.tar')
+    with open(path, 'wb') as f:
+        f.write(archive.stdout)
+    with tarfile.open(path) as tar:
+        tar.extractall(directory, filter='data')
+    return directory
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--baseline', default=None, help='Git revision to time the previous main.py imports on.')
+    args = parser.parse_args()
+
+    every_page = MAIN_IMPORTS + list(PAGES.values())
+    ms = 1000
+
+    rows = []
+    if args.baseline:
+        with tempfile.TemporaryDirectory() as directory:
+            rows.append((f'Every page ({args.baseline})', best_of(args.repeat, every_page, extract_revision(args.baseline, directory))))
+    rows.append(('Every page (this tree)', best_of(args.repeat, every_page, ROOT)))
+    main_time = best_of(args.repeat, MAIN_IMPORTS, ROOT)
+    rows.append(('main.py, no page yet', main_time))
+
+    print(f"Cold-start imports, best of {args.repeat} (python -X importtime, cumulative)")
+    for label, total in rows:
+        print(f"  {label:<28} {total / ms:8.1f} ms")
+
+    print("First selection of each page, on top of main.py")
+    for name, module in PAGES.items():
+        extra = best_of(args.repeat, [module], ROOT, preloaded=MAIN_IMPORTS)
+        print(f"  {name:<28} {extra / ms:8.1f} ms   (cold start to page: {(main_time + extra) / ms:.1f} ms)")
+
+
+if __name__ == '__main__':
+    main()
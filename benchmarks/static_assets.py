@@ -0,0 +1,71 @@
+"""
+Benchmark: bytes a page rerun sends for its background image and icons, inline base64 vs static files.
+
+The player pages used to splice `assets/pawn_moving.png` into the CSS as a base64 data URI and
+embed the win/draw/loss and bullet icons the same way, so every rerun re-sent them over the websocket.
+They now reference hashed copies served by Streamlit's static file serving (see `get_static_asset_url`).
+Reports the per-rerun bytes of the CSS and icon markup for both and how long preparing them takes.
+
+Usage:
+    python benchmarks/static_assets.py [--reruns 1000]
+"""
+import argparse
+import base64
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import assets
+from utils.assets import get_static_asset_url, load_css
+
+BACKGROUND = 'assets/pawn_moving.png'
+ICONS = ['assets/win3.png', 'assets/draw2.png', 'assets/loss2.png', 'assets/bullet3.png']  # Embedded in a player page
+
+
+def data_uri(path, mime='image/png'):
+    with open(path, 'rb') as f:
+        return f"data:{mime};base64,{base64.b64encode(f.read()).decode()}"
+
+
+def inline_rerun():
+    """The previous markup: CSS read and templated with the base64 background, icons encoded, on every rerun."""
+    with open('static/styles.css') as f:
+        css = f.read().replace('{{background_image_url}}', data_uri(BACKGROUND, 'image/jpg'))
+    return f"<style>{css}</style>", [data_uri(icon) for icon in ICONS]
+
+
+def static_rerun():
+    return load_css('static/styles.css', get_static_asset_url(BACKGROUND)), [get_static_asset_url(icon) for icon in ICONS]
+
+
+def timed(func, reruns):
+    start = time.perf_counter()
+    for _ in range(reruns):
+        css, icons = func()
+    return (time.perf_counter() - start) / reruns, len(css.encode()) + sum(len(icon.encode()) for icon in icons)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--reruns', type=int, default=1000)
+    args = parser.parse_args()
+
+    os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # Asset paths are relative to the app
+
+    with tempfile.TemporaryDirectory() as build_dir:
+        assets.STATIC_BUILD_DIR = build_dir  # Keep the hashed copies out of the working tree
+        inline_time, inline_bytes = timed(inline_rerun, args.reruns)
+        static_time, static_bytes = timed(static_rerun, args.reruns)
+
+    kb = 1024
+    print(f"Per rerun of a player page (CSS + {len(ICONS)} icons):")
+    print(f"Inline base64 (previous): {inline_bytes / kb:8.1f} KB   {inline_time * 1e6:8.1f} us to prepare")
+    print(f"Static files:             {static_bytes / kb:8.1f} KB   {static_time * 1e6:8.1f} us to prepare")
+    print(f"Saved per rerun:          {(inline_bytes - static_bytes) / kb:8.1f} KB   ({inline_bytes / static_bytes:.0f}x less)")
+
+
+if __name__ == '__main__':
+    main()
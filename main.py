@@ -1,22 +1,25 @@
+import importlib
+import os
+
 import streamlit as st
 from streamlit_option_menu import option_menu
 
-# Import the functions from the other files
-from templates.jr import show_junior_players
-from templates.sr import show_senior_players
-from templates.player_info import show_player_info
-from templates.live import show_live_players
-from templates.about_project import about_project
-
 st.set_page_config(layout="wide")
 
-# Define a dictionary to map the menu options to functions
+# Refresh the tracked players' stored games in the background of the app process (needs the games database,
+# see utils/db.py). Off by default; `python refresh.py --loop` does the same from a separate process.
+if os.environ.get('REFRESH_IN_APP') == '1':
+    from utils.refresh import start_refresh_scheduler
+    start_refresh_scheduler()
+
+# Define a dictionary to map the menu options to the page module and function that renders them.
+# Pages are imported only when selected so a cold start doesn't pay for every page's dependencies.
 page_content = {
-    'Top Sr Players': show_senior_players,
-    'Top Jr Players': show_junior_players,
-    'Player Wiki': show_player_info,
-    'About Project': about_project,
-    'Live Stats': show_live_players
+    'Top Sr Players': ('templates.sr', 'show_senior_players'),
+    'Top Jr Players': ('templates.jr', 'show_junior_players'),
+    'Player Wiki': ('templates.player_info', 'show_player_info'),
+    'About Project': ('templates.about_project', 'about_project'),
+    'Live Stats': ('templates.live', 'show_live_players')
 }
 
 # Create the option menu
@@ -27,7 +30,8 @@ selected_page = option_menu(menu_title=None,
 
 # Display the content based on the selected option
 if selected_page in page_content:
-    page_content[selected_page]()
+    module_name, function_name = page_content[selected_page]
+    getattr(importlib.import_module(module_name), function_name)()
 
 
 
@@ -0,0 +1,64 @@
+"""
+Refreshes the tracked players' games in the database (see `run_due_refreshes`).
+
+Usage:
+    python refresh.py [--all] [--full] [--workers 3] [--limit N]
+    python refresh.py --loop [--poll 300]
+    python refresh.py --track USERNAME [USERNAME ...]
+    python refresh.py --cache-stats
+
+Without --all only the players that are due are refreshed; --loop keeps checking every --poll seconds.
+--track adds players to the refresh jobs (due right away); --cache-stats prints the counters of the
+Live Stats player cache instead.
+"""
+import argparse
+import sys
+
+from utils.player_cache import get_player_cache_stats
+from utils.refresh import REFRESH_MAX_WORKERS, REFRESH_POLL_INTERVAL, RefreshScheduler, run_due_refreshes, track_player
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--all', action='store_true', help='Refresh every tracked player, due or not.')
+    parser.add_argument('--full', action='store_true', help='Download the whole history instead of the new months.')
+    parser.add_argument('--workers', type=int, default=REFRESH_MAX_WORKERS, help='Players refreshed at the same time.')
+    parser.add_argument('--limit', type=int, default=None, help='Maximum number of players refreshed in this run.')
+    parser.add_argument('--loop', action='store_true', help='Keep refreshing due players until interrupted.')
+    parser.add_argument('--poll', type=float, default=REFRESH_POLL_INTERVAL, help='Seconds between checks with --loop.')
+    parser.add_argument('--track', nargs='+', metavar='USERNAME', help='Start refreshing these players and exit.')
+    parser.add_argument('--cache-stats', action='store_true', help='Print the player cache counters and exit.')
+    args = parser.parse_args()
+
+    if args.cache_stats:
+        stats = get_player_cache_stats()
+        print(f"Player cache: {stats['entries']} player(s), {stats['bytes'] / (1024 * 1024):.1f} MB")
+        print(f"  hits {stats['hits']}, misses {stats['misses']}, expirations {stats['expirations']}, "
+              f"evictions {stats['evictions']}")
+        return 0
+
+    if args.track:
+        for player in args.track:
+            track_player(player.lower())
+        print(f"Tracking {len(args.track)} player(s): {args.track}")
+        return 0
+
+    if args.loop:
+        scheduler = RefreshScheduler(poll_interval=args.poll, max_workers=args.workers)
+        try:
+            scheduler.run_forever()
+        except KeyboardInterrupt:
+            scheduler.stop()
+        return 0
+
+    results = run_due_refreshes(args.workers, args.limit, incremental=not args.full, refresh_all=args.all)
+    failed = {player: error for player, error in results.items() if error is not None}
+
+    print(f"Refreshed {len(results) - len(failed)} of {len(results)} player(s).")
+    for player, error in failed.items():
+        print(f"  {player}: {error}")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
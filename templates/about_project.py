@@ -1,5 +1,6 @@
 import streamlit as st
-from utils.functions import *
+
+from utils.assets import get_static_asset_url, render_svg
 
 
 def about_project():
@@ -38,14 +39,14 @@ def about_project():
     # Path to your local image
     image_path = "assets/plain_dark.png"  
 
-    # Get the base64 encoded image
-    image_base64 = get_base64_image(image_path)
+    # Get the static URL of the background image
+    image_url = get_static_asset_url(image_path)
 
     # Create the CSS to display the background image
     background_css = f"""
     <style>
         .stApp {{
-            background-image: url("data:image/jpg;base64,{image_base64}");
+            background-image: url("{image_url}");
             background-size: cover;
             background-repeat: no-repeat;
             background-attachment: fixed;
@@ -1,19 +1,35 @@
 import pandas as pd
 import streamlit as st
-import time
 
-from utils.functions import *
+from utils.assets import get_static_asset_url, load_css
+from utils.charts import player_draw_chart, player_loss_chart, player_win_chart, render_rating_chart_with_tabs
+from utils.display import show_black_stats, show_white_stats
+from utils.fetch import FetchProgress, load_player_profile
+from utils.player_cache import LIVE_RECENT_ARCHIVES, get_history_backfill_status, load_data_progressively
+from utils.refresh import record_player_view
+from utils.stats import (calculate_avg_opponent_rating, compute_player_stats, get_best_win, get_game_class_rating,
+                         get_player_games)
+
+
+# Reruns the page once the background download of the player's full history has finished
+@st.fragment(run_every=2)
+def wait_for_history(player: str) -> None:
+    status = get_history_backfill_status(player)
+    if status == 'done':
+        st.rerun()
+    elif status == 'failed':
+        st.warning("Could not load the full history. Press 'Extract Player Info' to try again.")
 
 
 def show_live_players():
 
     # Path to your local image
     image_path = "assets/pawn_moving.png"  
-    # Get the base64 encoded image
-    image_base64 = get_base64_image(image_path)
+    # Get the static URL of the background image
+    image_url = get_static_asset_url(image_path)
 
     # Load and inject the CSS
-    css = load_css("static/styles.css", image_base64)
+    css = load_css("static/styles.css", image_url)
     st.markdown(css, unsafe_allow_html=True)
 
     players_dict = {
@@ -25,8 +41,6 @@ def show_live_players():
     }
 
     win_conditions =  ['win']
-    lose_conditions = ['resigned', 'checkmated', 'timeout', 'abandoned']
-    draw_conditions = ['agreed', 'stalemate', '50move','repetition','timevsinsufficient','insufficient']
 
     selected_player = st.text_input(label='Enter Chess.com Username: ') # Make Sure playername is not in lowercase !!!! Very Very Important
     st.session_state.selected_player = selected_player
@@ -40,39 +54,26 @@ def show_live_players():
     if st.button('Extract Player Info'):
         st.session_state.button_pressed = True  # Store button press in session state
 
-    # Run the data extraction and display logic only if the button was pressed
-    if st.session_state.button_pressed:
+    # Run the data extraction and display logic only if the button was pressed (or the player's full history just arrived)
+    if st.session_state.button_pressed or st.session_state.get('backfilling_player') == selected_player:
 
         # Initialize progress bar and status text outside the if-else block
         progress_bar = st.progress(0)
         status_text = st.empty()
 
         # Run the data extraction and display logic only if the button was pressed
-        if st.session_state.button_pressed:
+        if st.session_state.button_pressed or st.session_state.get('backfilling_player') == selected_player:
 
-            # Slow loading animation for live data extraction
-            status_text.text("Loading player data... 0%")
+            status_text.text("Loading player data...")
 
-            # Simulate loading from 0% to 40%
-            for i in range(0, 41):  
-                time.sleep(0.05)
-                progress_bar.progress(i / 100)
-                status_text.text(f"Loading player data... {i}%")
-                
-            # Load live data (e.g., call your live extraction function)
-            df = get_player_stats(selected_player)
+            # Progress comes from the archive download itself (only called when the games are not cached)
+            def show_fetch_progress(progress: FetchProgress) -> None:
+                progress_bar.progress(progress.fraction)
+                status_text.text(f"Loading player data... {progress.archives_done}/{progress.archives_total} monthly archives, "
+                                 f"{progress.bytes_downloaded / (1024 * 1024):.1f} MB downloaded, {progress.games_parsed:,} games parsed")
 
-            # Increment progress to 70%
-            for i in range(41, 71):  
-                time.sleep(0.3)
-                progress_bar.progress(i / 100)
-                status_text.text(f"Loading player data... {i}%")
-
-            # Finish progress from 70% to 100%
-            for i in range(71, 101):  
-                time.sleep(0.05)
-                progress_bar.progress(i / 100)
-                status_text.text(f"Loading player data... {i}%")
+            # Load live data: the cached full history, or the most recent months while the rest loads in the background
+            df, complete = load_data_progressively(selected_player, on_progress=show_fetch_progress)
 
             # Once loading is complete, display the data
             status_text.text("Loading complete!")
@@ -81,6 +82,14 @@ def show_live_players():
             progress_bar.empty()
             status_text.empty()
 
+            if complete:
+                st.session_state.backfilling_player = None
+            else:
+                st.session_state.backfilling_player = selected_player
+                st.info(f"Showing games from the last {LIVE_RECENT_ARCHIVES} months. "
+                        "The full history is loading in the background and the page will update once it is complete.")
+                wait_for_history(selected_player)
+
 
         # if selected_player in get_all_players():
 
@@ -132,7 +141,12 @@ def show_live_players():
         # Reset button state
         st.session_state.button_pressed = False
 
-        temp_df = df[((df['white_username'] == st.session_state.selected_player) | (df['black_username'] == st.session_state.selected_player))]
+        # The selected player's games seen from their side (color, my_/opp_ columns, outcome)
+        games = get_player_games(df, selected_player)
+        temp_df = games
+
+        # Tracked players that are viewed get refreshed first (recorded in the background)
+        record_player_view(selected_player)
 
         # Debugging: Check filtering logic and resulting DataFrame
         
@@ -141,32 +155,30 @@ def show_live_players():
 
         # Proceed with win/loss/draw filtering if temp_df is not empty
         if not temp_df.empty:
-            win_df = temp_df[((temp_df['white_username'] == selected_player) & (temp_df['white_result'].isin(win_conditions))) |
-                            ((temp_df['black_username'] == selected_player) & (temp_df['black_result'].isin(win_conditions)))]
-
-            draw_df = temp_df[((temp_df['white_username'] == selected_player) & (temp_df['white_result'].isin(draw_conditions))) |
-                            ((temp_df['black_username'] == selected_player) & (temp_df['black_result'].isin(draw_conditions)))]
-
-            loss_df = temp_df[((temp_df['white_username'] == selected_player) & (temp_df['white_result'].isin(lose_conditions))) |
-                            ((temp_df['black_username'] == selected_player) & (temp_df['black_result'].isin(lose_conditions)))]
+            win_df = temp_df[temp_df['outcome'] == 'win']
+            draw_df = temp_df[temp_df['outcome'] == 'draw']
+            loss_df = temp_df[temp_df['outcome'] == 'loss']
 
             # Display player stats (only if temp_df is not empty)
-        (total_games, white_accuracy, black_accuracy,
-        wins_as_white, loss_as_white, draws_as_white, total_games_white, white_win_ratio, white_loss_ratio, white_draw_ratio,
-        wins_as_black, loss_as_black, draws_as_black, total_games_black, black_win_ratio, black_loss_ratio, black_draw_ratio,
-        opening_lines,white_most_played_openings, white_most_accurate_openings, black_most_played_openings, black_most_accurate_openings) = display_player_stats(temp_df, selected_player)
+        stats = compute_player_stats(temp_df)
+
+        # One (cached) profile request per render
+        profile = load_player_profile(selected_player)
+        if profile is None:
+            st.error(f"Could not load the Chess.com profile of {selected_player}.")
+            return
 
         with st.container():
-            avatar_url_main = get_player_info(selected_player)['Avatar'][0]
-            title = get_player_info(selected_player)['Title'][0] #if selected_player in players_dict.values() else ''
-            name = get_player_info(selected_player)['Name'][0]
-            username = get_player_info(selected_player)['Username'][0]
-            country_code = get_player_info(selected_player)['Country'][0].split('country/')[1]
-            location = get_player_info(selected_player)['Location'][0]
-            last_online = pd.to_datetime(get_player_info(selected_player)['Last Online'][0], unit='s').strftime('%b %d, %Y')
-            joined = pd.to_datetime(get_player_info(selected_player)['Joined'][0],  unit='s').strftime('%b %d, %Y')
-            followers = get_player_info(selected_player)['Followers'][0]
-            is_streamer = get_player_info(selected_player)['Verified'][0]
+            avatar_url_main = profile.avatar
+            title = profile.title #if selected_player in players_dict.values() else ''
+            name = profile.name
+            username = profile.username
+            country_code = profile.country_code
+            location = profile.location
+            last_online = pd.to_datetime(profile.last_online, unit='s').strftime('%b %d, %Y')
+            joined = pd.to_datetime(profile.joined,  unit='s').strftime('%b %d, %Y')
+            followers = profile.followers
+            is_streamer = profile.verified
             is_diomand = '💎' if selected_player in players_dict.values() else ''
 
             # bg_color = '#9c4418' if selected_player in players_dict.values() else '#2b2b4b'
@@ -221,30 +233,30 @@ def show_live_players():
             <div class="metrics-row">
                 <div class="metric-container">
                     <div class="metric-label">Total Games <br> </div>
-                    <div class="metric-value">{total_games}</div>
+                    <div class="metric-value">{stats.total_games}</div>
                 </div>
                 <div class="metric-container">
                     <div class="metric-label">Avg Accuracy as White <br> </div>
-                    <div class="metric-value"> {white_accuracy:.2f}%</div>
+                    <div class="metric-value"> {stats.white.accuracy:.2f}%</div>
                 </div>
                 <div class="metric-container">
                     <div class="metric-label">Avg Accuracy as Black <br> </div>
-                    <div class="metric-value">{black_accuracy:.2f}%</div>
+                    <div class="metric-value">{stats.black.accuracy:.2f}%</div>
                 </div>
             </div>
         """, unsafe_allow_html=True)
                     
 
-        avg_rating = calculate_avg_opponent_rating(temp_df, st.session_state.selected_player)
-        best_opponent_name, best_opponent_rating = get_best_win(df, st.session_state.selected_player, win_conditions)
+        avg_rating = calculate_avg_opponent_rating(temp_df)
+        best_opponent_name, best_opponent_rating = get_best_win(games, win_conditions)
 
-        avg_rating_win = calculate_avg_opponent_rating(win_df, st.session_state.selected_player)
-        avg_rating_draw = calculate_avg_opponent_rating(draw_df, st.session_state.selected_player)
-        avg_rating_loss = calculate_avg_opponent_rating(loss_df, st.session_state.selected_player)
+        avg_rating_win = calculate_avg_opponent_rating(win_df)
+        avg_rating_draw = calculate_avg_opponent_rating(draw_df)
+        avg_rating_loss = calculate_avg_opponent_rating(loss_df)
 
-        win_png = load_image("assets/win3.png")  
-        draw_png = load_image("assets/draw2.png")  
-        loss_png = load_image("assets/loss2.png") 
+        win_png = get_static_asset_url("assets/win3.png")  
+        draw_png = get_static_asset_url("assets/draw2.png")  
+        loss_png = get_static_asset_url("assets/loss2.png") 
 
         st.markdown(f"""
             <div class="metrics-row">
@@ -261,13 +273,13 @@ def show_live_players():
                     <div class="metric-label-spec">Avg Opponent Rating <br> when player...</div>
                     <div class="metric-value-spec">
                         <span class="value-win">
-                            <img src="data:image/png;base64,{win_png}" width="18" height="18"/> {round(avg_rating_win)}
+                            <img src="{win_png}" width="18" height="18"/> {round(avg_rating_win)}
                         </span>
                         <span class="value-draw">
-                            <img src="data:image/png;base64,{draw_png}" width="18" height="18"/> {round(avg_rating_draw)}
+                            <img src="{draw_png}" width="18" height="18"/> {round(avg_rating_draw)}
                         </span>
                         <span class="value-loss">
-                            <img src="data:image/png;base64,{loss_png}" width="18" height="18"/> {round(avg_rating_loss)}
+                            <img src="{loss_png}" width="18" height="18"/> {round(avg_rating_loss)}
                         </span>
                     </div>
                 </div>
@@ -276,32 +288,30 @@ def show_live_players():
 
         #     # https://discuss.streamlit.io/t/display-svg/172/5 --> code reference.
             
-        rapid_img = load_image('assets/stopwatch.png')
-        blitz_img = load_image('assets/flash.png')
-        bullet_img = load_image("assets/bullet3.png")
+        bullet_img = get_static_asset_url("assets/bullet3.png")
 
-        rapid_rating = get_game_class_rating(df, selected_player, 'rapid')
-        blitz_rating = get_game_class_rating(df, selected_player, 'blitz')
-        bullet_rating = get_game_class_rating(df, selected_player, 'bullet')
+        rapid_rating = get_game_class_rating(games, 'rapid')
+        blitz_rating = get_game_class_rating(games, 'blitz')
+        bullet_rating = get_game_class_rating(games, 'bullet')
 
         st.markdown(f"""
             <div class="metrics-row">
                 <div class="metric-container">
                     <i class = "bi bi-stopwatch-fill" style="font-size:1rem; color:#69923E;"></i>
                     <div class="metric-label">Best Rapid Rating <br> </div>
-                    <div class="metric-value">{get_game_class_rating(df, selected_player, 'rapid')}</div>
+                    <div class="metric-value">{rapid_rating}</div>
                 </div>
                 <div class="metric-container">
                     <i class = "bi bi-lightning-fill" style="font-size:1rem; color:yellow;"></i>
                     <div class="metric-label">Best Blitz Rating <br> </div>
-                    <div class="metric-value">{get_game_class_rating(df, selected_player, 'blitz')}</div>
+                    <div class="metric-value">{blitz_rating}</div>
                 </div>
                 <div class="metric-container">
                     <div class="metric-icon" style="margin-right: 10px;">
-                        <img src="data:image/png;base64,{bullet_img}" style="width: 16px; height: 16px; margin-left: 10px;">
+                        <img src="{bullet_img}" style="width: 16px; height: 16px; margin-left: 10px;">
                     </div>
                     <div class="metric-label">Best Bullet Rating <br> </div>
-                    <div class="metric-value">{get_game_class_rating(df, selected_player, 'bullet')}</div>
+                    <div class="metric-value">{bullet_rating}</div>
                 </div>
             </div>
         """, unsafe_allow_html=True)
@@ -314,19 +324,19 @@ def show_live_players():
             col1, col2, col3 = st.container(), st.container(), st.container()
 
         with col1:
-            st.plotly_chart(player_win_chart(df, selected_player, 400, 300), config={'displayModeBar': False}, use_container_width=True)    
+            st.plotly_chart(player_win_chart(games, selected_player, 400, 300), config={'displayModeBar': False}, use_container_width=True)    
             image_path = 'assets/Pie Chart Legend (1).png'
             st.write('')
             st.image(image = image_path, use_column_width=True)    
 
         with col2:
-            st.plotly_chart(player_draw_chart(df, selected_player, 400, 300),  config={'displayModeBar': False}, use_container_width=True)
+            st.plotly_chart(player_draw_chart(games, selected_player, 400, 300),  config={'displayModeBar': False}, use_container_width=True)
             image_path = 'assets/New Draw Pie Chart Legend (1).png'
             st.write('')
             st.image(image = image_path, use_column_width=True)
 
         with col3:
-            st.plotly_chart(player_loss_chart(df, selected_player, 400 , 300),  config={'displayModeBar': False}, use_container_width=True)
+            st.plotly_chart(player_loss_chart(games, selected_player, 400 , 300),  config={'displayModeBar': False}, use_container_width=True)
             image_path = 'assets/Lose Pie Chart Legend.png'
             st.write('')
             st.image(image = image_path, use_column_width=True)  
@@ -341,16 +351,16 @@ def show_live_players():
             st.session_state.tab_selected = 'white'
 
             #Show Player as White Stats:
-            show_white_stats(total_games_white, white_win_ratio, white_draw_ratio, white_loss_ratio, wins_as_white, draws_as_white, loss_as_white,
-                            white_most_accurate_openings, white_most_played_openings)
+            show_white_stats(stats.white.total_games, stats.white.win_ratio, stats.white.draw_ratio, stats.white.loss_ratio, stats.white.wins, stats.white.draws, stats.white.losses,
+                            stats.white.most_accurate_openings, stats.white.most_played_openings)
 
 
         with tab_black:
             st.session_state.tab_selected = 'black'
 
             #Show Player as Black Stats:
-            show_black_stats(total_games_black, black_win_ratio, black_draw_ratio, black_loss_ratio, wins_as_black, draws_as_black, loss_as_black, 
-                            black_most_accurate_openings, black_most_played_openings)
+            show_black_stats(stats.black.total_games, stats.black.win_ratio, stats.black.draw_ratio, stats.black.loss_ratio, stats.black.wins, stats.black.draws, stats.black.losses, 
+                            stats.black.most_accurate_openings, stats.black.most_played_openings)
 
-        render_rating_chart_with_tabs(df, selected_playername=selected_player, selected_player=selected_player, players_dict=players_dict, width=1180, height=400)
+        render_rating_chart_with_tabs(games, selected_playername=selected_player, selected_player=selected_player, players_dict=players_dict, width=1180, height=400)
         st.caption("Note: The rating curve shown is smoothed using a rolling average to provide a clearer trend. The highest rating annotation reflects the actual unsmoothed rating.")
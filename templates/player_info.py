@@ -1,5 +1,7 @@
-from utils.functions import *
-from streamlit_lottie import st_lottie
+import streamlit as st
+
+from utils.assets import get_static_asset_url, load_css
+from utils.wiki import extract_all_sections_with_summary, format_with_bullets
 
 
 def show_player_info():
@@ -7,11 +9,11 @@ def show_player_info():
     # Path to your local image
     image_path = "assets/pawn_moving.png"  
 
-    # Get the base64 encoded image
-    image_base64 = get_base64_image(image_path)
+    # Get the static URL of the background image
+    image_url = get_static_asset_url(image_path)
 
     # Load and inject the CSS
-    css = load_css("static/styles.css", image_base64)
+    css = load_css("static/styles.css", image_url)
     st.markdown(css, unsafe_allow_html=True)
 
     player_name = st.text_input("Enter Player Name", "Hikaru Nakamura")
@@ -1,22 +1,26 @@
 import pandas as pd
 import streamlit as st
 
-from utils.functions import *
+from utils.assets import get_static_asset_url, load_css
+from utils.charts import player_draw_chart, player_loss_chart, player_win_chart, render_rating_chart_with_tabs
+from utils.display import get_player_avatar, show_black_stats, show_white_stats
+from utils.fetch import get_country_code
+from utils.stats import (calculate_avg_opponent_rating, compute_player_stats, get_best_win, get_game_class_rating,
+                         get_player_games)
+from utils.store import PAGE_GAME_COLUMNS, PAGE_PERIODS, sr_player_data
 
 def show_senior_players():
 
     # Load and inject CSS into the Streamlit app
 
-    # Get the base64-encoded image
+    # Get the static URL of the background image
     image_path = "assets/pawn_moving.png"
-    image_base64 = get_base64_image(image_path)
+    image_url = get_static_asset_url(image_path)
 
     # Load and inject the CSS
-    css = load_css("static/styles.css", image_base64)
+    css = load_css("static/styles.css", image_url)
     st.markdown(css, unsafe_allow_html=True)
 
-    df = sr_data()
-
     player_df = pd.read_csv('data/all_player_info.csv')
     
     # Player Name : Username
@@ -41,11 +45,9 @@ def show_senior_players():
     game_time_classes = ['All', 'rapid', 'blitz','bullet'] # Adjust the column name as needed
 
     win_conditions = ['win']
-    lose_conditions = ['resigned', 'checkmated', 'timeout', 'abandoned']
-    draw_conditions = ['agreed', 'stalemate', '50move','repetition','timevsinsufficient','insufficient']
 
     # Create two columns for the dropdowns
-    col1, col2 = st.columns([1,1])
+    col1, col2, col3 = st.columns([1,1,1])
 
     with col1:
         # Dropdown for selecting a player
@@ -59,26 +61,28 @@ def show_senior_players():
         selected_game_time_class = st.selectbox('Select Game Time Class', game_time_classes, key='game_time_class')
         st.session_state.selected_game_time_class = selected_game_time_class
 
+    with col3:
+        # Dropdown for selecting the period of the stats and pie charts (only those years are read from the store)
+        selected_period = st.selectbox('Select Period', list(PAGE_PERIODS.keys()), key='period')
+
+    # Only the selected player's partition of the game store is loaded, limited to the selected period
+    df = sr_player_data(selected_player, PAGE_GAME_COLUMNS, PAGE_PERIODS[selected_period])
+
+    # The selected player's games seen from their side (color, my_/opp_ columns, outcome)
+    games = get_player_games(df, selected_player)
+
     if selected_game_time_class == 'All':
-        temp_df = df[((df['white_username'] == st.session_state.selected_player) | (df['black_username'] == st.session_state.selected_player))]
+        temp_df = games
     else:
-        temp_df = df[((df['white_username'] == st.session_state.selected_player) | (df['black_username'] == st.session_state.selected_player)) & (df['game_time_class'] == st.session_state.selected_game_time_class)]
+        temp_df = games[games['game_time_class'] == selected_game_time_class]
         
 
     # Create separate DataFrames for wins, draws, and losses
-    win_df = temp_df[((temp_df['white_username'] == st.session_state.selected_player) & (temp_df['white_result'].isin(win_conditions))) |
-                    ((temp_df['black_username'] == st.session_state.selected_player) & (temp_df['black_result'].isin(win_conditions)))]
-
-    draw_df = temp_df[((temp_df['white_username'] == st.session_state.selected_player) & (temp_df['white_result'].isin(draw_conditions))) |
-                    ((temp_df['black_username'] == st.session_state.selected_player) & (temp_df['black_result'].isin(draw_conditions)))]
+    win_df = temp_df[temp_df['outcome'] == 'win']
+    draw_df = temp_df[temp_df['outcome'] == 'draw']
+    loss_df = temp_df[temp_df['outcome'] == 'loss']
 
-    loss_df = temp_df[((temp_df['white_username'] == st.session_state.selected_player) & (temp_df['white_result'].isin(lose_conditions))) |
-                    ((temp_df['black_username'] == st.session_state.selected_player) & (temp_df['black_result'].isin(lose_conditions)))]
-
-    (total_games, white_accuracy, black_accuracy,
-    wins_as_white, loss_as_white, draws_as_white, total_games_white, white_win_ratio, white_loss_ratio, white_draw_ratio,
-    wins_as_black, loss_as_black, draws_as_black, total_games_black, black_win_ratio, black_loss_ratio, black_draw_ratio,
-    opening_lines,white_most_played_openings, white_most_accurate_openings, black_most_played_openings, black_most_accurate_openings) = display_player_stats(temp_df, selected_player)
+    stats = compute_player_stats(temp_df)
 
     profile_df = pd.read_csv('data/new_sr_players_avatar2.csv')
 
@@ -151,29 +155,29 @@ def show_senior_players():
         <div class="metrics-row">
             <div class="metric-container">
                 <div class="metric-label">Total Games <br> </div>
-                <div class="metric-value">{total_games}</div>
+                <div class="metric-value">{stats.total_games}</div>
             </div>
             <div class="metric-container">
                 <div class="metric-label">Avg Accuracy as White <br> </div>
-                <div class="metric-value"> {white_accuracy:.2f}%</div>
+                <div class="metric-value"> {stats.white.accuracy:.2f}%</div>
             </div>
             <div class="metric-container">
                 <div class="metric-label">Avg Accuracy as Black <br> </div>
-                <div class="metric-value">{black_accuracy:.2f}%</div>
+                <div class="metric-value">{stats.black.accuracy:.2f}%</div>
             </div>
         </div>
     """, unsafe_allow_html=True)
             
-    avg_rating = calculate_avg_opponent_rating(temp_df, st.session_state.selected_player)
-    best_opponent_name, best_opponent_rating = get_best_win(df, st.session_state.selected_player, win_conditions)
+    avg_rating = calculate_avg_opponent_rating(temp_df)
+    best_opponent_name, best_opponent_rating = get_best_win(games, win_conditions)
 
-    avg_rating_win = calculate_avg_opponent_rating(win_df, st.session_state.selected_player)
-    avg_rating_draw = calculate_avg_opponent_rating(draw_df, st.session_state.selected_player)
-    avg_rating_loss = calculate_avg_opponent_rating(loss_df, st.session_state.selected_player)
+    avg_rating_win = calculate_avg_opponent_rating(win_df)
+    avg_rating_draw = calculate_avg_opponent_rating(draw_df)
+    avg_rating_loss = calculate_avg_opponent_rating(loss_df)
 
-    win_png = load_image("assets/win3.png")  
-    draw_png = load_image("assets/draw2.png")  
-    loss_png = load_image("assets/loss2.png") 
+    win_png = get_static_asset_url("assets/win3.png")  
+    draw_png = get_static_asset_url("assets/draw2.png")  
+    loss_png = get_static_asset_url("assets/loss2.png") 
 
     st.markdown(f"""
         <div class="metrics-row">
@@ -190,13 +194,13 @@ def show_senior_players():
                 <div class="metric-label-spec">Avg Opponent Rating <br> when player...</div>
                 <div class="metric-value-spec">
                     <span class="value-win">
-                        <img src="data:image/png;base64,{win_png}" width="18" height="18"/> {round(avg_rating_win)}
+                        <img src="{win_png}" width="18" height="18"/> {round(avg_rating_win)}
                     </span>
                     <span class="value-draw">
-                        <img src="data:image/png;base64,{draw_png}" width="18" height="18"/> {round(avg_rating_draw)}
+                        <img src="{draw_png}" width="18" height="18"/> {round(avg_rating_draw)}
                     </span>
                     <span class="value-loss">
-                        <img src="data:image/png;base64,{loss_png}" width="18" height="18"/> {round(avg_rating_loss)}
+                        <img src="{loss_png}" width="18" height="18"/> {round(avg_rating_loss)}
                     </span>
                 </div>
             </div>
@@ -205,32 +209,30 @@ def show_senior_players():
         
         # https://discuss.streamlit.io/t/display-svg/172/5 --> code reference.
         
-    rapid_img = load_image('assets/stopwatch.png')
-    blitz_img = load_image('assets/flash.png')
-    bullet_img = load_image("assets/bullet3.png")
+    bullet_img = get_static_asset_url("assets/bullet3.png")
 
-    rapid_rating = get_game_class_rating(df, selected_player, 'rapid')
-    blitz_rating = get_game_class_rating(df, selected_player, 'blitz')
-    bullet_rating = get_game_class_rating(df, selected_player, 'bullet')
+    rapid_rating = get_game_class_rating(games, 'rapid')
+    blitz_rating = get_game_class_rating(games, 'blitz')
+    bullet_rating = get_game_class_rating(games, 'bullet')
 
     st.markdown(f"""
         <div class="metrics-row">
             <div class="metric-container">
                 <i class = "bi bi-stopwatch-fill" style="font-size:1rem; color:#69923E;"></i>
                 <div class="metric-label">Best Rapid Rating <br> </div>
-                <div class="metric-value">{get_game_class_rating(df, selected_player, 'rapid')}</div>
+                <div class="metric-value">{rapid_rating}</div>
             </div>
             <div class="metric-container">
                 <i class = "bi bi-lightning-fill" style="font-size:1rem; color:yellow;"></i>
                 <div class="metric-label">Best Blitz Rating <br> </div>
-                <div class="metric-value">{get_game_class_rating(df, selected_player, 'blitz')}</div>
+                <div class="metric-value">{blitz_rating}</div>
             </div>
             <div class="metric-container">
                 <div class="metric-icon" style="margin-right: 10px;">
-                    <img src="data:image/png;base64,{bullet_img}" style="width: 16px; height: 16px;">
+                    <img src="{bullet_img}" style="width: 16px; height: 16px;">
                 </div>
                 <div class="metric-label">Best Bullet Rating <br> </div>
-                <div class="metric-value">{get_game_class_rating(df, selected_player, 'bullet')}</div>
+                <div class="metric-value">{bullet_rating}</div>
             </div>
         </div>
     """, unsafe_allow_html=True)
@@ -244,19 +246,19 @@ def show_senior_players():
         col1, col2, col3 = st.container(), st.container(), st.container()
 
     with col1:
-        st.plotly_chart(player_win_chart(df, selected_player, 400, 300),  config={'displayModeBar': False},  use_container_width=True)
+        st.plotly_chart(player_win_chart(games, selected_player, 400, 300),  config={'displayModeBar': False},  use_container_width=True)
         image_path = 'assets/Pie Chart Legend (1).png'
         st.write('')
         st.image(image = image_path, use_column_width=True)
 
     with col2:
-        st.plotly_chart(player_draw_chart(df, selected_player, 400, 300),  config={'displayModeBar': False}, use_container_width=True)
+        st.plotly_chart(player_draw_chart(games, selected_player, 400, 300),  config={'displayModeBar': False}, use_container_width=True)
         image_path = 'assets/New Draw Pie Chart Legend (1).png'
         st.write('')
         st.image(image = image_path, use_column_width=True)
 
     with col3:
-        st.plotly_chart(player_loss_chart(df, selected_player, 400 , 300),  config={'displayModeBar': False}, use_container_width=True)
+        st.plotly_chart(player_loss_chart(games, selected_player, 400 , 300),  config={'displayModeBar': False}, use_container_width=True)
         image_path = 'assets/Lose Pie Chart Legend.png'
         st.write('')
         st.image(image = image_path, use_column_width=True)
@@ -272,13 +274,18 @@ def show_senior_players():
         st.session_state.tab_selected = 'white'
 
         #Show Player as White Stats:
-        show_white_stats(total_games_white, white_win_ratio, white_draw_ratio, white_loss_ratio, wins_as_white, draws_as_white, loss_as_white, white_most_accurate_openings, white_most_played_openings)
+        show_white_stats(stats.white.total_games, stats.white.win_ratio, stats.white.draw_ratio, stats.white.loss_ratio, stats.white.wins, stats.white.draws, stats.white.losses, stats.white.most_accurate_openings, stats.white.most_played_openings)
 
     with tab_black:
         st.session_state.tab_selected = 'black'
 
         #Show Player as Black Stats:
-        show_black_stats(total_games_black, black_win_ratio, black_draw_ratio, black_loss_ratio, wins_as_black, draws_as_black, loss_as_black, black_most_accurate_openings, black_most_played_openings)
+        show_black_stats(stats.black.total_games, stats.black.win_ratio, stats.black.draw_ratio, stats.black.loss_ratio, stats.black.wins, stats.black.draws, stats.black.losses, stats.black.most_accurate_openings, stats.black.most_played_openings)
 
-    render_rating_chart_with_tabs(df, selected_playername=selected_playername, selected_player=selected_player, players_dict=players_dict, width=1180, height=400)
+    # The rating chart always covers the whole history: its tabs pick the period and the smoothing needs the earlier days
+    if PAGE_PERIODS[selected_period] is None:
+        history_games = games
+    else:
+        history_games = get_player_games(sr_player_data(selected_player, PAGE_GAME_COLUMNS), selected_player)
+    render_rating_chart_with_tabs(history_games, selected_playername=selected_playername, selected_player=selected_player, players_dict=players_dict, width=1180, height=400)
     st.caption("Note: The rating curve shown is smoothed using a rolling average to provide a clearer trend. The highest rating annotation reflects the actual unsmoothed rating.")
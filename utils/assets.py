@@ -0,0 +1,111 @@
+import streamlit as st
+import re
+import os
+import hashlib
+import base64
+
+
+# Assets are published to Streamlit's static folder (server.enableStaticServing) under a content hash:
+STATIC_BUILD_DIR = os.path.join('static', 'build')
+STATIC_BUILD_URL = 'app/static/build'
+
+# Function to serve an asset as a static file
+@st.cache_resource(show_spinner=False)
+def get_static_asset_url(asset_path: str) -> str:
+    """
+    Copies an asset into STATIC_BUILD_DIR under a name containing its content hash (once per process)
+    and returns its URL. The browser downloads and caches the file itself, instead of every rerun 
+    re-sending it base64 encoded inside the page.
+
+    Args:
+        asset_path (str): The path of the asset, e.g. 'assets/win3.png'.
+
+    Returns:
+        str: The URL of the static copy, e.g. 'app/static/build/win3.1a2b3c4d5e6f.png'.
+    """
+    with open(asset_path, "rb") as f:
+        content = f.read()
+
+    stem, extension = os.path.splitext(os.path.basename(asset_path))
+    file_name = f"{re.sub(r'[^A-Za-z0-9_-]+', '-', stem)}.{hashlib.sha1(content).hexdigest()[:12]}{extension}"
+    target_path = os.path.join(STATIC_BUILD_DIR, file_name)
+
+    if not os.path.exists(target_path):
+        os.makedirs(STATIC_BUILD_DIR, exist_ok=True)
+        temp_path = f"{target_path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(content)
+        os.replace(temp_path, target_path)  # Other processes never see a partial file
+
+    return f"{STATIC_BUILD_URL}/{file_name}"
+
+# Function to load and inject CSS from a file
+@st.cache_resource(show_spinner=False)
+def load_css(css_file_path: str, image_url: str) -> str:
+    """
+    Loads a CSS file (once per process), replaces the background image placeholder with the image's URL, 
+    and returns the CSS wrapped in a <style> tag for embedding in HTML.
+
+    Args:
+        css_file_path (str): The path to the CSS file.
+        image_url (str): The URL of the background image (see `get_static_asset_url`).
+
+    Returns:
+        str: The CSS content wrapped in <style> tags with the image URL inserted.
+    """
+    with open(css_file_path, "r") as f:
+        css_content = f.read()
+    
+    css_content = css_content.replace("{{background_image_url}}", image_url)    
+    return f"<style>{css_content}</style>"
+
+# Function to encode the local image file to base64
+def get_base64_image(image_path: str) -> str:
+    """
+    Convert an image file to a base64 encoded string.
+
+    Parameters:
+    image_path (str): The path to the image file to encode.
+
+    Returns:
+    str: The base64 encoded string representation of the image.
+    """
+    with open(image_path, "rb") as file:
+        encoded = base64.b64encode(file.read()).decode()
+    return encoded
+
+#Function to render SVG for flowdiagram:
+def render_svg(svg: str, width: int = None, height: int = None) -> None:
+    """Renders the given SVG string in Streamlit with optional width and height.
+
+    Args:
+        svg (str): A string containing the SVG content.
+        width (int, optional): The desired width of the image in pixels.
+        height (int, optional): The desired height of the image in pixels.
+    """
+    b64 = base64.b64encode(svg.encode('utf-8')).decode('utf-8')
+    
+    # Create the HTML for the image, with optional width and height
+    img_style = ""
+    if width:
+        img_style += f'width="{width}px" '
+    if height:
+        img_style += f'height="{height}px" '
+    
+    html = f'<img src="data:image/svg+xml;base64,{b64}" alt="svg" {img_style}/>'
+    st.markdown(html, unsafe_allow_html=True)
+
+# Example: Load your images as base64 if needed
+def load_image(image_path: str) -> str:
+    """
+    Load an image from the specified path and encode it in base64.
+
+    Parameters:
+    image_path (str): The file path to the image.
+
+    Returns:
+    str: The base64 encoded string representation of the image.
+    """
+
+    with open(image_path, "rb") as image_file:
+        return base64.b64encode(image_file.read()).decode("utf-8")
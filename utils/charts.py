@@ -0,0 +1,565 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import threading
+import types
+from collections import OrderedDict
+from functools import wraps
+import plotly.graph_objects as go
+from typing import Dict, Optional, Any, Callable
+
+from utils.stats import filter_data_by_time_period, get_dataset_fingerprint, get_rating_series, lose_conditions, win_conditions
+
+
+PLOT_BGCOLOR = "#fff"
+
+color_map = {'resigned':'#69923E','timeout':'#4E7837','checkmated':'#4B4847','abandoned':'#2C2B29','others':'#161619'}
+color_list = ['rgba(78,120,55,0.8)','rgba(105,146,62,0.8)','rgba(75,72,71,0.8)','rgba(44,43,41,0.8)','rgba(22,22,25,1)']
+
+# Built chart figures are kept as JSON in memory, per process (see cached_figure):
+FIGURE_CACHE_ENTRIES = 256
+FIGURE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+#-------------------------------------------------------------- Figure Cache : --------------------------------------------------------------#
+
+class FigureCache:
+    """
+    In-memory LRU cache of serialized Plotly figures (JSON), bounded by entry count and total bytes.
+    """
+
+    def __init__(self, max_entries: int = FIGURE_CACHE_ENTRIES, max_bytes: int = FIGURE_CACHE_MAX_BYTES) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> figure JSON, least recently used first
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+
+    def get(self, key: tuple) -> Optional[str]:
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return payload
+
+    def put(self, key: tuple, payload: str) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= len(self._entries.pop(key))
+            self._entries[key] = payload
+            self._bytes += len(payload)
+
+            while len(self._entries) > self.max_entries or (self._bytes > self.max_bytes and len(self._entries) > 1):
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {'entries': len(self._entries), 'bytes': self._bytes,
+                    'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions}
+
+_figure_cache = FigureCache()
+
+# Function to turn a chart builder argument into part of the cache key
+def get_figure_cache_key_part(value: Any) -> Any:
+    if isinstance(value, pd.DataFrame):
+        return ('dataset', get_dataset_fingerprint(value))
+    if isinstance(value, dict):
+        return tuple(sorted((str(key), repr(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(map(repr, value))
+    return value
+
+# Function to list the module settings (non-callable globals) a chart builder reads
+def get_figure_settings(builder: Callable) -> tuple:
+    module_globals = builder.__globals__
+    return tuple(sorted(name for name in set(builder.__code__.co_names)
+                        if name in module_globals and not callable(module_globals[name])
+                        and not isinstance(module_globals[name], types.ModuleType)))
+
+def cached_figure(builder: Callable[..., Optional[go.Figure]]) -> Callable[..., Optional[go.Figure]]:
+    """
+    Decorator for chart builders: the figure is built once per chart type and arguments (player, time 
+    period, sizes, ... with DataFrames keyed by their dataset fingerprint, so the filtered time class 
+    is part of the key) and later calls rebuild it from the cached JSON, skipping pandas and Plotly.
+    The module settings the builder reads (e.g. RATING_CHART_POINTS_PER_PIXEL, PLOT_BGCOLOR) are part 
+    of the key too, so changing one builds a new figure instead of serving the old one.
+    Builders returning None (e.g. after a st.warning) are not cached, so the message shows again.
+
+    Args:
+        builder (Callable): A function returning a Plotly figure.
+
+    Returns:
+        Callable: The caching builder (the original is available as `__wrapped__`).
+    """
+    settings = get_figure_settings(builder)
+
+    @wraps(builder)
+    def build(*args, **kwargs):
+        key = (builder.__name__, tuple(map(get_figure_cache_key_part, args)),
+               tuple(sorted((name, get_figure_cache_key_part(value)) for name, value in kwargs.items())),
+               tuple((name, get_figure_cache_key_part(builder.__globals__.get(name))) for name in settings))
+
+        payload = _figure_cache.get(key)
+        if payload is not None:
+            import plotly.io as pio  # Loaded on first use (slow to import)
+            return pio.from_json(payload, skip_invalid=True)
+
+        fig = builder(*args, **kwargs)
+        if fig is not None:
+            _figure_cache.put(key, fig.to_json())
+        return fig
+
+    return build
+
+def get_figure_cache_stats() -> Dict[str, int]:
+    """Entry count, bytes and hit/miss/eviction counters of the figure cache."""
+    return _figure_cache.stats()
+
+def clear_figure_cache() -> None:
+    """Drops every cached figure (the hit/miss counters are kept)."""
+    _figure_cache.clear()
+
+# Create Horizontal Bar chart just as in chess.com:
+@cached_figure
+def create_horizontal_stacked_bar_chart(win_pct: float, draw_pct: float, lose_pct: float, 
+                                         num_win: int, num_draw: int, num_lose: int, 
+                                         height: int, width: int) -> go.Figure:
+
+    """
+    Creates a horizontal stacked bar chart for player statistics.
+
+    Parameters:
+    - white_win_pct (float): Win percentage.
+    - draw_pct (float): Draw percentage.
+    - lose_pct (float): Loss percentage.
+    - height (int): Height of the chart in pixels.
+
+    Returns:
+    - fig (plotly.graph_objects.Figure): The Plotly figure object.
+    """
+     # Create a horizontal stacked bar chart
+    fig = go.Figure()
+
+    # Add the "Win" bar
+    fig.add_trace(go.Bar(
+        y=['Player'],
+        x=[win_pct],
+        name='Win Rate',
+        orientation='h',
+        marker_color='#69923E',
+        text=[f"<b>{num_win}  </b>"],  # Display number of games won
+        textposition='none'  # Hide default text position
+    ))
+
+    # Add the "Draw" bar
+    fig.add_trace(go.Bar(
+        y=['Player'],
+        x=[draw_pct],
+        name='Draw Rate',
+        orientation='h',
+        marker_color='#A9A9A9',
+        text=[f"<b>{num_draw}</b>"],  # Display number of draws
+        textposition='none'  # Hide default text position
+    ))
+
+    # Add the "Lose" bar
+    fig.add_trace(go.Bar(
+        y=['Player'],
+        x=[lose_pct],
+        name='Loss Rate',
+        orientation='h',
+        marker_color='#ff5733',
+        text=[f"<b>{num_lose}</b>"],  # Display number of losses
+        textposition='none'  # Hide default text position
+    ))
+
+    # Add annotations for percentage labels below the bar
+    fig.add_annotation(
+        x=win_pct / 4.5, y=-1.5, 
+        text=f"<b>{round(win_pct)}% Won </b>", showarrow=False, 
+        font_size=12, font_color='#69923E'
+    )  # Position below the bar
+    fig.add_annotation(
+        x=win_pct + draw_pct / 2, y=-1.5, 
+        text=f"<b>{round(draw_pct)}% Draw </b>", showarrow=False, 
+        font_size=12, font_color='#A9A9A9'
+    )  # Position below the bar
+    fig.add_annotation(
+        x=win_pct + draw_pct + lose_pct / 1.35, y=-1.5, 
+        text=f"<b>{round(lose_pct)}% Lost </b>", showarrow=False, 
+        font_size=12, font_color='#ff5733'
+    )  # Position below the bar
+
+    # Add annotations for number of games above the bar
+    fig.add_annotation(
+        x=win_pct / 8, y=1.6, 
+        text=f"<b>{num_win}</b>", showarrow=False, 
+        font_size=12, font_color='green'
+    )  # Position above the bar
+    fig.add_annotation(
+        x=win_pct + draw_pct / 2, y=1.6, 
+        text=f"<b>{num_draw}</b>", showarrow=False, 
+        font_size=12, font_color='grey'
+    )  # Position above the bar
+    fig.add_annotation(
+        x=win_pct + draw_pct + lose_pct / 1.2, y=1.6, 
+        text=f"<b>{num_lose}</b>", showarrow=False, 
+        font_size=12, font_color='red'
+    )  # Position above the bar
+
+    # Update the layout
+    fig.update_layout(
+        barmode='stack',
+        title='',
+        xaxis_title='',
+        yaxis_title='',
+        xaxis=dict(tickformat=".0%",showticklabels=False),  # Hide x-axis labels)
+        yaxis=dict(showticklabels=False),  # Hide y-axis labels),
+        legend=dict(visible=False),  # Hide the legend
+        margin=dict(l=0, r=0, t=10, b=10),  # Increase top and bottom margins for labels
+        height=height,  # Set the height of the chart
+        width = width
+    )
+
+    return fig
+
+# Function to create pie chart for player's wins (how opponent lost)
+@cached_figure
+def player_win_chart(games: pd.DataFrame, player: str, w: int, h: int) -> Any:
+    """
+    Creates a pie chart showing how the specified player won their games.
+
+    Parameters:
+    - games (pd.DataFrame): The player perspective table (see `normalise_player_games`).
+    - player (str): The username of the player whose win chart is being created.
+    - w (int): The width of the chart in pixels.
+    - h (int): The height of the chart in pixels.
+
+    Returns:
+    - plotly.graph_objects.Figure: A Plotly figure object containing the pie chart.
+    """
+
+    other_condition = 'other'
+
+    # Filter games where player won
+    won_games = games[games['my_result'].isin(win_conditions)]
+
+    # Label opponent loss reasons (how the opponent lost), anything unlisted counts as 'other'
+    opponent_loss_reasons = won_games['opp_result'].where(won_games['opp_result'].isin(lose_conditions), other_condition)
+
+    # Calculate percentages
+    loss_counts = opponent_loss_reasons.value_counts(normalize=True) * 100
+
+    # Create pie chart
+    fig = go.Figure(data=[go.Pie(
+        labels=loss_counts.index,
+        values=loss_counts,
+        hole=0.5,
+        marker=dict(colors=color_list),
+        direction='clockwise'
+        
+    )]) 
+    
+    fig.update_layout(showlegend=False,
+                      width=w, height=h,
+                      margin=dict(l=0, r=0, t=60, b=20), title_x = 0.15,
+                      title=dict(text= f"How {player} won games:", y= 0.95),
+                      paper_bgcolor=PLOT_BGCOLOR,
+                      plot_bgcolor="skyblue"
+                      )
+    
+    fig.update_traces(marker = dict(line = dict(color = '#ffffff', width = 2)),
+                    #   textinfo = 'percent+label',
+                      textfont = dict(color = 'white'))
+
+    return fig
+
+# Function to create pie chart for player's draws.
+@cached_figure
+def player_draw_chart(games: pd.DataFrame, player: str, w: int, h: int) -> Any:
+    """
+    Creates a pie chart showing how the specified player drew their games.
+
+    Parameters:
+    - games (pd.DataFrame): The player perspective table (see `normalise_player_games`).
+    - player (str): The username of the player whose draw chart is being created.
+    - w (int): The width of the chart in pixels.
+    - h (int): The height of the chart in pixels.
+
+    Returns:
+    - plotly.graph_objects.Figure: A Plotly figure object containing the pie chart.
+    """
+
+    draw_conditions = ['stalemate', 'insufficient material', 'repetition', '50-move rule', 'agreed draw', 'timeout draw']  # Add any other draw conditions
+
+    # Filter games where the result was a draw (every remaining result is one of the listed reasons)
+    player_draw_reasons = games.loc[games['my_result'].isin(draw_conditions), 'my_result']
+
+    # Calculate percentages
+    draw_counts = player_draw_reasons.value_counts(normalize=True) * 100
+
+    # Create pie chart
+    fig = go.Figure(data=[go.Pie(
+        labels=draw_counts.index,
+        values=draw_counts,
+        hole=0.5,
+        marker=dict(colors=color_list),
+        direction='clockwise'
+    )])
+
+    fig.update_layout(showlegend=False,
+                      width=w, height=h,
+                      margin=dict(l=0, r=0, t=60, b=20), title_x=0.15,
+                      title=dict(text=f"How {player} drew games:", y=0.95),
+                      paper_bgcolor=PLOT_BGCOLOR,
+                      plot_bgcolor="skyblue"
+                      )
+
+    fig.update_traces(marker=dict(line=dict(color='#ffffff', width=2)),
+                      textfont=dict(color='white'))
+
+    return fig
+
+# Function to create pie chart for player's losses (how the player lost)
+@cached_figure
+def player_loss_chart(games: pd.DataFrame, player: str, w: int, h: int) -> Any:
+    """
+    Creates a pie chart showing how the specified player lost their games.
+
+    Parameters:
+    - games (pd.DataFrame): The player perspective table (see `normalise_player_games`).
+    - player (str): The username of the player whose loss chart is being created.
+    - w (int): The width of the chart in pixels.
+    - h (int): The height of the chart in pixels.
+
+    Returns:
+    - plotly.graph_objects.Figure: A Plotly figure object containing the pie chart.
+    """
+    # Filter games where player lost (every remaining result is one of the listed reasons)
+    player_loss_reasons = games.loc[games['my_result'].isin(lose_conditions), 'my_result']
+
+    # Calculate percentages
+    loss_counts = player_loss_reasons.value_counts(normalize=True) * 100
+
+    # Create pie chart
+    fig = go.Figure(data=[go.Pie(
+        labels=loss_counts.index,
+        values=loss_counts,
+        hole=0.5,
+        marker=dict(colors=color_list),
+        direction='clockwise'
+    )]) 
+    
+    fig.update_layout(showlegend=False,
+                      width=w, height=h,
+                      margin=dict(l=0, r=0, t=60, b=20), title_x = 0.15,
+                      title=dict(text= f"How {player} lost games:", y= 0.95),
+                      paper_bgcolor=PLOT_BGCOLOR,
+                      plot_bgcolor="skyblue"
+                      ) 
+
+    fig.update_traces(marker = dict(line = dict(color = '#ffffff', width = 2)),
+                    #   textinfo = 'percent+label',
+                      textfont = dict(color = 'white'))
+
+    return fig
+
+# Points drawn per pixel of chart width, a long history is downsampled to this (see downsample_lttb)
+RATING_CHART_POINTS_PER_PIXEL = 1
+
+def downsample_lttb(x: np.ndarray, y: np.ndarray, max_points: int) -> np.ndarray:
+    """
+    Picks the points that keep the shape of a line with Largest-Triangle-Three-Buckets: the first and last
+    points are kept, the rest is split into `max_points - 2` buckets and from each bucket the point forming 
+    the largest triangle with the previously kept point and the average of the next bucket is kept. 
+    Peaks and troughs form large triangles, so they survive.
+
+    Parameters:
+    - x (np.ndarray): Sorted x values (numbers or datetimes).
+    - y (np.ndarray): The y values.
+    - max_points (int): Number of points to keep.
+
+    Returns:
+    - np.ndarray: Sorted positions of the kept points (all positions if there are at most `max_points`).
+    """
+    n = len(x)
+    if max_points >= n or max_points < 3:
+        return np.arange(n)
+
+    x = np.asarray(x).astype('int64').astype(float) if np.issubdtype(np.asarray(x).dtype, np.datetime64) else np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    # Bucket i covers positions edges[i]..edges[i + 1] - 1 (the first and last points have their own)
+    edges = np.linspace(1, n - 1, max_points - 1).astype(int)
+    kept = np.empty(max_points, dtype=int)
+    kept[0], kept[-1] = 0, n - 1
+
+    previous = 0
+    for i in range(max_points - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_x, next_y = x[end:edges[i + 2]].mean(), y[end:edges[i + 2]].mean()
+        else:
+            next_x, next_y = x[-1], y[-1]
+
+        areas = np.abs((x[previous] - next_x) * (y[start:end] - y[previous]) -
+                       (x[previous] - x[start:end]) * (next_y - y[previous]))
+        previous = start + int(areas.argmax())
+        kept[i + 1] = previous
+
+    return kept
+
+@cached_figure
+def create_rating_chart(rating_series: pd.DataFrame, selected_playername: str, selected_player: str, players_dict: dict, width: int, height: int, time_period: str):
+    """
+    Creates a smoothed rating chart for the selected player over the specified time period.
+
+    Parameters:
+    - rating_series (pd.DataFrame): The player's daily rating series (see `get_rating_series`).
+    - selected_playername (str): Name of the selected player for display.
+    - selected_player (str): Username of the selected player.
+    - players_dict (dict): Dictionary containing player data for special handling.
+    - width (int): Width of the chart.
+    - height (int): Height of the chart.
+    - time_period (str): Time period for filtering data.
+
+    Returns:
+    - plotly.graph_objects.Figure: A Plotly Figure object for the rating chart.
+    """
+
+    # Filter by selected time period (the daily maximum and its smoothing are precomputed)
+    filtered_df = filter_data_by_time_period(rating_series[['game_date', 'rating', 'smoothed_rating']], time_period)
+
+    # Check if filtered data is empty before proceeding
+    if filtered_df.empty:
+        st.warning(f"No data available for {time_period}.")
+        return None
+
+    # Filter out rows where the smoothed rating is NaN
+    filtered_smoothed_df = filtered_df.dropna(subset=['smoothed_rating'])
+
+    # Check if there's any data to plot
+    if filtered_smoothed_df.empty:
+        st.error("No data available after applying smoothing.")
+        return None
+
+    # Find the minimum and maximum game dates for the smoothed rating data
+    min_date_smooth = filtered_smoothed_df['game_date'].min()
+    max_date_smooth = filtered_smoothed_df['game_date'].max()
+
+    # Find the highest rating and corresponding date
+    highest_rating = filtered_smoothed_df['rating'].max()
+    highest_rating_date = filtered_smoothed_df.loc[filtered_smoothed_df['rating'].idxmax(), 'game_date']
+
+    # Set y-axis range based on the smoothed rating data (before downsampling, so the range is exact)
+    min_smoothed_rating = 2000 if selected_player in players_dict else filtered_smoothed_df['smoothed_rating'].min()
+    max_smoothed_rating = filtered_smoothed_df['smoothed_rating'].max()
+
+    # Draw at most RATING_CHART_POINTS_PER_PIXEL points per pixel, always keeping the highest rating's day and the curve's extremes
+    positions = downsample_lttb(filtered_smoothed_df['game_date'].to_numpy(), filtered_smoothed_df['smoothed_rating'].to_numpy(),
+                                width * RATING_CHART_POINTS_PER_PIXEL)
+    smoothed = filtered_smoothed_df['smoothed_rating'].to_numpy()
+    peaks = [filtered_smoothed_df.index.get_loc(filtered_smoothed_df['rating'].idxmax()), smoothed.argmax(), smoothed.argmin()]
+    filtered_smoothed_df = filtered_smoothed_df.iloc[np.union1d(positions, peaks)]
+
+    # Format the date as desired (e.g., Month-Year format)
+    highest_actual_rating_date_str = highest_rating_date.strftime('%d-%B-%Y')
+
+    # Create the area plot with Plotly Express (loaded on first use, it is slow to import)
+    import plotly.express as px
+    fig = px.area(filtered_smoothed_df, 
+                  x='game_date', 
+                  y='smoothed_rating', 
+                  title = f"Rating (smoothed) of {selected_playername} for {time_period}",
+                  labels={'game_date': '', 'smoothed_rating': ''},
+                  color_discrete_sequence=['#4E7837'],
+                #   line_shape='spline',
+                  width=width, 
+                  height=height)
+
+    # Dynamically set x-axis range to span from the earliest to the latest smoothed data date
+    fig.update_xaxes(range=[min_date_smooth, max_date_smooth])  # Format x-axis as Month-Year
+    
+    # Customize x-axis ticks based on the selected time period
+    if time_period == 'Last 1 Year':
+        # Show months for better granularity
+        fig.update_xaxes(
+            tickformat="%b\n%Y",  # Month-Year format (e.g., Jan 2022)
+            tickvals=pd.date_range(start=min_date_smooth, end=max_date_smooth, freq='MS').strftime('%Y-%m-%d'),
+            ticktext=pd.date_range(start=min_date_smooth, end=max_date_smooth, freq='MS').strftime('%b %Y'),
+        )
+    elif time_period == 'Last 3 Years':
+        fig.update_xaxes(
+            tickvals=pd.date_range(start=min_date_smooth, end=max_date_smooth, freq='YS').strftime('%Y'),
+            ticktext=pd.date_range(start=min_date_smooth, end=max_date_smooth, freq='YS').strftime('%Y'),
+        )
+    else:  # All Time (keep default settings)
+        fig.update_xaxes(
+            tickformat="%Y",  # Year format for all time
+        )
+
+    # max_y_value = max(highest_rating, max_smoothed_rating)
+
+    fig.update_yaxes(range=[min_smoothed_rating, max_smoothed_rating])
+
+   # Add a "card-like" annotation for the highest actual rating above the curve, without arrow
+    fig.add_annotation(
+        x=0.8,  # Fix annotation position on the right-hand side of the plot
+        xref='paper', 
+        y=max_smoothed_rating-20,  # Position the label above the actual highest rating
+        text=f"Highest Rating<br><b>{int(highest_rating)}</b><br>{highest_actual_rating_date_str}",  # Multiline text
+        showarrow=False,  # No arrow
+        font=dict(color="black", size=12),  # Adjust font size
+        align="center",  # Center-align the text
+        bgcolor="white",  # White background to make it card-like
+        bordercolor="#f1f1f1",  # Add border to the text box for a card effect
+        borderwidth=2,  # Border thickness
+        borderpad=5 # Padding inside the card
+    )
+
+    fig.update_layout(margin=dict(l=0, r=0, t=50, b=0))
+
+    return fig
+
+def render_rating_chart_with_tabs(games: pd.DataFrame, selected_playername: str, selected_player: str, players_dict: dict, width: int = 800, height: int = 400):
+    """
+    Renders rating charts for a selected player across different time periods in Streamlit tabs.
+
+    Parameters:
+    - games (pd.DataFrame): The player perspective table (see `normalise_player_games`).
+    - selected_playername (str): The name of the selected player.
+    - selected_player (str): The username of the selected player.
+    - players_dict (dict): Dictionary containing player data for special handling.
+    - width (int): Width of the charts.
+    - height (int): Height of the charts.
+    """
+
+    # Built once per player and data version, the tabs only slice it
+    rating_series = get_rating_series(games)
+
+    tab1, tab2, tab3 = st.tabs(["Last 1 Year", "Last 3 Years", "All Time"])
+
+    with tab1:
+        fig = create_rating_chart(rating_series, selected_playername, selected_player, players_dict, width=800, height=400, time_period='Last 1 Year')
+        if fig:
+            st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
+
+    with tab2:
+        fig = create_rating_chart(rating_series, selected_playername, selected_player, players_dict, width=800, height=400, time_period='Last 3 Years')
+        if fig:
+            st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
+
+    with tab3:
+        fig = create_rating_chart(rating_series, selected_playername, selected_player, players_dict, width=800, height=400, time_period='All Time')
+        if fig:
+            st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
@@ -0,0 +1,784 @@
+import streamlit as st
+from datetime import datetime,timedelta
+import pandas as pd
+import os
+import time
+import threading
+import uuid
+from contextlib import contextmanager
+from urllib.parse import quote_plus
+from sqlalchemy import create_engine, text, inspect, MetaData, Table, Column, Index, String, Integer, Float, Date, DateTime
+from sqlalchemy.engine import Engine, make_url
+from typing import List, Optional, Tuple, Dict, Any
+
+from utils.fetch import get_archives, get_http_latency_summary, ingest_archives
+
+
+# Rows sent to the database per executemany call (and per commit) when saving games:
+DB_INSERT_BATCH_SIZE = 1000
+# Game URLs looked up per query when comparing downloaded games with stored ones (SQL Server allows 2100 parameters):
+DB_LOOKUP_BATCH_SIZE = 500
+
+# Database connection pool settings (the DSN itself comes from get_database_url):
+DB_POOL_SIZE = 5
+DB_MAX_OVERFLOW = 10
+DB_POOL_TIMEOUT = 30  # seconds to wait for a free connection
+DB_POOL_RECYCLE = 1800  # seconds before a pooled connection is replaced
+
+_db_engine = None
+_db_engine_lock = threading.Lock()
+_db_migrated = False
+    
+#-------------------------------------------------------------- DataBase Functions : --------------------------------------------------------------#
+
+# Tables used by the live extraction. They are created when missing (e.g. on a fresh local SQLite database).
+db_metadata = MetaData()
+
+# Function to declare the columns of a stored game (a Column belongs to one Table, so every table gets new ones)
+def get_game_columns() -> List[Column]:
+    return [
+        Column('player_name', String(100), nullable=False),
+        Column('game_url', String(200), nullable=False),
+        Column('game_date', String(10)),
+        Column('game_time_control', String(20)),
+        Column('game_time_class', String(20)),
+        Column('game_variant', String(30)),
+        Column('opening', String(200)),
+        Column('white_rating', Integer),
+        Column('white_result', String(30)),
+        Column('white_username', String(100)),
+        Column('white_accuracy', Float),
+        Column('black_rating', Integer),
+        Column('black_result', String(30)),
+        Column('black_username', String(100)),
+        Column('black_accuracy', Float),
+        Column('last_updated', Date),
+    ]
+
+player_game_data_table = Table(
+    'player_game_data', db_metadata,
+    *get_game_columns(),
+    Index('ux_player_game_data_player_url', 'player_name', 'game_url', unique=True),
+)
+
+player_archive_sync_table = Table(
+    'player_archive_sync', db_metadata,
+    Column('player_name', String(100), primary_key=True),
+    Column('last_archive_month', String(7), nullable=False),
+    Column('last_synced', DateTime, nullable=False),
+)
+
+# Shadow copy of player_game_data. A refresh loads the downloaded games here first and then moves them into
+# player_game_data in a single transaction (see merge_staged_games), so readers never see a partial player.
+# Rows are tagged with the run that staged them, so concurrent refreshes of one player never touch each other's rows.
+player_game_data_staging_table = Table(
+    'player_game_data_staging', db_metadata,
+    *get_game_columns(),
+    Column('run_id', String(32), nullable=False),
+    Column('staged_at', DateTime, nullable=False),
+    Index('ix_player_game_data_staging_run', 'run_id'),
+)
+
+# Staged rows older than this are leftovers of a crashed run and are dropped by the next run
+STAGING_MAX_AGE = timedelta(days=1)
+
+# State of the background refresh of every tracked player (see run_due_refreshes)
+player_refresh_jobs_table = Table(
+    'player_refresh_jobs', db_metadata,
+    Column('player_name', String(100), primary_key=True),
+    Column('status', String(20), nullable=False),  # idle, running, ok or failed
+    Column('next_run', DateTime, nullable=False),
+    Column('last_viewed', DateTime),
+    Column('started_at', DateTime),
+    Column('finished_at', DateTime),
+    Column('failures', Integer, nullable=False),  # consecutive failed refreshes
+    Column('last_error', String(500)),
+)
+
+def get_database_url() -> str:
+    """
+    Returns the SQLAlchemy URL of the games database.
+
+    `CHESS_DB_URL` (any SQLAlchemy URL, e.g. 'sqlite:///chess_players.db' for local testing) takes precedence.
+    Otherwise a SQL Server URL is built from `DB_SERVER` and `DB_NAME` using Windows authentication.
+
+    Returns:
+        str: The database URL.
+    """
+    url = os.environ.get('CHESS_DB_URL')
+    if url:
+        return url
+
+    connection_string = (
+        "Driver={ODBC Driver 17 for SQL Server};"
+        f"Server={os.environ.get('DB_SERVER', 'DESKTOP-M7PK0Q6')};"
+        f"Database={os.environ.get('DB_NAME', 'chess_players')};"
+        "Trusted_Connection=yes;"
+    )
+    return f"mssql+pyodbc:///?odbc_connect={quote_plus(connection_string)}"
+
+def get_engine() -> Engine:
+    """
+    Returns the process-wide SQLAlchemy engine, whose pool hands out connections to all DB functions.
+
+    Connections are checked with a ping before being handed out (dropped ones are replaced) and recycled
+    after DB_POOL_RECYCLE seconds. At most DB_POOL_SIZE + DB_MAX_OVERFLOW connections are open at once.
+
+    Returns:
+        Engine: The shared engine.
+    """
+    global _db_engine
+
+    with _db_engine_lock:
+        if _db_engine is None:
+            url = make_url(get_database_url())
+            pool_options = dict(pool_size=DB_POOL_SIZE, max_overflow=DB_MAX_OVERFLOW,
+                                pool_timeout=DB_POOL_TIMEOUT, pool_recycle=DB_POOL_RECYCLE)
+            if url.get_backend_name() == 'sqlite' and url.database in (None, '', ':memory:'):
+                pool_options = {}  # In-memory SQLite keeps a single connection per thread
+            elif url.get_backend_name() == 'mssql':
+                pool_options['fast_executemany'] = True
+
+            _db_engine = create_engine(url, pool_pre_ping=True, **pool_options)
+        return _db_engine
+
+# Initialize the connection (taken from the pool, `close()` hands it back)
+def init_connection():
+    return get_engine().raw_connection()
+
+@contextmanager
+def pooled_connection():
+    """
+    Borrows a DB-API connection from the pool for the duration of a `with` block.
+
+    Yields:
+        The pooled connection (cursor / commit / rollback like a plain pyodbc connection).
+    """
+    conn = init_connection()
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+# Function to read stored games into a DataFrame
+def read_player_games(player_name: str, conn, player_name_column: str = "player_name") -> pd.DataFrame:
+    """
+    Reads a player's stored games.
+
+    Args:
+        player_name (str): The username of the chess player on Chess.com.
+        conn: A pooled database connection.
+        player_name_column (str): The column that stores player names (default is "player_name").
+
+    Returns:
+        pd.DataFrame: The player's rows of the player_game_data table.
+    """
+    cursor = conn.cursor()
+    cursor.execute(f"SELECT * FROM player_game_data WHERE {player_name_column} = ?", (player_name,))
+    columns = [column[0] for column in cursor.description]
+    return pd.DataFrame.from_records([tuple(row) for row in cursor.fetchall()], columns=columns)
+
+# Columns of the player_game_data table written by the live extraction (last_updated is set on insert)
+PLAYER_GAME_COLUMNS = ['player_name', 'game_url', 'game_date', 'game_time_control', 'game_time_class', 'game_variant',
+                       'opening', 'white_rating', 'white_result', 'white_username', 'white_accuracy',
+                       'black_rating', 'black_result', 'black_username', 'black_accuracy']
+
+# Function to bulk insert games into player_game_data
+def insert_player_games(df: pd.DataFrame, conn, batch_size: int = DB_INSERT_BATCH_SIZE,
+                        table: str = 'player_game_data', extra_values: Optional[Dict[str, Any]] = None) -> int:
+    """
+    Inserts the games of a DataFrame into the player_game_data table (or its staging copy) in batches.
+
+    Each batch is sent with a single `executemany` (using pyodbc's `fast_executemany` when available,
+    which ships the whole batch in one round trip) and committed once.
+
+    Args:
+        df (pd.DataFrame): Games with the PLAYER_GAME_COLUMNS columns.
+        conn: A pooled database connection (any qmark style DB-API connection works).
+        batch_size (int): Number of rows per executemany call and commit.
+        table (str): The table to insert into (default 'player_game_data').
+        extra_values (Optional[Dict[str, Any]]): Further columns set to the same value on every row 
+                                                 (e.g. the run of a staging table).
+
+    Returns:
+        int: The number of rows inserted.
+    """
+    if df.empty:
+        return 0
+
+    extra_values = extra_values or {}
+    columns = PLAYER_GAME_COLUMNS + ['last_updated'] + list(extra_values)
+    insert_query = f"""
+        INSERT INTO {table} ({', '.join(columns)})
+        VALUES ({', '.join(['?'] * len(columns))})
+    """
+
+    # Plain Python values with None for missing ones, which is what the drivers expect
+    values = df[PLAYER_GAME_COLUMNS].astype(object).where(df[PLAYER_GAME_COLUMNS].notna(), None)
+    row_end = (datetime.now().date(),) + tuple(extra_values.values())
+    rows = [row + row_end for row in values.itertuples(index=False, name=None)]
+
+    cursor = conn.cursor()
+    if hasattr(cursor, 'fast_executemany'):
+        cursor.fast_executemany = True
+
+    for start in range(0, len(rows), batch_size):
+        cursor.executemany(insert_query, rows[start:start + batch_size])
+        conn.commit()
+
+    return len(rows)
+
+# Function to find the downloaded games that are new or changed compared to player_game_data
+def get_changed_games(df: pd.DataFrame, conn) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Compares downloaded games with the stored ones, matching rows on (player_name, game_url).
+    Only the stored rows of the downloaded URLs are read (through the unique (player_name, game_url)
+    index), in batches of DB_LOOKUP_BATCH_SIZE URLs.
+
+    Args:
+        df (pd.DataFrame): Games with the PLAYER_GAME_COLUMNS columns.
+        conn: A pooled database connection (see `init_connection`).
+
+    Returns:
+        Tuple[pd.DataFrame, pd.DataFrame]: The games that are not stored yet and the stored games whose values changed.
+    """
+    df = df.drop_duplicates(subset=['player_name', 'game_url'], keep='last')
+    cursor = conn.cursor()
+
+    # Stored versions of the downloaded games
+    existing = []
+    for player_name, game_urls in df.groupby('player_name', sort=False)['game_url']:
+        game_urls = game_urls.tolist()
+        for start in range(0, len(game_urls), DB_LOOKUP_BATCH_SIZE):
+            batch = game_urls[start:start + DB_LOOKUP_BATCH_SIZE]
+            cursor.execute(f"""
+                SELECT {', '.join(PLAYER_GAME_COLUMNS)} FROM player_game_data
+                WHERE player_name = ? AND game_url IN ({', '.join(['?'] * len(batch))})
+            """, (player_name, *batch))
+            existing.extend(tuple(row) for row in cursor.fetchall())
+    existing_df = pd.DataFrame(existing, columns=PLAYER_GAME_COLUMNS)
+
+    merged = df[PLAYER_GAME_COLUMNS].merge(existing_df, on=['player_name', 'game_url'], how='left',
+                                           suffixes=('', '_stored'), indicator=True)
+
+    new_games = merged[merged['_merge'] == 'left_only'][PLAYER_GAME_COLUMNS]
+    stored_games = merged[merged['_merge'] == 'both']
+
+    # Compare on normalised values so driver types (Decimal, date, ...) don't count as changes
+    def normalise(values: pd.Series, column: str) -> pd.Series:
+        if column.endswith(('_rating', '_accuracy')):
+            return pd.to_numeric(values, errors='coerce').round(2).fillna(-1)
+        return values.astype(str).where(values.notna(), '')
+
+    value_columns = [column for column in PLAYER_GAME_COLUMNS if column not in ('player_name', 'game_url')]
+    changed = pd.Series(False, index=stored_games.index)
+    for column in value_columns:
+        changed |= normalise(stored_games[column], column) != normalise(stored_games[f'{column}_stored'], column)
+
+    return new_games, stored_games[changed][PLAYER_GAME_COLUMNS]
+
+# Function to load a player's downloaded games into the staging table
+def stage_player_games(player_name: str, df: pd.DataFrame, conn, batch_size: int = DB_INSERT_BATCH_SIZE) -> str:
+    """
+    Adds the given games to player_game_data_staging under a new run id. Only the run that staged 
+    the rows reads them, so the batches can be committed as they go.
+
+    Args:
+        player_name (str): The username of the chess player on Chess.com.
+        df (pd.DataFrame): The player's games with the PLAYER_GAME_COLUMNS columns.
+        conn: A pooled database connection (see `init_connection`).
+        batch_size (int): Number of rows per executemany call and commit.
+
+    Returns:
+        str: The run id to pass to `merge_staged_games`.
+    """
+    now = datetime.now()
+    cursor = conn.cursor()
+    # Leftovers of runs that crashed before merging or discarding their rows
+    cursor.execute("DELETE FROM player_game_data_staging WHERE player_name = ? AND staged_at < ?",
+                   (player_name, now - STAGING_MAX_AGE))
+    conn.commit()
+    cursor.close()
+
+    run_id = uuid.uuid4().hex
+    try:
+        insert_player_games(df, conn, batch_size, table='player_game_data_staging',
+                            extra_values={'run_id': run_id, 'staged_at': now})
+    except Exception:
+        conn.rollback()
+        discard_staged_games(run_id, conn)
+        raise
+    return run_id
+
+# Function to drop the rows a run staged
+def discard_staged_games(run_id: str, conn) -> None:
+    """
+    Deletes the rows of player_game_data_staging staged by `run_id`.
+
+    Args:
+        run_id (str): The run id returned by `stage_player_games`.
+        conn: A pooled database connection (see `init_connection`).
+    """
+    cursor = conn.cursor()
+    cursor.execute("DELETE FROM player_game_data_staging WHERE run_id = ?", (run_id,))
+    conn.commit()
+    cursor.close()
+
+# Function to move a player's staged games into player_game_data in one transaction
+def merge_staged_games(player_name: str, run_id: str, conn, replace: bool = False,
+                       archives: Optional[List[str]] = None) -> None:
+    """
+    Moves the games a run staged into player_game_data atomically: readers keep seeing the previous
+    games until the commit and the complete new set right after it, never an empty or half-written player.
+    If the merge fails, the run's staged rows are discarded.
+
+    Args:
+        player_name (str): The username of the chess player on Chess.com.
+        run_id (str): The run id returned by `stage_player_games`.
+        conn: A pooled database connection (see `init_connection`).
+        replace (bool): Swap the player's whole history for the staged games (full refresh, only for a complete
+                        download, see `replace_player_games`). Otherwise the staged games replace the stored
+                        games with the same URL and the rest are kept.
+        archives (Optional[List[str]]): The downloaded archive URLs, recorded with `set_last_synced_month`
+                                        in the same transaction.
+    """
+    columns = ', '.join(PLAYER_GAME_COLUMNS + ['last_updated'])
+    cursor = conn.cursor()
+    try:
+        if replace:
+            cursor.execute("DELETE FROM player_game_data WHERE player_name = ?", (player_name,))
+        else:
+            cursor.execute("""
+                DELETE FROM player_game_data
+                WHERE player_name = ? AND game_url IN (SELECT game_url FROM player_game_data_staging WHERE run_id = ?)
+            """, (player_name, run_id))
+        cursor.execute(f"""
+            INSERT INTO player_game_data ({columns})
+            SELECT {columns} FROM player_game_data_staging WHERE run_id = ?
+        """, (run_id,))
+        cursor.execute("DELETE FROM player_game_data_staging WHERE run_id = ?", (run_id,))
+
+        if archives:
+            set_last_synced_month(player_name, archives, conn, commit=False)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        discard_staged_games(run_id, conn)
+        raise
+    finally:
+        cursor.close()
+
+# Function to merge games into player_game_data keyed on (player_name, game_url)
+def upsert_player_games(df: pd.DataFrame, conn, batch_size: int = DB_INSERT_BATCH_SIZE,
+                        archives: Optional[List[str]] = None) -> Tuple[int, int]:
+    """
+    Inserts the games that are not stored yet and updates stored games whose values changed, 
+    matching rows on (player_name, game_url). Unchanged games are left untouched.
+
+    The new and changed games are staged first and then merged per player in one transaction 
+    (see `merge_staged_games`), so readers see either all of them or none.
+
+    Args:
+        df (pd.DataFrame): Games with the PLAYER_GAME_COLUMNS columns.
+        conn: A pooled database connection (see `init_connection`).
+        batch_size (int): Number of rows per executemany call and commit.
+        archives (Optional[List[str]]): The downloaded archive URLs, recorded for every player in the 
+                                        same transaction as their games.
+
+    Returns:
+        Tuple[int, int]: The number of inserted and updated games.
+    """
+    if df.empty:
+        return 0, 0
+
+    new_games, changed_games = get_changed_games(df, conn)
+
+    for player_name in df['player_name'].unique():
+        player_games = pd.concat([new_games[new_games['player_name'] == player_name],
+                                  changed_games[changed_games['player_name'] == player_name]])
+        run_id = stage_player_games(player_name, player_games, conn, batch_size)
+        merge_staged_games(player_name, run_id, conn, archives=archives)
+
+    return len(new_games), len(changed_games)
+
+# Function to swap a player's stored games for a freshly downloaded full history
+def replace_player_games(player_name: str, df: pd.DataFrame, conn, batch_size: int = DB_INSERT_BATCH_SIZE,
+                         archives: Optional[List[str]] = None) -> int:
+    """
+    Stages the player's complete history and swaps it in for their stored games in one transaction
+    (see `merge_staged_games`). Games no longer returned by Chess.com are dropped.
+
+    Args:
+        player_name (str): The username of the chess player on Chess.com.
+        df (pd.DataFrame): The player's games with the PLAYER_GAME_COLUMNS columns.
+        conn: A pooled database connection (see `init_connection`).
+        batch_size (int): Number of rows per executemany call and commit.
+        archives (Optional[List[str]]): The downloaded archive URLs, recorded in the same transaction.
+
+    Returns:
+        int: The number of games now stored for the player.
+
+    Raises:
+        RuntimeError: If some archives of the download failed (`df.attrs['failed_archives']`). A partial 
+                      history would delete the stored games of the failed months, so nothing is replaced.
+    """
+    if df.attrs.get('failed_archives'):
+        raise RuntimeError(f"Not replacing {player_name}'s games: {df.attrs['failed_archives']} monthly archive(s) "
+                           "could not be downloaded")
+    if df.empty:
+        return 0  # An empty download never replaces the stored games
+
+    df = df.drop_duplicates(subset=['player_name', 'game_url'], keep='last')
+    run_id = stage_player_games(player_name, df, conn, batch_size)
+    merge_staged_games(player_name, run_id, conn, replace=True, archives=archives)
+    return len(df)
+
+# Function to get the month (YYYY/MM) an archive URL covers
+def get_archive_month(archive_url: str) -> str:
+    """
+    Extracts the month from a Chess.com monthly archive URL.
+
+    Args:
+        archive_url (str): An archive URL ending in '/games/YYYY/MM'.
+
+    Returns:
+        str: The archive month as 'YYYY/MM', which sorts chronologically as a string.
+    """
+    return '/'.join(archive_url.rstrip('/').split('/')[-2:])
+
+def get_last_completed_month() -> str:
+    """
+    Returns the most recent month whose archive can no longer change (the previous UTC month).
+
+    Returns:
+        str: The month as 'YYYY/MM'.
+    """
+    first_of_month = datetime.utcnow().replace(day=1)
+    return (first_of_month - timedelta(days=1)).strftime('%Y/%m')
+
+def select_archives_to_sync(archives: List[str], last_synced_month: Optional[str]) -> List[str]:
+    """
+    Keeps only the archives that are newer than the last completed month already stored.
+
+    Args:
+        archives (List[str]): All archive URLs of the player.
+        last_synced_month (Optional[str]): Last completed month stored for the player ('YYYY/MM'), or None.
+
+    Returns:
+        List[str]: The archives still to download (everything when nothing was synced yet).
+    """
+    if not last_synced_month:
+        return archives
+    return [url for url in archives if get_archive_month(url) > last_synced_month]
+
+def get_synced_archives(archives: List[str], failed_archives: List[str]) -> List[str]:
+    """
+    Keeps only the archives that may be recorded with `set_last_synced_month` after a download. The marker 
+    is a single month, so it must stay before the first month whose download failed, or that month would 
+    never be downloaded again.
+
+    Args:
+        archives (List[str]): The archive URLs that were downloaded.
+        failed_archives (List[str]): The archive URLs that could not be downloaded (see `ingest_archives`).
+
+    Returns:
+        List[str]: The archives older than the first failed one (all of them when none failed).
+    """
+    if not failed_archives:
+        return archives
+    first_failed_month = min(get_archive_month(url) for url in failed_archives)
+    return [url for url in archives if get_archive_month(url) < first_failed_month]
+
+def add_game_url_unique_index(engine: Engine) -> None:
+    """
+    Migration: removes duplicate (player_name, game_url) rows left by earlier refreshes (keeping the
+    most recently updated copy) and adds the unique index the upserts look games up by.
+    Does nothing once the index exists.
+
+    Args:
+        engine (Engine): The database engine.
+    """
+    index = next(index for index in player_game_data_table.indexes if index.name == 'ux_player_game_data_player_url')
+    if any(existing['name'] == index.name for existing in inspect(engine).get_indexes('player_game_data')):
+        return
+
+    with engine.begin() as connection:
+        if engine.dialect.name == 'mssql':
+            connection.execute(text("""
+                DELETE ranked FROM (
+                    SELECT ROW_NUMBER() OVER (PARTITION BY player_name, game_url ORDER BY last_updated DESC) AS row_num
+                    FROM player_game_data
+                ) AS ranked
+                WHERE ranked.row_num > 1
+            """))
+        else:  # SQLite (local testing)
+            connection.execute(text("""
+                DELETE FROM player_game_data
+                WHERE rowid NOT IN (SELECT MAX(rowid) FROM player_game_data GROUP BY player_name, game_url)
+            """))
+        index.create(connection)
+
+def add_staging_run_columns(engine: Engine) -> None:
+    """
+    Migration: recreates player_game_data_staging when it predates the run_id / staged_at columns.
+    The table only holds rows of refreshes in progress, so nothing is lost.
+    Does nothing once the columns exist.
+
+    Args:
+        engine (Engine): The database engine.
+    """
+    columns = [column['name'] for column in inspect(engine).get_columns('player_game_data_staging')]
+    if 'run_id' in columns:
+        return
+
+    player_game_data_staging_table.drop(engine)
+    player_game_data_staging_table.create(engine)
+
+def migrate_database() -> None:
+    """
+    Creates the missing tables and applies the schema changes the live extraction relies on.
+    Every step is idempotent and runs once per process.
+    """
+    global _db_migrated
+
+    if _db_migrated:
+        return
+
+    engine = get_engine()
+    db_metadata.create_all(engine, checkfirst=True)
+    add_game_url_unique_index(engine)
+    add_staging_run_columns(engine)
+    _db_migrated = True
+
+def get_last_synced_month(player_name: str, conn) -> Optional[str]:
+    """
+    Reads the last completed archive month stored for a player.
+
+    Args:
+        player_name (str): The username of the chess player on Chess.com.
+        conn: A pooled database connection (see `init_connection`).
+
+    Returns:
+        Optional[str]: The month as 'YYYY/MM', or None if the player was never synced.
+    """
+    migrate_database()
+    cursor = conn.cursor()
+    cursor.execute("SELECT last_archive_month FROM player_archive_sync WHERE player_name = ?", (player_name,))
+    row = cursor.fetchone()
+    return row[0] if row else None
+
+def set_last_synced_month(player_name: str, archives: List[str], conn, commit: bool = True) -> None:
+    """
+    Records the newest completed month among the downloaded archives, so it is never downloaded again.
+    The current month is never recorded because its archive still grows.
+
+    Args:
+        player_name (str): The username of the chess player on Chess.com.
+        archives (List[str]): The archive URLs that were just downloaded and saved (without failed 
+                              downloads, see `get_synced_archives`).
+        conn: A pooled database connection (see `init_connection`).
+        commit (bool): Commit right away (False when it is part of a larger transaction).
+    """
+    last_completed_month = get_last_completed_month()
+    completed = [get_archive_month(url) for url in archives if get_archive_month(url) <= last_completed_month]
+    if not completed:
+        return
+
+    month = max(completed)
+    cursor = conn.cursor()
+    cursor.execute("UPDATE player_archive_sync SET last_archive_month = ?, last_synced = ? WHERE player_name = ?",
+                   (month, datetime.now(), player_name))
+    if cursor.rowcount == 0:
+        cursor.execute("INSERT INTO player_archive_sync (player_name, last_archive_month, last_synced) VALUES (?, ?, ?)",
+                       (player_name, month, datetime.now()))
+    if commit:
+        conn.commit()
+
+def get_player_stats_live(player_name: str, conn) -> pd.DataFrame:
+    """
+    Retrieves chess player stats from the database if available; otherwise, 
+    fetches live data from Chess.com and stores it in the database.
+
+    Args:
+        player_name (str): The username of the chess player on Chess.com.
+        conn: A pooled database connection (see `init_connection`).
+
+    Returns:
+        pd.DataFrame: A DataFrame containing details for each game including URLs, dates, 
+                      time controls, ratings, results, and accuracies.
+    """
+    # Step 1: Check if player data already exists in the database
+    try:
+        existing_data = read_player_games(player_name, conn)
+        
+        if not existing_data.empty:
+            # Player data exists in the database, return the existing data
+            print(f"Data found for {player_name} in the database.")
+            return existing_data
+    except Exception as e:
+        print(f"Error fetching data from the database: {e}")
+
+    # Step 2: Player data not in the database, proceed with live data extraction
+    print(f"No data found for {player_name} in the database. Fetching from Chess.com...")
+    start_time = time.time()  # Record the start time
+
+    archives = get_archives(player_name)  # Fetch game archives
+
+    # Games are formatted archive by archive as they arrive (accuracies default to 0.0 to match the database datatype)
+    df = ingest_archives(archives, player_name, missing_accuracy=0.0)
+
+    # Step 3: Save the new data to the database (the player's games become visible all at once)
+    try:
+        migrate_database()
+        synced_archives = get_synced_archives(archives, df.attrs.get('failed_archive_urls', []))
+        replace_player_games(player_name, df, conn, archives=synced_archives)
+        print(f"{player_name}'s Data saved to the database.")
+    except Exception as e:
+        print(f"Error saving data to the database: {e}")
+
+    # Calculate and print execution time
+    end_time = time.time()  # Record the end time
+    execution_time = end_time - start_time
+    print(f'Time Taken: {execution_time} sec.')
+    print(f'HTTP latency: {get_http_latency_summary()}')
+
+    return df
+
+def update_player_stats_live(player_name: str, conn, incremental: bool = True, raise_errors: bool = False) -> pd.DataFrame:
+    """
+    Updates chess player stats in the database.
+
+    In incremental mode only the archives newer than the player's last completed month are downloaded
+    (the current month plus any new ones). Games are merged on (player_name, game_url): unseen games are 
+    inserted and stored games are only updated when they changed. A full refresh swaps the player's 
+    stored games for the downloaded history. Either way the changes are staged first and applied in 
+    one transaction, so the stored games are never empty or half-updated while the refresh runs.
+
+    Args:
+        player_name (str): The username of the chess player on Chess.com.
+        conn: A pooled database connection (see `init_connection`).
+        incremental (bool): Only fetch months that are not stored yet (default True). 
+                            If False, the player's whole history is downloaded.
+        raise_errors (bool): Re-raise database errors instead of only printing them (used by the refresh jobs).
+
+    Returns:
+        pd.DataFrame: A DataFrame containing details for each downloaded game including URLs, dates, 
+                      time controls, ratings, results, and accuracies.
+
+    Raises:
+        RuntimeError: If the archive list of a previously synced player comes back empty, or if some monthly 
+                      archives could not be downloaded (after the games that did arrive were saved).
+    """
+
+    # Step 1: Player data not in the database, proceed with live data extraction (runs on refresh workers, so no Streamlit calls)
+    print(f"Updating {player_name}'s data...")
+    start_time = time.time()  # Record the start time
+
+    archives = get_archives(player_name)  # Fetch game archives
+    last_synced_month = get_last_synced_month(player_name, conn)
+
+    if not archives and last_synced_month:
+        # A player with synced months always has archives, so an empty list means the request failed
+        raise RuntimeError(f"No monthly archives returned for {player_name}")
+
+    if incremental:
+        archives = select_archives_to_sync(archives, last_synced_month)
+        print(f"Syncing {len(archives)} archive(s) for {player_name} (last completed month: {last_synced_month}).")
+
+    # Games are formatted archive by archive as they arrive (accuracies default to 0.0 to match the database datatype)
+    df = ingest_archives(archives, player_name, missing_accuracy=0.0)
+
+    # Months that failed to download (and everything after them) must not be marked as synced
+    failed_archives = df.attrs.get('failed_archive_urls', [])
+    synced_archives = get_synced_archives(archives, failed_archives)
+
+    # Step 3: Save the new data to the database
+    try:
+        migrate_database()
+        if incremental:
+            # Re-fetched games (e.g. of the still open month) may already be stored, so merge instead of insert
+            inserted, updated = upsert_player_games(df, conn, archives=synced_archives)
+            print(f"{player_name}'s Data saved to the database ({inserted} new, {updated} updated games).")
+        else:
+            stored = replace_player_games(player_name, df, conn, archives=synced_archives)
+            print(f"{player_name}'s Data replaced in the database ({stored} games).")
+
+        if df.empty:
+            set_last_synced_month(player_name, synced_archives, conn)  # Months without games don't need another download
+    except Exception as e:
+        print(f"Error saving data to the database: {e}")
+        if raise_errors:
+            raise
+
+    if failed_archives:
+        # The games that did arrive are kept; the failed months are downloaded again by the next refresh
+        raise RuntimeError(f"{len(failed_archives)} monthly archive(s) of {player_name} could not be downloaded")
+
+    # Calculate and print execution time
+    end_time = time.time()  # Record the end time
+    execution_time = end_time - start_time
+    print(f'Time Taken: {execution_time} sec.')
+    print(f'HTTP latency: {get_http_latency_summary()}')
+
+    return df
+
+# Fetch all players from the database
+def get_all_players():
+    migrate_database()
+
+    with pooled_connection() as conn:
+        cursor = conn.cursor()
+        
+        # Query to get distinct player names
+        cursor.execute("SELECT DISTINCT player_name FROM player_game_data")
+        players = cursor.fetchall()
+        
+        player_list = [player[0] for player in players]
+        cursor.close()
+    
+    return player_list
+
+def delete_all_player_data():
+    migrate_database()
+
+    with pooled_connection() as conn:
+        cursor = conn.cursor()
+
+        # SQL query to delete all player data
+        delete_query = "DELETE FROM player_game_data"
+        
+        try:
+            # Execute the query
+            st.success(f"player data deleted successfully for {get_all_players()}.")
+            cursor.execute(delete_query)
+
+            # Forget the synced months too, otherwise the next incremental sync would skip them
+            cursor.execute("DELETE FROM player_archive_sync")
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            st.error(f"Error: {e}")
+        finally:
+            cursor.close()
+
+def fetch_data_from_sql(player_name: str, player_name_column: str = "player_name") -> pd.DataFrame:
+    """
+    Fetches player game data from an SQL database based on the provided player name.
+    
+    Args:
+        player_name (str): The name of the player whose data is being fetched.
+        player_name_column (str): The column name in the database that stores player names (default is "player_name").
+    
+    Returns:
+        pd.DataFrame: A pandas DataFrame containing the player's game data. If an error occurs, returns an empty DataFrame.
+    """
+    try:
+        # Borrow a connection from the pool, it is handed back after the query
+        with pooled_connection() as conn:
+            df = read_player_games(player_name, conn, player_name_column)
+        
+    except Exception as e:
+        print(f"Error fetching data: {e}")
+        df = pd.DataFrame()  # Return an empty DataFrame in case of error
+    
+    return df
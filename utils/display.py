@@ -0,0 +1,208 @@
+import streamlit as st
+import pandas as pd
+from typing import List, Union, Optional
+
+
+# Get Player Avatar:
+def get_player_avatar(profile_df: pd.DataFrame, username: str) -> Optional[str]:
+    """
+    Retrieve the avatar (profile photo URL) for the specified player from the profile DataFrame.
+
+    Parameters:
+    - username (str): The username of the player.
+    - profile_df (pd.DataFrame): The DataFrame containing player profile information.
+
+    Returns:
+    - str: The URL of the player's avatar if found.
+    - None: If the player is not found in the DataFrame.
+    """
+    # Filter the DataFrame to find the player's profile information
+    player_profile = profile_df[profile_df['username'] == username.lower()]
+    
+    # Check if the player was found
+    if not player_profile.empty:
+        # Return the profile photo URL
+        return player_profile.iloc[0]['recent_avatar_url']  # Adjust column name if different
+    else:
+        # Return None if the player was not found
+        return None
+
+def get_sr_player_avatar(sr_profile_df: pd.DataFrame, username: str) -> Union[str, None]:
+    """
+    Retrieve the avatar (profile photo URL) for the specified player from the profile DataFrame.
+
+    Parameters:
+    - username (str): The username of the player.
+    - profile_df (pd.DataFrame): The DataFrame containing player profile information.
+
+    Returns:
+    - str: The URL of the player's avatar if found.
+    - None: If the player is not found in the DataFrame.
+    """
+    # Filter the DataFrame to find the player's profile information
+    sr_player_profile = sr_profile_df[sr_profile_df['username'] == username]
+    
+    # Check if the player was found
+    if not sr_player_profile.empty:
+        # Return the profile photo URL
+        return sr_player_profile.iloc[0]['recent_avatar_url'].strip()  # Adjust column name if different
+    else:
+        # Return None if the player was not found
+        return '-'
+
+# Function to show al stats as color white:
+def  show_white_stats(total_games_white: int, white_win_ratio: float, white_draw_ratio: float, 
+                     white_loss_ratio: float, wins_as_white: int, draws_as_white: int, 
+                     loss_as_white: int, white_most_accurate_openings: List[str], 
+                     white_most_played_openings: List[str]) -> None:
+    """
+    Displays statistics for a player playing as White in a Streamlit app.
+
+    Parameters:
+    - total_games_white (int): Total number of games played as White.
+    - white_win_ratio (float): Win ratio as a percentage.
+    - white_draw_ratio (float): Draw ratio as a percentage.
+    - white_loss_ratio (float): Loss ratio as a percentage.
+    - wins_as_white (int): Total wins as White.
+    - draws_as_white (int): Total draws as White.
+    - loss_as_white (int): Total losses as White.
+    - white_most_accurate_openings (List[str]): List of most accurate openings played as White.
+    - white_most_played_openings (List[str]): List of most played openings as White.
+    """
+    st.session_state.tab_selected = 'white'
+    
+    #Show Player as White Stats:
+    with st.container(height = 375):
+        st.markdown(f"""
+        <div class="metrics-row">
+            <div class="metric-container-spec">
+                <div class="metric-label">◻ Total Games</div>
+                <div class="metric-value">{total_games_white}</div>
+            </div>
+            <div class="metric-container-spec">
+                <div class="metric-label">◻ Total Wins</div>
+                <div class="metric-value">{wins_as_white}</div>
+                <div class="metric-delta-grey">{white_win_ratio}%</div>
+            </div>
+            <div class="metric-container-spec">
+                <div class="metric-label">◻ Total Draws</div>
+                <div class="metric-value">{draws_as_white}</div>
+                <div class="metric-delta-grey">{white_draw_ratio}%</div>
+            </div>
+            <div class="metric-container-spec">
+                <div class="metric-label">◻ Total Losses</div>
+                <div class="metric-value">{loss_as_white}</div>
+                <div class="metric-delta-grey">{white_loss_ratio}%</div>
+            </div>
+        </div>
+    """, unsafe_allow_html=True)
+
+        
+        # st.write()
+        st.divider()
+        #Display Most Accurate and Most Played openings:
+
+        # Define emojis for medals
+        gold_medal = "🥇"
+        silver_medal = "🥈"
+        bronze_medal = "🥉"
+
+        col1, col2, col3 = st.columns([3.5,1,2])
+
+        with col1:
+            st.markdown('**Most Accurate Openings White**', unsafe_allow_html=True)
+            st.markdown(f"{gold_medal} {white_most_accurate_openings[0]}")
+            st.markdown(f"{silver_medal} {white_most_accurate_openings[1]}")
+            st.markdown(f"{bronze_medal} {white_most_accurate_openings[2]}")
+
+        # with col2: #??????
+            #     st.markdown(
+            #         """
+            #         <style>
+            #         .divider {
+            #             width: 3px;
+            #             background-color: #00000;
+            #             height: 100%;
+            #             display: inline-block;
+            #             vertical-align: middle;
+            #         }
+            #         </style>
+            #         <div class="divider"></div>
+            #         """,
+            #         unsafe_allow_html=True
+            #     )
+
+        with col3:
+            st.markdown('**Most Played Openings White**')
+            st.markdown(f"{gold_medal} {white_most_played_openings[0]}")
+            st.markdown(f"{silver_medal} {white_most_played_openings[1]}")
+            st.markdown(f"{bronze_medal} {white_most_played_openings[2]}")
+
+def show_black_stats(total_games_black: int, black_win_ratio: float, black_draw_ratio: float, 
+                     black_loss_ratio: float, wins_as_black: int, draws_as_black: int, 
+                     loss_as_black: int, black_most_accurate_openings: List[str], 
+                     black_most_played_openings: List[str]) -> None:
+    """
+    Displays statistics for a player playing as Black in a Streamlit app.
+
+    Parameters:
+    - total_games_black (int): Total number of games played as Black.
+    - black_win_ratio (float): Win ratio as a percentage.
+    - black_draw_ratio (float): Draw ratio as a percentage.
+    - black_loss_ratio (float): Loss ratio as a percentage.
+    - wins_as_black (int): Total wins as Black.
+    - draws_as_black (int): Total draws as Black.
+    - loss_as_black (int): Total losses as Black.
+    - black_most_accurate_openings (List[str]): List of most accurate openings played as Black.
+    - black_most_played_openings (List[str]): List of most played openings as Black.
+    """
+    with st.container(height = 450):
+            st.markdown(f"""
+            <div class="metrics-row">
+                <div class="metric-container-spec">
+                    <div class="metric-label">◼ Total Games</div>
+                    <div class="metric-value">{total_games_black}</div>
+                </div>
+                <div class="metric-container-spec">
+                    <div class="metric-label">◼ Total Wins</div>
+                    <div class="metric-value">{wins_as_black}</div>
+                    <div class="metric-delta-grey">{black_win_ratio}%</div>
+                </div>
+                <div class="metric-container-spec">
+                    <div class="metric-label">◼ Total Draws</div>
+                    <div class="metric-value">{draws_as_black}</div>
+                    <div class="metric-delta-grey">{black_draw_ratio}%</div>
+                </div>
+                <div class="metric-container-spec">
+                    <div class="metric-label">◼ Total Losses</div>
+                    <div class="metric-value">{loss_as_black}</div>
+                    <div class="metric-delta-grey">{black_loss_ratio}%</div>
+                </div>
+            </div>
+        """, unsafe_allow_html=True)
+
+            st.divider()
+
+            #Display Most Accurate and Most Played openings:
+
+            # Define emojis for medals
+            gold_medal = "🥇"
+            silver_medal = "🥈"
+            bronze_medal = "🥉"
+
+            col1, col2, col3 = st.columns([3.5,1,2])
+
+            with col1:
+                st.markdown('**Most Accurate Openings Black**', unsafe_allow_html=True)
+                st.markdown(f"{gold_medal} {black_most_accurate_openings[0]}")
+                st.markdown(f"{silver_medal} {black_most_accurate_openings[1]}")
+                st.markdown(f"{bronze_medal} {black_most_accurate_openings[2]}")
+            
+            with col2:
+                ''
+            
+            with col3:
+                st.markdown('**Most Played Openings Black**')
+                st.markdown(f"{gold_medal} {black_most_played_openings[0]}")
+                st.markdown(f"{silver_medal} {black_most_played_openings[1]}")
+                st.markdown(f"{bronze_medal} {black_most_played_openings[2]}")
@@ -0,0 +1,731 @@
+import requests
+import streamlit as st
+from datetime import datetime
+import pandas as pd
+import os
+import json
+import hashlib
+import time
+import threading
+from collections import deque
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+from dataclasses import dataclass
+from typing import List, Dict, Union, Optional, Tuple, Iterator, Callable
+
+from utils.parse import get_opening_name, parse_pgn_headers
+
+
+headers = {'User-Agent':'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/127.0.0.0 Safari/537.36'}
+
+# Archive download settings (Chess.com answers parallel bursts with 429s, so keep both caps modest). The request 
+# rate is shared by every Chess.com call of the process, retries included (see api_rate_limiter):
+MAX_ARCHIVE_WORKERS = 8
+ARCHIVE_REQUESTS_PER_SECOND = 10.0
+
+# Shared HTTP client settings for all Chess.com calls:
+HTTP_TIMEOUT = 15  # seconds
+HTTP_MAX_RETRIES = 4
+HTTP_BACKOFF_FACTOR = 0.5  # seconds, doubled on every retry
+HTTP_MAX_RETRY_AFTER = 60  # seconds, upper bound for a server supplied Retry-After
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# On-disk copies of archive responses, revalidated with ETag / Last-Modified (least recently used ones are 
+# deleted once the directory outgrows ARCHIVE_CACHE_MAX_BYTES, see prune_archive_cache):
+ARCHIVE_CACHE_DIR = os.environ.get('ARCHIVE_CACHE_DIR', os.path.join('.cache', 'archives'))
+ARCHIVE_CACHE_MAX_BYTES = int(os.environ.get('ARCHIVE_CACHE_MAX_BYTES', 256 * 1024 * 1024))
+
+# Chess.com player profiles are requested at most once per TTL (see load_player_profile):
+PROFILE_CACHE_TTL = 600  # seconds
+PROFILE_CACHE_ENTRIES = 500
+
+_http_session = None
+_http_session_lock = threading.Lock()
+http_latency_log = deque(maxlen=1000)  # (url, status_code, latency in seconds) of the most recent requests
+_archive_cache_bytes = None  # size of ARCHIVE_CACHE_DIR, measured on the first write
+_archive_cache_lock = threading.Lock()
+
+#-------------------------------------------------------------- HTTP Client : --------------------------------------------------------------#
+
+def get_http_session() -> requests.Session:
+    """
+    Returns the process-wide requests session used for every Chess.com call.
+
+    The session keeps connections alive (one pool per host, sized for the archive workers)
+    and sends the module-level `headers` with each request.
+
+    Returns:
+        requests.Session: The shared session.
+    """
+    global _http_session
+
+    with _http_session_lock:
+        if _http_session is None:
+            session = requests.Session()
+            session.headers.update(headers)
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=MAX_ARCHIVE_WORKERS, max_retries=0)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _http_session = session
+        return _http_session
+
+def get_retry_delay(response: Optional[requests.Response], attempt: int) -> float:
+    """
+    Works out how long to wait before retrying a failed request.
+
+    Args:
+        response (Optional[requests.Response]): The failed response, or None if the request raised.
+        attempt (int): Zero-based number of the attempt that just failed.
+
+    Returns:
+        float: The server's Retry-After (seconds or HTTP date) when present, otherwise exponential backoff.
+    """
+    retry_after = response.headers.get("Retry-After") if response is not None else None
+
+    if retry_after:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+                delay = (retry_at - datetime.now(retry_at.tzinfo)).total_seconds()
+            except (TypeError, ValueError):
+                delay = None
+        if delay is not None:
+            return min(max(delay, 0.0), HTTP_MAX_RETRY_AFTER)
+
+    return HTTP_BACKOFF_FACTOR * (2 ** attempt)
+
+class HostRateLimiter:
+    """
+    Thread-safe limiter that spaces out requests to the same host.
+
+    Each call to `wait` reserves the next free slot for the URL's host and sleeps until it is due,
+    so any number of worker threads together never exceed `requests_per_second` against one host.
+    """
+
+    def __init__(self, requests_per_second: float) -> None:
+        self.interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self._next_slot: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url: str) -> None:
+        if not self.interval:
+            return
+
+        host = urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.interval
+
+        delay = slot - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+# One limiter per process, so concurrent lookups and refresh workers share the per-host budget
+api_rate_limiter = HostRateLimiter(ARCHIVE_REQUESTS_PER_SECOND)
+
+def chess_api_get(url: str, extra_headers: Optional[Dict[str, str]] = None) -> Optional[requests.Response]:
+    """
+    GETs a Chess.com URL through the shared session, retrying 429/5xx responses and connection errors.
+
+    Every attempt waits for `api_rate_limiter` and its latency is recorded in `http_latency_log`.
+
+    Args:
+        url (str): The URL to fetch.
+        extra_headers (Optional[Dict[str, str]]): Headers to send in addition to the session defaults.
+
+    Returns:
+        Optional[requests.Response]: The final response (which may still be an error status once the
+        retries are used up), or None if no response could be obtained at all.
+    """
+    session = get_http_session()
+    response = None
+
+    for attempt in range(HTTP_MAX_RETRIES + 1):
+        api_rate_limiter.wait(url)
+        start_time = time.perf_counter()
+        try:
+            response = session.get(url, headers=extra_headers, timeout=HTTP_TIMEOUT)
+            status_code = response.status_code
+        except requests.RequestException as e:
+            response = None
+            status_code = None
+            print(f"Request to {url} failed: {e}")
+        http_latency_log.append((url, status_code, time.perf_counter() - start_time))
+
+        if response is not None and response.status_code not in RETRY_STATUS_CODES:
+            return response
+
+        if attempt < HTTP_MAX_RETRIES:
+            time.sleep(get_retry_delay(response, attempt))
+
+    return response
+
+def get_http_latency_summary() -> Dict[str, float]:
+    """
+    Summarises the latency of the recent requests recorded in `http_latency_log`.
+
+    Returns:
+        Dict[str, float]: Request count plus mean, 95th percentile and max latency in seconds.
+    """
+    latencies = sorted(latency for _, _, latency in list(http_latency_log))
+    if not latencies:
+        return {'requests': 0, 'mean': 0.0, 'p95': 0.0, 'max': 0.0}
+
+    return {
+        'requests': len(latencies),
+        'mean': sum(latencies) / len(latencies),
+        'p95': latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+        'max': latencies[-1],
+    }
+
+# Function to get monthly archives for a player
+def get_archives(player_name: str) -> List[str]:
+        """
+        Fetches the game archives of a player from the Chess.com API.
+
+        Args:
+            player_name (str): The username of the chess player on Chess.com.
+
+        Returns:
+            List[str]: A list of URLs representing the archives for the player.
+            If the request fails, returns an empty list.
+        """
+        
+        response = chess_api_get(f"https://api.chess.com/pub/player/{player_name}/games/archives")
+        if response is not None and response.status_code == 200:
+            archives = response.json().get('archives', [])
+            return archives
+        else:
+            print(f"Failed to retrieve data: {getattr(response, 'status_code', 'no response')}")
+            return []
+
+# Functions to keep archive responses on disk together with their validators
+def get_archive_cache_path(url: str) -> str:
+    """
+    Returns the cache file used for an archive URL.
+
+    Args:
+        url (str): The archive URL.
+
+    Returns:
+        str: Path of the JSON cache file inside ARCHIVE_CACHE_DIR.
+    """
+    return os.path.join(ARCHIVE_CACHE_DIR, hashlib.sha1(url.encode('utf-8')).hexdigest() + '.json')
+
+def read_archive_cache(url: str) -> Optional[Dict]:
+    """
+    Reads the cached response of an archive URL.
+
+    Args:
+        url (str): The archive URL.
+
+    Returns:
+        Optional[Dict]: A dictionary with 'etag', 'last_modified' and 'games', or None if nothing 
+        (readable) is cached.
+    """
+    try:
+        with open(get_archive_cache_path(url), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def write_archive_cache(url: str, etag: Optional[str], last_modified: Optional[str], games: List[Dict]) -> None:
+    """
+    Stores an archive response and its validators. The file is written atomically so concurrent
+    readers never see a partial entry.
+
+    Args:
+        url (str): The archive URL.
+        etag (Optional[str]): The response's ETag header.
+        last_modified (Optional[str]): The response's Last-Modified header.
+        games (List[Dict]): The games of the archive.
+    """
+    global _archive_cache_bytes
+
+    path = get_archive_cache_path(url)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(ARCHIVE_CACHE_DIR, exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'url': url, 'etag': etag, 'last_modified': last_modified, 'games': games}, f)
+        size = os.path.getsize(tmp_path)
+        replaced = os.path.getsize(path) if os.path.exists(path) else 0
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"Could not cache {url}: {e}")
+        return
+
+    with _archive_cache_lock:
+        if _archive_cache_bytes is None:
+            _archive_cache_bytes = get_archive_cache_size()
+        else:
+            _archive_cache_bytes += size - replaced
+        if _archive_cache_bytes > ARCHIVE_CACHE_MAX_BYTES:
+            _archive_cache_bytes = prune_archive_cache()
+
+def get_archive_cache_size() -> int:
+    """
+    Returns the total size in bytes of the cached archives.
+    """
+    try:
+        with os.scandir(ARCHIVE_CACHE_DIR) as entries:
+            return sum(entry.stat().st_size for entry in entries if entry.name.endswith('.json'))
+    except OSError:
+        return 0
+
+def prune_archive_cache(max_bytes: Optional[int] = None) -> int:
+    """
+    Deletes the least recently used cached archives (oldest modification time; a revalidated archive is 
+    touched) until the cache takes at most 90% of `max_bytes`, so not every following write prunes again.
+
+    Args:
+        max_bytes (Optional[int]): The size limit, defaults to ARCHIVE_CACHE_MAX_BYTES.
+
+    Returns:
+        int: The size in bytes of the cached archives that are left.
+    """
+    max_bytes = ARCHIVE_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+    try:
+        with os.scandir(ARCHIVE_CACHE_DIR) as entries:
+            files = [(entry.stat().st_mtime, entry.stat().st_size, entry.path) for entry in entries if entry.name.endswith('.json')]
+    except OSError:
+        return 0
+
+    total = sum(size for _, size, _ in files)
+    for _, size, path in sorted(files):
+        if total <= max_bytes * 0.9:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            pass  # Already removed by another process
+    return total
+
+# Function to get games from a monthly archive
+def get_games_from_archive(url: str) -> List[Dict]:
+    """
+    Fetches games from a specific archive URL provided by the Chess.com API.
+
+    Responses are cached on disk; a cached archive is revalidated with If-None-Match / If-Modified-Since
+    and served from the local copy when Chess.com answers 304 Not Modified.
+
+    Args:
+        url (str): The URL of the Chess.com archive to fetch games from.
+
+    Returns:
+        List[Dict]: A list of game data in dictionary format. 
+        If the request fails, returns an empty list.
+    """
+    return download_archive(url)[0] or []
+
+# Function to get games from a monthly archive, along with the size of the download:
+def download_archive(url: str) -> Tuple[Optional[List[Dict]], int]:
+    """
+    Same as `get_games_from_archive`, but also returns how many bytes were downloaded.
+
+    Args:
+        url (str): The URL of the Chess.com archive to fetch games from.
+
+    Returns:
+        Tuple[Optional[List[Dict]], int]: The games (None if the request fails) and the size of the response 
+        body (0 when the cached copy was still valid).
+    """
+    cached = read_archive_cache(url)
+
+    conditional_headers = {}
+    if cached:
+        if cached.get('etag'):
+            conditional_headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            conditional_headers['If-Modified-Since'] = cached['last_modified']
+
+    response = chess_api_get(url, conditional_headers or None)
+
+    if response is not None and response.status_code == 304 and cached:
+        try:
+            os.utime(get_archive_cache_path(url))  # Recently used, so pruned last
+        except OSError:
+            pass
+        return cached.get('games', []), 0
+    elif response is not None and response.status_code == 200:
+        games = response.json().get('games', [])
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag or last_modified:
+            write_archive_cache(url, etag, last_modified, games)
+        return games, len(response.content)
+    else:
+        print(f"Failed to retrieve data from {url}: {getattr(response, 'status_code', 'no response')}")
+        return None, 0
+
+# Function to download many monthly archives in parallel:
+def fetch_archives_concurrently(archive_urls: List[str], max_workers: int = MAX_ARCHIVE_WORKERS) -> List[List[Dict]]:
+    """
+    Downloads the games of several archive URLs with a bounded thread pool. Requests are rate limited 
+    per host by `chess_api_get`.
+
+    Args:
+        archive_urls (List[str]): Archive URLs as returned by `get_archives`.
+        max_workers (int): Maximum number of archives downloaded at the same time.
+
+    Returns:
+        List[List[Dict]]: The games of each archive, in the same order as `archive_urls`.
+    """
+    return [games or [] for games, _ in iter_archives_concurrently(archive_urls, max_workers)]
+
+# Function to download archives in parallel and hand them over one at a time:
+def iter_archives_concurrently(archive_urls: List[str], max_workers: int = MAX_ARCHIVE_WORKERS) -> Iterator[Tuple[List[Dict], int]]:
+    """
+    Like `fetch_archives_concurrently`, but yields each archive as soon as it (and every archive before it) 
+    has arrived.
+
+    Only about 2 x max_workers archives are downloading or waiting to be consumed at any time, so memory 
+    stays bounded by a few months of games however long the player's history is.
+
+    Args:
+        archive_urls (List[str]): Archive URLs as returned by `get_archives`.
+        max_workers (int): Maximum number of archives downloaded at the same time.
+
+    Yields:
+        Tuple[Optional[List[Dict]], int]: The games of each archive (None if its download failed) and the bytes 
+        downloaded for it (see `download_archive`), in the same order as `archive_urls`.
+    """
+    if not archive_urls:
+        return
+
+    def fetch(url: str) -> Tuple[Optional[List[Dict]], int]:
+        games, size = download_archive(url)
+        if games is not None and not isinstance(games, list):
+            games = []
+        return games, size
+
+    workers = max(1, min(max_workers, len(archive_urls)))
+    remaining = iter(archive_urls)
+
+    # Futures are consumed in submission order, which keeps games in archive (chronological) order
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = deque(executor.submit(fetch, url) for url in islice(remaining, 2 * workers))
+        while pending:
+            archive = pending.popleft().result()
+            next_url = next(remaining, None)
+            if next_url is not None:
+                pending.append(executor.submit(fetch, next_url))
+            yield archive
+
+#-------------------------------------------------------------- Game Ingestion : --------------------------------------------------------------#
+
+# Number of games packed into one DataFrame chunk by GameColumnBuffer
+GAME_CHUNK_SIZE = 5000
+
+# Extracting the relevant attributes of one game:
+def format_game(game: Dict, player_name: Optional[str] = None, missing_accuracy: Optional[float] = None) -> Dict:
+    """
+    Extracts the stored attributes of one game dictionary returned by the Chess.com archive API.
+
+    The PGN is only read for its tags (date and opening) and is not kept.
+
+    Args:
+        game (Dict): A game of an archive.
+        player_name (Optional[str]): If given, added as a 'player_name' column (as stored in the database).
+        missing_accuracy (Optional[float]): Value used when the game has no accuracy (0.0 for the database).
+
+    Returns:
+        Dict: The game's URL, date, time control/class, variant, opening and both sides' rating, result, 
+              username and accuracy.
+    """
+    headers = parse_pgn_headers(game.get("pgn"))
+    white, black, accuracies = game.get("white", {}), game.get("black", {}), game.get("accuracies", {})
+
+    game_data = {} if player_name is None else {"player_name": player_name}
+    game_data.update({
+        "game_url": game.get("url"),
+        "game_date": headers.get('Date'),
+        "game_time_control": game.get("time_control"),
+        "game_time_class": game.get("time_class"),
+        "game_variant": game.get("rules"),
+        "opening": get_opening_name(headers.get('ECOUrl')),
+        "white_rating": white.get("rating"),
+        "white_result": white.get("result"),
+        "white_username": white.get("username"),
+        "white_accuracy": accuracies.get("white", missing_accuracy),
+        "black_rating": black.get("rating"),
+        "black_result": black.get("result"),
+        "black_username": black.get("username"),
+        "black_accuracy": accuracies.get("black", missing_accuracy)
+    })
+    return game_data
+
+class GameColumnBuffer:
+    """
+    Collects formatted games column by column and packs every `chunk_size` games into a DataFrame chunk,
+    so at most one chunk of games is held as Python lists.
+    """
+
+    def __init__(self, chunk_size: int = GAME_CHUNK_SIZE):
+        self.chunk_size = chunk_size
+        self.columns: Dict[str, List] = {}
+        self.rows = 0
+        self.chunks: List[pd.DataFrame] = []
+
+    def append(self, game_data: Dict) -> None:
+        if not self.columns:
+            self.columns = {column: [] for column in game_data}
+        for column, values in self.columns.items():
+            values.append(game_data.get(column))
+        self.rows += 1
+        if self.rows >= self.chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self.rows:
+            self.chunks.append(pd.DataFrame(self.columns))
+            self.columns = {column: [] for column in self.columns}
+            self.rows = 0
+
+    def to_frame(self) -> pd.DataFrame:
+        self.flush()
+        if not self.chunks:
+            return pd.DataFrame()
+        df = pd.concat(self.chunks, ignore_index=True) if len(self.chunks) > 1 else self.chunks[0]
+        self.chunks = []
+        return df
+
+# Progress of an archive download, reported after every archive:
+@dataclass
+class FetchProgress:
+    """How far `ingest_archives` has got."""
+    archives_total: int
+    archives_done: int = 0
+    archives_failed: int = 0
+    bytes_downloaded: int = 0
+    games_parsed: int = 0
+
+    @property
+    def fraction(self) -> float:
+        return self.archives_done / self.archives_total if self.archives_total else 1.0
+
+# Downloading and formatting the games of many archives:
+def ingest_archives(archive_urls: List[str], player_name: Optional[str] = None, missing_accuracy: Optional[float] = None,
+                    chunk_size: int = GAME_CHUNK_SIZE,
+                    on_progress: Optional[Callable[[FetchProgress], None]] = None) -> pd.DataFrame:
+    """
+    Streams the games of several archives into a DataFrame.
+
+    Each archive is formatted as soon as it arrives and then dropped, so the raw game dictionaries 
+    (and their PGNs) of the whole history are never held at the same time.
+
+    Args:
+        archive_urls (List[str]): Archive URLs as returned by `get_archives`.
+        player_name (Optional[str]): See `format_game`.
+        missing_accuracy (Optional[float]): See `format_game`.
+        chunk_size (int): Games per DataFrame chunk (see `GameColumnBuffer`).
+        on_progress (Optional[Callable[[FetchProgress], None]]): Called before the first archive and after 
+            every archive, from the calling thread (so it may update Streamlit elements).
+
+    Returns:
+        pd.DataFrame: One row per game, in archive order. `attrs['failed_archives']` counts the archives that 
+        could not be downloaded (their games are missing) and `attrs['failed_archive_urls']` lists them.
+    """
+    buffer = GameColumnBuffer(chunk_size)
+    progress = FetchProgress(archives_total=len(archive_urls))
+    failed_archive_urls = []
+    if on_progress:
+        on_progress(progress)
+
+    for url, (games, size) in zip(archive_urls, iter_archives_concurrently(archive_urls)):
+        if games is None:
+            progress.archives_failed += 1
+            failed_archive_urls.append(url)
+            games = []
+        for game in games:
+            if isinstance(game, dict):  # Ensure each game is a dictionary
+                buffer.append(format_game(game, player_name, missing_accuracy))
+                progress.games_parsed += 1
+
+        progress.archives_done += 1
+        progress.bytes_downloaded += size
+        if on_progress:
+            on_progress(progress)
+
+    df = buffer.to_frame()
+    df.attrs['failed_archives'] = progress.archives_failed
+    df.attrs['failed_archive_urls'] = failed_archive_urls
+    return df
+
+# Extracting all stats from game_data(JSON):
+def get_player_stats(player_name: str, on_progress: Optional[Callable[[FetchProgress], None]] = None,
+                     recent_archives: Optional[int] = None) -> pd.DataFrame:
+    """
+    Retrieves and processes all archived chess games for a specific player from Chess.com, 
+    extracting relevant game statistics.
+
+    Args:
+        player_name (str): The username of the chess player on Chess.com.
+        on_progress (Optional[Callable[[FetchProgress], None]]): Receives download progress (see `ingest_archives`).
+        recent_archives (Optional[int]): Only download this many of the most recent monthly archives.
+
+    Returns:
+        pd.DataFrame: A DataFrame containing details for each game including URLs, dates, 
+                      time controls, ratings, results, and accuracies.
+    """
+
+    # Main script
+    start_time = time.time()  # Record the start time
+
+    archives = get_archives(player_name)
+    if recent_archives:
+        archives = archives[-recent_archives:]
+
+    # Games are formatted archive by archive as they arrive
+    df = ingest_archives(archives, on_progress=on_progress)
+
+    # Calculate and print execution time
+    end_time = time.time()  # Record the end time
+    execution_time = end_time - start_time
+
+    print(f'Time Taken: {execution_time} sec.')
+    print(f'HTTP latency: {get_http_latency_summary()}')
+    
+    return df
+
+def get_player_profile(username: str) -> Optional[Dict]:
+    """
+    Fetches the player profile data from Chess.com using the player's username.
+
+    Args:
+        username (str): The Chess.com username of the player.
+
+    Returns:
+        Optional[Dict]: A dictionary containing the player's profile data if the request is successful, 
+                        otherwise None.
+    """
+    url = f'https://api.chess.com/pub/player/{username}'
+    response = chess_api_get(url)
+    
+    # Check if the response is successful
+    if response is not None and response.status_code == 200:
+        try:
+            return response.json()
+        except ValueError:
+            print(f"Error: Invalid JSON response for {username}")
+            return None
+    else:
+        print(f"Error: Received status code {getattr(response, 'status_code', 'no response')} for {username}")
+        return None
+
+# Player profile as shown on the pages:
+@dataclass(frozen=True)
+class PlayerProfile:
+    """The fields of a Chess.com player profile the app uses."""
+    username: str = ''
+    name: str = ''
+    title: str = ''
+    avatar: str = ''
+    player_id: Union[int, str] = ''
+    url: str = ''
+    followers: Union[int, str] = ''
+    country: str = ''
+    location: str = ''
+    last_online: Union[int, str] = ''
+    joined: Union[int, str] = ''
+    status: str = ''
+    is_streamer: bool = False
+    verified: bool = False
+    twitch_url: str = ''
+
+    @classmethod
+    def from_api(cls, info: Dict) -> 'PlayerProfile':
+        return cls(**{name: info.get(name, default.default) for name, default in cls.__dataclass_fields__.items()})
+
+    @property
+    def country_code(self) -> str:
+        """Two-letter country code from the profile's country URL (e.g. '.../country/IN' -> 'IN')."""
+        return self.country.split('country/')[-1]
+
+# Function to get a player's profile, memoised for PROFILE_CACHE_TTL:
+@st.cache_data(show_spinner=False, ttl=PROFILE_CACHE_TTL, max_entries=PROFILE_CACHE_ENTRIES)
+def fetch_player_profile(username: str) -> PlayerProfile:
+    """
+    Fetches and caches a player's profile. Raises LookupError (which st.cache_data does not cache) 
+    if Chess.com does not return it, so a failed request is retried on the next call.
+    """
+    info = get_player_profile(username)
+    if not info:
+        raise LookupError(f"No Chess.com profile for {username}")
+    return PlayerProfile.from_api(info)
+
+def load_player_profile(username: str) -> Optional[PlayerProfile]:
+    """
+    Returns the profile of a player, requesting it from Chess.com at most once per PROFILE_CACHE_TTL.
+
+    Args:
+        username (str): The Chess.com username of the player.
+
+    Returns:
+        Optional[PlayerProfile]: The player's profile, or None if it could not be retrieved.
+    """
+    try:
+        return fetch_player_profile(username.strip().lower())
+    except LookupError:
+        return None
+
+def get_player_info(username: str) -> pd.DataFrame:
+    """
+    Retrieves the player's profile information from Chess.com and formats it into a DataFrame.
+
+    Args:
+        username (str): The Chess.com username of the player.
+
+    Returns:
+        pd.DataFrame: A DataFrame containing the player's information, including avatar, ID, 
+                      URL, name, title, followers, country, and other relevant details.
+    """
+    df = []
+    
+    profile = load_player_profile(username)  # Get the player's (cached) profile data
+
+    if profile:
+
+        player_info = {
+            'Avatar': profile.avatar,
+            'ID': profile.player_id,
+            'URL': profile.url,
+            'Profile': profile.url,
+            'Name': profile.name,
+            'Username': profile.username,
+            'Title': profile.title,
+            'Followers': profile.followers,
+            'Country': profile.country,
+            'Location': profile.location,
+            'Last Online': profile.last_online,
+            'Joined': profile.joined,
+            'Status': profile.status,
+            'Is Streamer': profile.is_streamer,
+            'Verified': profile.verified,
+            'Twitch URL': profile.twitch_url,
+        }
+
+        df.append(player_info)  # Append to the DataFrame list
+
+    # Return the DataFrame
+    return pd.DataFrame(df)
+
+# Function to get country code from country URL
+def get_country_code(country_url: str) -> str:
+    """
+    Extract the country code from a given URL.
+
+    Parameters:
+    country_url (str): The URL containing the country code.
+
+    Returns:
+    str: The extracted country code.
+    """
+    return country_url.split('/')[-1]
@@ -0,0 +1,103 @@
+from datetime import datetime
+import pandas as pd
+import re
+from typing import Dict, Union, Optional
+
+
+# Formatting value in proper date format:
+def convert_to_date(value: Union[int, float, str]) -> str:
+    """
+    Converts a Unix timestamp or date string to a formatted 'dd-mm-yyyy' date string.
+
+    Args:
+        value (Union[int, float, str]): The value to be converted, which can be a Unix timestamp (int or float) 
+                                        or a date string in the format '%Y-%m-%d %H:%M:%S'.
+
+    Returns:
+        str: The formatted date string in 'dd-mm-yyyy' format. 
+             If the value cannot be converted, returns the original value.
+    """
+    try:
+        if isinstance(value, (int, float)):  # Check if the value is numeric (Unix timestamp)
+            date = datetime.utcfromtimestamp(value).date()  # Extract only the date part
+        else:  # Assume it's already a string date
+            date = pd.to_datetime(value, format='%Y-%m-%d %H:%M:%S', errors='coerce').date()
+        
+        # Format the date as dd-mm-yyyy
+        return date.strftime('%d-%m-%Y')
+    except (ValueError, TypeError):
+        return value
+
+# One PGN tag pair per line, e.g. [Date "2024.01.31"] (escaped quotes inside the value are allowed)
+PGN_TAG_PATTERN = re.compile(r'^\[([A-Za-z0-9_]+)[ \t]+"([^"\\\n]*(?:\\.[^"\\\n]*)*)"\]', re.MULTILINE)
+
+# Extracting the tag section of a PGN:
+def parse_pgn_headers(pgn: Optional[str]) -> Dict[str, str]:
+    """
+    Parses the tag pairs (Date, ECO, ECOUrl, TimeControl, Termination, ...) at the top of a PGN.
+
+    Only the tag section is scanned (up to the first blank line), so the move text of long games
+    is never searched.
+
+    Args:
+        pgn (Optional[str]): The PGN string of a game.
+
+    Returns:
+        Dict[str, str]: Tag name to value. Empty if `pgn` is missing or has no tags; malformed lines are skipped.
+    """
+    if not isinstance(pgn, str):
+        return {}
+
+    header_end = pgn.find('\n\n')
+    if header_end == -1:
+        header_end = len(pgn)
+
+    headers = dict(PGN_TAG_PATTERN.findall(pgn, 0, header_end))
+    if pgn.find('\\', 0, header_end) != -1:
+        headers = {tag: value.replace('\\"', '"').replace('\\\\', '\\') for tag, value in headers.items()}
+    return headers
+
+# Start of the move suffix of an ECOUrl opening, e.g. '-2.Nf3' in 'Sicilian-Defense-2.Nf3'
+OPENING_MOVES_PATTERN = re.compile(r'-(\d)')
+
+# Extracting the opening name from an ECOUrl tag:
+def get_opening_name(eco_url: Optional[str]) -> Optional[str]:
+    """
+    Extracts the opening name from a Chess.com ECOUrl, dropping the move suffix.
+
+    Args:
+        eco_url (Optional[str]): e.g. 'https://www.chess.com/openings/Sicilian-Defense-2.Nf3'.
+
+    Returns:
+        Optional[str]: The opening name (e.g. 'Sicilian-Defense'), or None if there is no opening in the URL.
+    """
+    if not eco_url or 'openings/' not in eco_url:
+        return None
+    return OPENING_MOVES_PATTERN.split(eco_url.split('openings/', 1)[1], maxsplit=1)[0]
+
+# Extracting opening names from game_data(JSON):
+def get_openings_2(game: Dict) -> Optional[str]:
+    """
+    Extracts the opening name from a given chess game dictionary using the 'pgn' field.
+
+    Args:
+        game (Dict): A dictionary representing the chess game data, typically containing a 'pgn' key.
+
+    Returns:
+        Optional[str]: The name of the chess opening if found, otherwise None.
+    """
+    return get_opening_name(parse_pgn_headers(game.get("pgn")).get('ECOUrl'))
+
+# Extracting game_date from game_data(JSON):
+def get_date(pgn: Optional[str]) -> Optional[str]:
+    """
+    Extracts the date of a chess game from the PGN (Portable Game Notation) string.
+
+    Args:
+        pgn (Optional[str]): The PGN string containing the game details. 
+                             It should contain the '[Date ' field for the date extraction.
+
+    Returns:
+        Optional[str]: The date of the game in 'yyyy.mm.dd' format if found, otherwise None.
+    """
+    return parse_pgn_headers(pgn).get('Date')
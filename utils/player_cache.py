@@ -0,0 +1,358 @@
+import streamlit as st
+import pandas as pd
+import os
+import sqlite3
+import hashlib
+import time
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Optional, Tuple, Callable
+
+from utils.fetch import FetchProgress, get_player_stats
+
+
+# Persistent cache of live players' games, shared by all app processes (see PlayerCache):
+PLAYER_CACHE_DIR = os.path.join('.cache', 'players')
+PLAYER_CACHE_TTL = int(os.environ.get('PLAYER_CACHE_TTL', 6 * 3600))  # seconds before a player's games are refetched
+PLAYER_CACHE_MAX_BYTES = int(os.environ.get('PLAYER_CACHE_MAX_BYTES', 512 * 1024 * 1024))
+PLAYER_MEMORY_CACHE_ENTRIES = 20  # players kept in memory per process by st.cache_data
+
+# Progressive loading of live players: the most recent archives are shown first, the rest is fetched in the background
+LIVE_RECENT_ARCHIVES = 3
+LIVE_RECENT_TTL = 600  # seconds the recent-months view of a player is kept in memory (see load_recent_data)
+MAX_BACKFILL_WORKERS = 2  # players whose full history is downloaded at the same time
+
+_player_cache = None
+_player_cache_lock = threading.Lock()
+_backfill_executor = None
+_backfill_jobs = {}  # player -> Future of the background download of their full history
+_backfill_lock = threading.Lock()
+_recent_games = OrderedDict()  # (player, archives) -> (fetched at, games) of the recent-months view, oldest first
+_recent_games_lock = threading.Lock()
+
+#-------------------------------------------------------------- Player Cache : --------------------------------------------------------------#
+
+class PlayerCache:
+    """
+    Size-bounded on-disk cache of players' games that survives restarts and is shared by processes.
+
+    Every player's DataFrame is stored as one Parquet file in `cache_dir`. An SQLite index next to 
+    the files records each entry's size, creation time, TTL and last access, plus hit/miss/eviction 
+    counters. Index updates run in SQLite transactions, so several app processes can use the same 
+    directory. When the files outgrow `max_bytes`, the least recently used entries are evicted.
+    """
+
+    def __init__(self, cache_dir: str = PLAYER_CACHE_DIR, max_bytes: int = PLAYER_CACHE_MAX_BYTES,
+                 ttl: int = PLAYER_CACHE_TTL) -> None:
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        os.makedirs(cache_dir, exist_ok=True)
+        self.index_path = os.path.join(cache_dir, 'index.sqlite')
+        with self._transaction() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS entries (
+                    player TEXT PRIMARY KEY, file TEXT NOT NULL, bytes INTEGER NOT NULL,
+                    created_at REAL NOT NULL, ttl REAL NOT NULL, last_access REAL NOT NULL)
+            """)
+            conn.execute("CREATE TABLE IF NOT EXISTS stats (name TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+
+    @contextmanager
+    def _transaction(self):
+        conn = sqlite3.connect(self.index_path, timeout=30, isolation_level=None)
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            yield conn
+            conn.execute("COMMIT")
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def _count(self, conn, name: str, amount: int = 1) -> None:
+        conn.execute("INSERT INTO stats (name, value) VALUES (?, ?) "
+                     "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value", (name, amount))
+
+    def _remove_file(self, file: str) -> None:
+        try:
+            os.remove(os.path.join(self.cache_dir, file))
+        except OSError:
+            pass
+
+    def get(self, player: str) -> Optional[pd.DataFrame]:
+        """
+        Returns the cached games of `player`, or None if they are missing or older than their TTL.
+        The time the entry expires is set in `attrs['expires_at']`.
+        """
+        with self._transaction() as conn:
+            entry = conn.execute("SELECT file, created_at, ttl FROM entries WHERE player = ?", (player,)).fetchone()
+            if entry is None:
+                self._count(conn, 'misses')
+                return None
+
+            file, created_at, ttl = entry
+            if time.time() - created_at > ttl:
+                conn.execute("DELETE FROM entries WHERE player = ?", (player,))
+                self._count(conn, 'misses')
+                self._count(conn, 'expirations')
+                self._remove_file(file)
+                return None
+
+        # Read outside the transaction so other processes are not blocked; files are only ever replaced 
+        # atomically, and one evicted in the meantime simply counts as a miss
+        try:
+            df = pd.read_parquet(os.path.join(self.cache_dir, file))
+        except (OSError, ValueError) as e:
+            print(f"Could not read cached games of {player}: {e}")
+            df = None
+
+        with self._transaction() as conn:
+            if df is None:
+                self._count(conn, 'misses')
+            else:
+                df.attrs['expires_at'] = created_at + ttl
+                conn.execute("UPDATE entries SET last_access = ? WHERE player = ?", (time.time(), player))
+                self._count(conn, 'hits')
+        return df
+
+    def put(self, player: str, df: pd.DataFrame, ttl: Optional[float] = None) -> bool:
+        """
+        Stores the games of `player` (replacing older ones) and evicts least recently used players 
+        while the cache is larger than `max_bytes`.
+
+        Args:
+            player (str): The username of the player.
+            df (pd.DataFrame): The player's games.
+            ttl (Optional[float]): Seconds this entry stays valid, defaults to the cache's `ttl`.
+
+        Returns:
+            bool: Whether the games were stored.
+        """
+        file = f"{hashlib.sha1(player.encode('utf-8')).hexdigest()}.parquet"
+        path = os.path.join(self.cache_dir, file)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            df.to_parquet(tmp_path, index=False)
+            size = os.path.getsize(tmp_path)
+        except (OSError, ValueError, ImportError) as e:
+            print(f"Could not cache {player}'s games: {e}")
+            self._remove_file(os.path.basename(tmp_path))
+            return False
+
+        now = time.time()
+        with self._transaction() as conn:
+            # Replaced while the index is locked, so a reader never sees a file that does not match its entry
+            os.replace(tmp_path, path)
+            conn.execute("INSERT OR REPLACE INTO entries (player, file, bytes, created_at, ttl, last_access) "
+                         "VALUES (?, ?, ?, ?, ?, ?)", (player, file, size, now, self.ttl if ttl is None else ttl, now))
+            self._evict(conn)
+        return True
+
+    def _evict(self, conn) -> None:
+        total = conn.execute("SELECT COALESCE(SUM(bytes), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        # The entry just written has the newest access time, so it is only evicted if it alone is too big
+        for player, file, size in conn.execute("SELECT player, file, bytes FROM entries ORDER BY last_access").fetchall():
+            if total <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM entries WHERE player = ?", (player,))
+            self._remove_file(file)
+            self._count(conn, 'evictions')
+            total -= size
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the cache counters (hits, misses, expirations, evictions) and its current entries and bytes.
+        """
+        with self._transaction() as conn:
+            stats = {'hits': 0, 'misses': 0, 'expirations': 0, 'evictions': 0}
+            stats.update(dict(conn.execute("SELECT name, value FROM stats").fetchall()))
+            stats['entries'], stats['bytes'] = conn.execute("SELECT COUNT(*), COALESCE(SUM(bytes), 0) FROM entries").fetchone()
+        return stats
+
+# Function to check whether fetched games may be cached:
+def is_cacheable(df: pd.DataFrame) -> bool:
+    """
+    Returns False for games that should not outlive the request: an empty result (a failed archive list,
+    a 429 or a misspelt username look the same as a player without games) or one missing archives that
+    could not be downloaded (see `ingest_archives`).
+    """
+    return not df.empty and not df.attrs.get('failed_archives')
+
+# Function to get the process wide player cache:
+def get_player_cache() -> PlayerCache:
+    """
+    Returns the PlayerCache in PLAYER_CACHE_DIR, created on first use.
+    """
+    global _player_cache
+    if _player_cache is None:
+        with _player_cache_lock:
+            if _player_cache is None:
+                _player_cache = PlayerCache()
+    return _player_cache
+
+# Function to get the player cache counters:
+def get_player_cache_stats() -> Dict[str, int]:
+    """
+    Returns hits, misses, expirations and evictions of the player cache (across all processes sharing
+    PLAYER_CACHE_DIR), along with its number of entries and size in bytes.
+    """
+    return get_player_cache().stats()
+
+# Load Live Player Data:
+@st.cache_data(show_spinner=False, max_entries=PLAYER_MEMORY_CACHE_ENTRIES)
+def load_data(player: str) -> pd.DataFrame:
+    """
+    Load a live player's full history: from memory, else from the on-disk player cache. Downloading it 
+    is left to `start_history_backfill`.
+
+    The memory copy has no TTL of its own: it carries the expiry of its disk entry (`attrs['expires_at']`, 
+    see `PlayerCache.get`) and `load_data_progressively` drops it once that has passed, so a history is 
+    never served for longer than PLAYER_CACHE_TTL.
+
+    Takes no progress callback: st.cache_data replays the Streamlit calls made inside it on later hits, 
+    and elements created outside the function cannot be replayed.
+
+    Args:
+    player (str): The Chess.com username of the player.
+
+    Returns:
+    pd.DataFrame: A DataFrame containing the player's games (see `get_player_stats`).
+
+    Raises:
+    LookupError: If the history is not cached (st.cache_data does not keep exceptions, so the disk is 
+        checked again on the next call).
+    """
+    games = get_player_cache().get(player.lower())
+    if games is None:
+        raise LookupError(f"The history of {player} is not cached")
+    return games
+
+# Load the most recent months of a Live Player:
+def load_recent_data(player: str, recent_archives: int = LIVE_RECENT_ARCHIVES,
+                     on_progress: Optional[Callable[[FetchProgress], None]] = None) -> pd.DataFrame:
+    """
+    Load only a live player's most recent monthly archives from Chess.com. The result is kept in memory 
+    for LIVE_RECENT_TTL seconds (for PLAYER_MEMORY_CACHE_ENTRIES players), outside st.cache_data, so the 
+    download can report progress to Streamlit elements of the page.
+
+    Args:
+    player (str): The Chess.com username of the player.
+    recent_archives (int): Number of most recent monthly archives to download.
+    on_progress (Optional[Callable[[FetchProgress], None]]): Receives download progress (see `ingest_archives`).
+
+    Returns:
+    pd.DataFrame: A DataFrame containing the player's recent games (see `get_player_stats`), shared between 
+    sessions, so it must not be modified.
+    """
+    key = (player.lower(), recent_archives)
+    with _recent_games_lock:
+        entry = _recent_games.get(key)
+        if entry is not None and time.time() - entry[0] <= LIVE_RECENT_TTL:
+            return entry[1]
+
+    games = get_player_stats(key[0], on_progress, recent_archives=recent_archives)
+
+    if is_cacheable(games):
+        with _recent_games_lock:
+            _recent_games.pop(key, None)
+            _recent_games[key] = (time.time(), games)
+            while len(_recent_games) > PLAYER_MEMORY_CACHE_ENTRIES:
+                _recent_games.popitem(last=False)
+    return games
+
+# Function to download a player's full history in the background:
+def start_history_backfill(player: str) -> None:
+    """
+    Downloads the full history of `player` into the player cache on a background thread, unless 
+    that download is already running. The job's result is False if the player has no games (nothing 
+    is cached); it fails if archives are missing or the history could not be cached, so it is retried.
+
+    The thread never touches Streamlit; pages poll `get_history_backfill_status` and rerun when it is done.
+
+    Args:
+    player (str): The Chess.com username of the player.
+    """
+    global _backfill_executor
+    player = player.lower()
+
+    def backfill() -> bool:
+        games = get_player_stats(player)
+        if games.attrs.get('failed_archives'):
+            raise RuntimeError(f"{games.attrs['failed_archives']} monthly archive(s) could not be downloaded")
+        if games.empty:
+            return False
+        if not get_player_cache().put(player, games):
+            raise RuntimeError("The history could not be written to the player cache")
+        return True
+
+    with _backfill_lock:
+        job = _backfill_jobs.get(player)
+        if job is not None and not job.done():
+            return
+        if _backfill_executor is None:
+            _backfill_executor = ThreadPoolExecutor(max_workers=MAX_BACKFILL_WORKERS, thread_name_prefix='history-backfill')
+        _backfill_jobs[player] = _backfill_executor.submit(backfill)
+
+# Function to check on a background history download:
+def get_history_backfill_status(player: str) -> Optional[str]:
+    """
+    Returns 'running', 'done' or 'failed' for the background download of `player`'s history, 
+    or None if none was started in this process.
+    """
+    job = _backfill_jobs.get(player.lower())
+    if job is None:
+        return None
+    if not job.done():
+        return 'running'
+    if job.exception() is not None:
+        print(f"History backfill of {player} failed: {job.exception()}")
+        return 'failed'
+    return 'done'
+
+# Load Live Player Data progressively:
+def load_data_progressively(player: str, recent_archives: int = LIVE_RECENT_ARCHIVES,
+                            on_progress: Optional[Callable[[FetchProgress], None]] = None) -> Tuple[pd.DataFrame, bool]:
+    """
+    Returns a live player's full history if it is cached; otherwise returns their most recent archives 
+    right away and starts downloading the full history in the background (see `start_history_backfill`).
+
+    A cached history is served from memory by `load_data`. The disk is only read when the history is not 
+    in memory and no download of it is running: when the player is first looked up, and once the 
+    background download has finished. An expired history is downloaded in the background again.
+
+    Args:
+    player (str): The Chess.com username of the player.
+    recent_archives (int): Number of most recent monthly archives shown while the history is loading.
+    on_progress (Optional[Callable[[FetchProgress], None]]): Receives progress of the recent archives download.
+
+    Returns:
+    Tuple[pd.DataFrame, bool]: The games, and whether they are the player's complete history.
+    """
+    status = get_history_backfill_status(player)
+    if status != 'running':
+        try:
+            games = load_data(player)
+            if time.time() >= games.attrs.get('expires_at', 0):
+                # The disk entry expired: reread it (another process may have refreshed it) or download it again
+                load_data.clear(player)
+                games = load_data(player)
+            return games, True
+        except LookupError:
+            pass
+
+        job = _backfill_jobs.get(player.lower())
+        if status == 'done' and job is not None and not job.result():
+            # The download found no games, so there was nothing to cache and the recent view is all there is
+            with _backfill_lock:
+                _backfill_jobs.pop(player.lower(), None)
+            return load_recent_data(player, recent_archives, on_progress), True
+
+    start_history_backfill(player)
+    return load_recent_data(player, recent_archives, on_progress), False
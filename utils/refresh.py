@@ -0,0 +1,314 @@
+import streamlit as st
+from datetime import datetime,timedelta
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, FrozenSet
+
+from utils.db import migrate_database, pooled_connection, update_player_stats_live
+
+
+# Background refresh of tracked players (see run_due_refreshes):
+REFRESH_INTERVAL = timedelta(hours=int(os.environ.get('REFRESH_INTERVAL_HOURS', 24)))
+REFRESH_VIEWED_INTERVAL = timedelta(hours=1)  # cadence for players viewed within REFRESH_RECENTLY_VIEWED
+REFRESH_RECENTLY_VIEWED = timedelta(days=7)
+REFRESH_RETRY_DELAY = timedelta(minutes=15)  # first retry after a failure, doubled per consecutive failure
+REFRESH_STALE_AFTER = timedelta(hours=2)  # a job 'running' for longer than this is assumed dead
+REFRESH_MAX_WORKERS = 3
+REFRESH_POLL_INTERVAL = 300  # seconds between checks for due players
+
+_refresh_scheduler = None  # the scheduler started in this process (see start_refresh_scheduler)
+_view_recorder = None
+_view_recorder_lock = threading.Lock()
+
+#-------------------------------------------------------------- Refresh Scheduler : --------------------------------------------------------------#
+
+# Function to add players that have stored games to the refresh jobs
+def sync_refresh_jobs(conn) -> None:
+    """
+    Creates a refresh job, due right away, for every player in player_game_data that has none yet.
+
+    Args:
+        conn: A pooled database connection (see `init_connection`).
+    """
+    cursor = conn.cursor()
+    cursor.execute("""
+        INSERT INTO player_refresh_jobs (player_name, status, next_run, failures)
+        SELECT DISTINCT games.player_name, 'idle', ?, 0
+        FROM player_game_data AS games
+        WHERE NOT EXISTS (SELECT 1 FROM player_refresh_jobs AS jobs WHERE jobs.player_name = games.player_name)
+    """, (datetime.now(),))
+    conn.commit()
+    cursor.close()
+
+# Function to start tracking a player
+def track_player(player_name: str) -> None:
+    """
+    Adds a player to the refresh jobs (due right away), if they are not tracked yet.
+
+    Args:
+        player_name (str): The username of the chess player on Chess.com.
+    """
+    migrate_database()
+
+    with pooled_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT 1 FROM player_refresh_jobs WHERE player_name = ?", (player_name,))
+        if cursor.fetchone() is None:
+            cursor.execute("INSERT INTO player_refresh_jobs (player_name, status, next_run, failures) VALUES (?, 'idle', ?, 0)",
+                           (player_name, datetime.now()))
+        conn.commit()
+        cursor.close()
+
+# Function to list the tracked players
+def get_tracked_players(conn) -> FrozenSet[str]:
+    """
+    Returns the names of all players that have a refresh job.
+
+    Args:
+        conn: A pooled database connection (see `init_connection`).
+    """
+    cursor = conn.cursor()
+    cursor.execute("SELECT player_name FROM player_refresh_jobs")
+    players = frozenset(row[0] for row in cursor.fetchall())
+    cursor.close()
+    return players
+
+# Function to note that a player's page was viewed (viewed players are refreshed first and more often)
+def record_player_view(player_name: str) -> None:
+    """
+    Records that a tracked player was just viewed. Only players tracked by the refresh scheduler running 
+    in this process are recorded (see `start_refresh_scheduler`); for everyone else, and when no scheduler 
+    runs, nothing touches the database. The update runs on a background thread so a slow database never 
+    delays the page.
+
+    Args:
+        player_name (str): The username of the chess player on Chess.com.
+    """
+    player_name = player_name.lower()
+    scheduler = _refresh_scheduler
+    if scheduler is None or player_name not in scheduler.tracked_players:
+        return
+
+    def record() -> None:
+        try:
+            with pooled_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("UPDATE player_refresh_jobs SET last_viewed = ? WHERE player_name = ?",
+                               (datetime.now(), player_name))
+                conn.commit()
+                cursor.close()
+        except Exception as e:
+            print(f"Could not record view of {player_name}: {e}")
+
+    global _view_recorder
+    with _view_recorder_lock:
+        if _view_recorder is None:
+            _view_recorder = ThreadPoolExecutor(max_workers=1, thread_name_prefix='player-views')
+    _view_recorder.submit(record)
+
+# Function to pick the players whose refresh is due
+def get_due_players(conn, now: datetime, refresh_all: bool = False) -> List[str]:
+    """
+    Lists the tracked players that are due for a refresh, recently viewed players first.
+
+    A job still marked as running after REFRESH_STALE_AFTER (e.g. its worker was killed) is due again.
+
+    Args:
+        conn: A pooled database connection (see `init_connection`).
+        now (datetime): The current time.
+        refresh_all (bool): Treat every tracked player as due.
+
+    Returns:
+        List[str]: Player names in the order they should be refreshed.
+    """
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT player_name FROM player_refresh_jobs
+        WHERE (next_run <= ? OR ? = 1) AND (status <> 'running' OR started_at < ?)
+        ORDER BY CASE WHEN last_viewed >= ? THEN 0 ELSE 1 END, last_viewed DESC, next_run
+    """, (now, int(refresh_all), now - REFRESH_STALE_AFTER, now - REFRESH_RECENTLY_VIEWED))
+    players = [row[0] for row in cursor.fetchall()]
+    cursor.close()
+    return players
+
+# Function to claim a refresh job, so concurrent workers never refresh the same player twice
+def claim_refresh_job(player_name: str, conn, now: datetime) -> bool:
+    """
+    Marks a player's job as running, unless another worker is already running it.
+
+    Args:
+        player_name (str): The username of the chess player on Chess.com.
+        conn: A pooled database connection (see `init_connection`).
+        now (datetime): The current time.
+
+    Returns:
+        bool: True if this worker claimed the job.
+    """
+    cursor = conn.cursor()
+    cursor.execute("""
+        UPDATE player_refresh_jobs SET status = 'running', started_at = ?
+        WHERE player_name = ? AND (status <> 'running' OR started_at < ?)
+    """, (now, player_name, now - REFRESH_STALE_AFTER))
+    claimed = cursor.rowcount == 1
+    conn.commit()
+    cursor.close()
+    return claimed
+
+# Function to record the outcome of a refresh and schedule the next one
+def finish_refresh_job(player_name: str, conn, error: Optional[str] = None) -> None:
+    """
+    Stores the outcome of a player's refresh. Successful refreshes are next due after REFRESH_INTERVAL 
+    (REFRESH_VIEWED_INTERVAL for recently viewed players); failures are retried after REFRESH_RETRY_DELAY, 
+    doubled for every consecutive failure and capped at REFRESH_INTERVAL.
+
+    Args:
+        player_name (str): The username of the chess player on Chess.com.
+        conn: A pooled database connection (see `init_connection`).
+        error (Optional[str]): The error of a failed refresh, None if it succeeded.
+    """
+    now = datetime.now()
+    cursor = conn.cursor()
+    cursor.execute("SELECT failures, last_viewed FROM player_refresh_jobs WHERE player_name = ?", (player_name,))
+    failures, last_viewed = cursor.fetchone()
+    if isinstance(last_viewed, str):  # SQLite returns DATETIME columns as text
+        last_viewed = datetime.fromisoformat(last_viewed)
+
+    if error is None:
+        recently_viewed = last_viewed is not None and last_viewed >= now - REFRESH_RECENTLY_VIEWED
+        next_run = now + (REFRESH_VIEWED_INTERVAL if recently_viewed else REFRESH_INTERVAL)
+        cursor.execute("""
+            UPDATE player_refresh_jobs SET status = 'ok', finished_at = ?, next_run = ?, failures = 0, last_error = NULL
+            WHERE player_name = ?
+        """, (now, next_run, player_name))
+    else:
+        retry_delay = min(REFRESH_RETRY_DELAY * (2 ** failures), REFRESH_INTERVAL)
+        cursor.execute("""
+            UPDATE player_refresh_jobs SET status = 'failed', finished_at = ?, next_run = ?, failures = ?, last_error = ?
+            WHERE player_name = ?
+        """, (now, now + retry_delay, failures + 1, error[:500], player_name))
+    conn.commit()
+    cursor.close()
+
+# Function to refresh one player as a job
+def run_refresh_job(player_name: str, incremental: bool = True) -> Optional[str]:
+    """
+    Refreshes one claimed player and records the outcome. Errors (including Chess.com requests that 
+    failed, see `update_player_stats_live`) are caught and stored on the player's job, so they are retried 
+    with a backoff and one failing account never affects the others.
+
+    Args:
+        player_name (str): The username of the chess player on Chess.com.
+        incremental (bool): See `update_player_stats_live`.
+
+    Returns:
+        Optional[str]: The error message, or None if the refresh succeeded.
+    """
+    error = None
+    try:
+        with pooled_connection() as conn:
+            update_player_stats_live(player_name, conn, incremental=incremental, raise_errors=True)
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+        print(f"Refresh of {player_name} failed: {error}")
+
+    with pooled_connection() as conn:
+        finish_refresh_job(player_name, conn, error)
+    return error
+
+# Function to refresh every player that is due, a few at a time
+def run_due_refreshes(max_workers: int = REFRESH_MAX_WORKERS, limit: Optional[int] = None,
+                      incremental: bool = True, refresh_all: bool = False) -> Dict[str, Optional[str]]:
+    """
+    Refreshes the tracked players that are due (see `get_due_players`) with at most `max_workers` at once.
+    Job state lives in the player_refresh_jobs table, so several workers (or processes) can share it.
+
+    Args:
+        max_workers (int): Maximum number of players refreshed at the same time.
+        limit (Optional[int]): Maximum number of players refreshed in this run.
+        incremental (bool): See `update_player_stats_live`.
+        refresh_all (bool): Refresh every tracked player, due or not.
+
+    Returns:
+        Dict[str, Optional[str]]: Each refreshed player with their error message (None on success).
+    """
+    migrate_database()
+    now = datetime.now()
+
+    with pooled_connection() as conn:
+        sync_refresh_jobs(conn)
+        due = get_due_players(conn, now, refresh_all)[:limit]
+        players = [player for player in due if claim_refresh_job(player, conn, now)]
+
+    if not players:
+        return {}
+
+    print(f"Refreshing {len(players)} player(s): {players}")
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(players))), thread_name_prefix='player-refresh') as executor:
+        errors = executor.map(lambda player: run_refresh_job(player, incremental), players)
+        return dict(zip(players, errors))
+
+class RefreshScheduler:
+    """
+    Background thread that runs `run_due_refreshes` every `poll_interval` seconds until stopped.
+    Before every run `tracked_players` is reloaded with the players that have a refresh job.
+    """
+
+    def __init__(self, poll_interval: float = REFRESH_POLL_INTERVAL, max_workers: int = REFRESH_MAX_WORKERS) -> None:
+        self.poll_interval = poll_interval
+        self.max_workers = max_workers
+        self.tracked_players: FrozenSet[str] = frozenset()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def run_forever(self) -> None:
+        while not self._stop.is_set():
+            try:
+                with pooled_connection() as conn:
+                    self.tracked_players = get_tracked_players(conn)
+                run_due_refreshes(self.max_workers)
+            except Exception as e:
+                print(f"Refresh run failed: {e}")
+            self._stop.wait(self.poll_interval)
+
+    def start(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self.run_forever, name='refresh-scheduler', daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+# Function to start the refresh scheduler inside the app process
+@st.cache_resource(show_spinner=False)
+def start_refresh_scheduler() -> RefreshScheduler:
+    """
+    Starts one background RefreshScheduler per app process (Streamlit keeps the resource across reruns 
+    and sessions), so tracked players stay fresh without running `refresh.py --loop` separately. 
+    Player views are only recorded while it runs (see `record_player_view`).
+
+    Returns:
+        RefreshScheduler: The running scheduler.
+    """
+    global _refresh_scheduler
+
+    scheduler = RefreshScheduler()
+    scheduler.start()
+    _refresh_scheduler = scheduler
+    return scheduler
+
+# Function to bring every stored player up to date now (incrementally by default, or re-download everything)
+def refresh_all_player_data(incremental: bool = True):
+
+    # Every tracked player is refreshed right away by the refresh jobs. A player that fails keeps their 
+    # stored games (nothing is deleted up front) and is retried later with a backoff.
+    results = run_due_refreshes(incremental=incremental, refresh_all=True)
+
+    for player, error in results.items():
+        if error is None:
+            st.success(f"Data for {player} updated successfully.")
+        else:
+            st.error(f"Failed to update data for {player}: {error}")
@@ -0,0 +1,332 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import hashlib
+from dataclasses import dataclass, field
+from typing import List
+
+
+win_conditions = ['win']
+lose_conditions = ['resigned', 'checkmated', 'timeout', 'abandoned']
+draw_conditions = ['agreed', 'stalemate', '50move','repetition','timevsinsufficient','insufficient']
+
+#-------------------------------------------------------------- Player Perspective : --------------------------------------------------------------#
+
+# Per-game columns carried over unchanged into the player perspective table (when present)
+GAME_INFO_COLUMNS = ['game_url', 'game_date', 'game_time_control', 'game_time_class', 'game_variant', 'opening']
+
+def pick_side(white: pd.Series, black: pd.Series, is_white: pd.Series) -> pd.Series:
+    """
+    Picks the white value where `is_white` is True and the black value elsewhere.
+
+    Args:
+        white (pd.Series): The white_* column.
+        black (pd.Series): The black_* column.
+        is_white (pd.Series): Boolean mask, True for the rows to take from `white`.
+
+    Returns:
+        pd.Series: The combined column (categoricals are combined as plain objects).
+    """
+    if isinstance(white.dtype, pd.CategoricalDtype) or isinstance(black.dtype, pd.CategoricalDtype):
+        white, black = white.astype(object), black.astype(object)
+    return white.where(is_white, black)
+
+def normalise_player_games(df: pd.DataFrame, player: str) -> pd.DataFrame:
+    """
+    Converts raw games (white_* / black_* columns) into a table of the player's games seen from their side.
+
+    Args:
+        df (pd.DataFrame): Raw game data.
+        player (str): The username of the player.
+
+    Returns:
+        pd.DataFrame: One row per game of the player with the GAME_INFO_COLUMNS plus:
+            - color: 'white' or 'black'
+            - my_username / opp_username, my_rating / opp_rating, my_result / opp_result, my_accuracy / opp_accuracy
+            - outcome: 'win', 'draw', 'loss' (per win/draw/lose_conditions) or 'other'
+    """
+    games = df[(df['white_username'] == player) | (df['black_username'] == player)]
+    is_white = games['white_username'] == player
+    is_black = ~is_white
+
+    player_games = games[[column for column in GAME_INFO_COLUMNS if column in games]].copy()
+    player_games['color'] = pd.Categorical(np.where(is_white, 'white', 'black'), categories=['white', 'black'])
+
+    for column in ['username', 'rating', 'result', 'accuracy']:
+        player_games[f'my_{column}'] = pick_side(games[f'white_{column}'], games[f'black_{column}'], is_white)
+        player_games[f'opp_{column}'] = pick_side(games[f'white_{column}'], games[f'black_{column}'], is_black)
+
+    player_games['outcome'] = np.select(
+        [player_games['my_result'].isin(win_conditions),
+         player_games['my_result'].isin(draw_conditions),
+         player_games['my_result'].isin(lose_conditions)],
+        ['win', 'draw', 'loss'], default='other')
+
+    return player_games.reset_index(drop=True)
+
+@st.cache_data(show_spinner=False)
+def get_player_games(df: pd.DataFrame, player: str) -> pd.DataFrame:
+    """
+    Cached `normalise_player_games`: the player perspective table is only rebuilt when the games change.
+
+    Args:
+        df (pd.DataFrame): Raw game data.
+        player (str): The username of the player.
+
+    Returns:
+        pd.DataFrame: The player perspective table, with its dataset fingerprint in `attrs` (see `get_dataset_fingerprint`).
+    """
+    games = normalise_player_games(df, player)
+    games.attrs.pop('fingerprint', None)  # Inherited from df, which holds other rows
+    get_dataset_fingerprint(games)
+    return games
+
+# Extracting least played opening names:
+def get_least_played_openings(games: pd.DataFrame) -> List[str]:
+    """
+    Retrieves the least played openings of the player.
+
+    Args:
+        games (pd.DataFrame): The player perspective table (see `normalise_player_games`).
+
+    Returns:
+        List[str]: A list containing the five least played openings by the player.
+    """
+    
+    # Group by the opening and count the number of games played for each opening
+    temp_df = games.groupby('opening', observed=True).agg({'game_variant': 'count'}).reset_index()
+    
+    # Sort by the number of games played in ascending order to get the least played openings
+    least_played_openings = list(temp_df.sort_values(by='game_variant', ascending=True)['opening'])[:5]
+    
+    return least_played_openings
+
+# Player stats for one colour:
+@dataclass
+class ColorStats:
+    """Results, accuracy and openings of the player with one colour."""
+    total_games: int = 0
+    wins: int = 0
+    draws: int = 0
+    losses: int = 0
+    win_ratio: float = 0.0
+    draw_ratio: float = 0.0
+    loss_ratio: float = 0.0
+    accuracy: float = float('nan')
+    most_played_openings: List[str] = field(default_factory=list)
+    most_accurate_openings: List[str] = field(default_factory=list)
+
+# Player stats shown on the player pages:
+@dataclass
+class PlayerStats:
+    """Stats of the player over a set of games, see `compute_player_stats`."""
+    total_games: int
+    opening_lines: int
+    white: ColorStats
+    black: ColorStats
+
+def get_ratio(count: int, total: int) -> float:
+    """
+    Returns `count` as a percentage of `total`, rounded to two decimals (0.0 when there are no games).
+    """
+    return round((count / total) * 100, 2) if total else 0.0
+
+# For computing player stats:
+def compute_player_stats(games: pd.DataFrame, top_n: int = 5) -> PlayerStats:
+    """
+    Computes the win/draw/loss counts and ratios, accuracies and opening rankings for both colours.
+
+    The result counts come from a single groupby on (color, outcome) and the openings from a single
+    groupby on (color, opening), instead of one boolean mask per number.
+
+    Args:
+        games (pd.DataFrame): The player perspective table (see `normalise_player_games`).
+        top_n (int): How many openings to keep in each ranking.
+
+    Returns:
+        PlayerStats: Overall totals plus a ColorStats for white and one for black.
+    """
+    outcome_counts = (games.groupby(['color', 'outcome'], observed=True).size()
+                      .unstack(fill_value=0)
+                      .reindex(index=['white', 'black'], columns=['win', 'draw', 'loss', 'other'], fill_value=0))
+
+    # Games without an accuracy are stored as 0 and are left out of the average
+    rated = games[games['my_accuracy'] != 0]
+    accuracies = rated.groupby('color', observed=True)['my_accuracy'].mean()
+
+    openings = games.groupby(['color', 'opening'], observed=True).agg(games_played=('opening', 'size'),
+                                                                      accuracy=('my_accuracy', 'mean'))
+
+    color_stats = {}
+    for color in ['white', 'black']:
+        counts = outcome_counts.loc[color]
+        total = int(counts.sum())
+        wins, draws, losses = int(counts['win']), int(counts['draw']), int(counts['loss'])
+
+        color_openings = openings.xs(color, level='color') if color in openings.index.get_level_values(0) else openings.iloc[:0]
+        color_stats[color] = ColorStats(
+            total_games=total,
+            wins=wins,
+            draws=draws,
+            losses=losses,
+            win_ratio=get_ratio(wins, total),
+            draw_ratio=get_ratio(draws, total),
+            loss_ratio=get_ratio(losses, total),
+            accuracy=round(float(accuracies.get(color, float('nan'))), 2),
+            most_played_openings=list(color_openings.sort_values(by='games_played', ascending=False).index[:top_n]),
+            most_accurate_openings=list(color_openings.sort_values(by='accuracy', ascending=False).index[:top_n]),
+        )
+
+    return PlayerStats(
+        total_games=len(games),
+        opening_lines=games['opening'].nunique(dropna=False),
+        white=color_stats['white'],
+        black=color_stats['black'],
+    )
+
+#-------------------------------------------------------------- Data Fingerprint : --------------------------------------------------------------#
+
+# Function to fingerprint the data a chart is built from
+def get_dataset_fingerprint(df: pd.DataFrame) -> str:
+    """
+    Returns a fingerprint that changes whenever the rows or values of the DataFrame change.
+
+    Hashing every value of a large frame costs about as much as building a chart, so the hash of the 
+    full data is computed once and stored in `df.attrs['fingerprint']` (see `get_player_games`). pandas 
+    carries attrs over to filtered frames, so those are told apart by their row labels and columns. 
+    Frames are treated as immutable: a column changed in place keeps its fingerprint.
+
+    Args:
+        df (pd.DataFrame): The data.
+
+    Returns:
+        str: A hex digest.
+    """
+    if 'fingerprint' not in df.attrs:
+        df.attrs['fingerprint'] = hashlib.sha1(pd.util.hash_pandas_object(df).to_numpy().tobytes()).hexdigest()
+
+    digest = hashlib.sha1(df.attrs['fingerprint'].encode())
+    digest.update(pd.util.hash_pandas_object(df.index, index=False).to_numpy().tobytes())
+    digest.update(repr(list(df.columns)).encode())
+    return digest.hexdigest()
+
+def filter_data_by_time_period(df: pd.DataFrame, time_period: str) -> pd.DataFrame:
+    """
+    Filters the DataFrame based on the specified time period relative to the maximum game date.
+
+    Parameters:
+    - df (pd.DataFrame): The DataFrame containing game data with a 'game_date' column.
+    - time_period (str): The time period to filter by. Options are 'Last 1 Year', 'Last 3 Years', or 'All Time'.
+
+    Returns:
+    - pd.DataFrame: Filtered DataFrame based on the specified time period.
+    """
+    max_date = df['game_date'].max()
+    if time_period == 'Last 1 Year':
+        return df[df['game_date'] >= (max_date - pd.DateOffset(years=1))]
+    elif time_period == 'Last 3 Years':
+        return df[df['game_date'] >= (max_date - pd.DateOffset(years=3))]
+    else:
+        return df
+    
+# Number of playing days averaged by the smoothed rating
+RATING_SMOOTHING_WINDOW = 12
+
+def build_rating_series(games: pd.DataFrame) -> pd.DataFrame:
+    """
+    Builds the player's daily rating series that the rating charts slice by time period.
+
+    Parameters:
+    - games (pd.DataFrame): The player perspective table (see `normalise_player_games`).
+
+    Returns:
+    - pd.DataFrame: One row per playing day, sorted by 'game_date', with the player's highest rating of the day
+      ('rating') and its rolling mean over RATING_SMOOTHING_WINDOW days ('smoothed_rating').
+    """
+    ratings = pd.DataFrame({'game_date': pd.to_datetime(games['game_date']), 'rating': games['my_rating']})
+
+    series = ratings.groupby('game_date')['rating'].max().to_frame()
+    series['smoothed_rating'] = series['rating'].rolling(window=RATING_SMOOTHING_WINDOW).mean()
+
+    return series.reset_index()
+
+@st.cache_data(show_spinner=False)
+def get_rating_series(games: pd.DataFrame) -> pd.DataFrame:
+    """
+    Cached `build_rating_series`: the series is only rebuilt when the player's games change.
+
+    Parameters:
+    - games (pd.DataFrame): The player perspective table (see `normalise_player_games`).
+
+    Returns:
+    - pd.DataFrame: The daily rating series.
+    """
+    return build_rating_series(games)
+
+# Calculate Avg. Opponent Rating: 
+def calculate_avg_opponent_rating(games: pd.DataFrame) -> float:
+    """
+    Calculate the average rating of opponents that the player has faced.
+
+    Parameters:
+    games (pd.DataFrame): The player perspective table (see `normalise_player_games`).
+
+    Returns:
+    float: The average opponent rating rounded to the nearest whole number.
+    """
+    avg_opponent_rating = games['opp_rating'].mean()
+    
+    return round(avg_opponent_rating)
+
+# Function to return the selected player's best win
+def get_best_win(games: pd.DataFrame, win_conditions: list) -> tuple[str, float] | tuple[None, None]:
+    """
+    Get the best win (highest-rated opponent) for the player based on specified win conditions.
+
+    Parameters:
+    games (pd.DataFrame): The player perspective table (see `normalise_player_games`).
+    win_conditions (list): A list of conditions that define a win (e.g., ['win']).
+
+    Returns:
+    tuple[str, float] | tuple[None, None]: A tuple containing the opponent's name and rating for the best win,
+                                             or (None, None) if there are no wins.
+    """
+
+    win_df = games[games['my_result'].isin(win_conditions)]
+
+    if win_df.empty:
+        return None, None  # No wins
+
+    # Get best win
+    best_win = win_df.loc[win_df['opp_rating'].idxmax()]
+
+    return best_win['opp_username'].capitalize(), best_win['opp_rating']
+
+# Get Rapid rating:
+def get_game_class_rating(games: pd.DataFrame, game_class: str) -> float:
+    """
+    Retrieve the highest rating of a player in a specified game time class.
+
+    Parameters:
+    games (pd.DataFrame): The player perspective table (see `normalise_player_games`).
+    game_class (str): The game time class to filter by ('rapid', 'blitz', or 'bullet').
+
+    Returns:
+    float: The highest rating for the specified game time class, or None if no ratings are available.
+    
+    Raises:
+    ValueError: If an invalid game time class is provided.
+    """
+
+    if game_class not in ['rapid', 'blitz', 'bullet']:
+        raise ValueError(f"Invalid game time class: {game_class}. Choose from 'rapid', 'blitz', or 'bullet'.")
+    
+    # Filter the DataFrame by the specified game time class
+    class_df = games[games['game_time_class'] == game_class]
+    
+    # Check if there are ratings for the given game time class
+    if not class_df.empty:
+        # Return the player's highest rating for the specified game time class
+        return class_df['my_rating'].max()
+    else:
+        return None 
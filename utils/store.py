@@ -0,0 +1,325 @@
+import streamlit as st
+import pandas as pd
+import os
+import shutil
+import tempfile
+from typing import List, Optional, Any, Tuple
+
+
+#-------------------------------------------------------------- Game Store : --------------------------------------------------------------#
+
+# Stored games of the top players: CSV sources and their columnar (Parquet) copies
+JR_GAMES_CSV = 'data/TOP_5_Jr_Players_Stats2.csv'
+JR_GAMES_STORE = 'data/TOP_5_Jr_Players_Stats2.parquet'
+SR_GAMES_CSV = 'data/TOP_15_Sr_Players_Stats_New.csv'
+SR_GAMES_STORE = 'data/TOP_15_Sr_Players_Stats_New.parquet'
+
+# Per-player copies of the stores, partitioned as <dataset>/player=<username>/year=<yyyy>/*.parquet
+JR_GAMES_DATASET = 'data/games/jr'
+SR_GAMES_DATASET = 'data/games/sr'
+
+# Columns the Jr / Sr pages use (the PGN text and time control are never read)
+PAGE_GAME_COLUMNS = ['game_url', 'game_date', 'game_time_class', 'game_variant', 'opening',
+                     'white_rating', 'white_result', 'white_username', 'white_accuracy',
+                     'black_rating', 'black_result', 'black_username', 'black_accuracy']
+
+# Attempts at reading a player's partition while another session swaps in a rebuilt one
+PARTITION_READ_ATTEMPTS = 3
+
+# Periods the Jr / Sr pages can be limited to, in years before the player's last game (None for every game)
+PAGE_PERIODS = {'All Time': None, 'Last 3 Years': 3, 'Last 1 Year': 1}
+
+# Compact dtypes of the game store (low-cardinality text as categories, ratings as small integers)
+GAME_CATEGORY_COLUMNS = ['white_username', 'black_username', 'white_result', 'black_result',
+                         'game_time_class', 'game_time_control', 'game_variant', 'opening']
+GAME_RATING_COLUMNS = ['white_rating', 'black_rating']
+GAME_ACCURACY_COLUMNS = ['white_accuracy', 'black_accuracy']
+
+def optimise_game_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Converts a raw games DataFrame to the compact dtypes of the game store.
+
+    Args:
+        df (pd.DataFrame): Games as read from CSV (any subset of the columns).
+
+    Returns:
+        pd.DataFrame: The same games with categorical usernames, results, time class and opening, 
+                      nullable Int16 ratings, float32 accuracies and a datetime game_date.
+    """
+    df = df.copy()
+
+    for column in GAME_CATEGORY_COLUMNS:
+        if column in df:
+            df[column] = df[column].astype('category')
+    for column in GAME_RATING_COLUMNS:
+        if column in df:
+            df[column] = pd.to_numeric(df[column], errors='coerce').round().astype('Int16')
+    for column in GAME_ACCURACY_COLUMNS:
+        if column in df:
+            df[column] = pd.to_numeric(df[column], errors='coerce').astype('float32')
+    if 'game_date' in df:
+        # PGN dates are 'yyyy.mm.dd'
+        df['game_date'] = pd.to_datetime(df['game_date'].astype(str).str.replace('.', '-', regex=False), errors='coerce')
+
+    return df
+
+def convert_games_csv_to_parquet(csv_path: str, store_path: str) -> str:
+    """
+    Converts a games CSV into the columnar game store.
+
+    Args:
+        csv_path (str): Path of the source CSV file.
+        store_path (str): Path of the Parquet file to write.
+
+    Returns:
+        str: The path of the written Parquet file.
+    """
+    df = optimise_game_dtypes(pd.read_csv(csv_path, low_memory=False))
+    df.to_parquet(store_path, index=False)
+    return store_path
+
+def load_game_store(store_path: str, csv_path: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Loads games from the Parquet game store, reading only the requested columns.
+    The store is (re)built from the CSV first when it is missing or older than the CSV.
+
+    Args:
+        store_path (str): Path of the Parquet file.
+        csv_path (str): Path of the CSV file the store is built from.
+        columns (Optional[List[str]]): Columns to load, or None for all of them.
+
+    Returns:
+        pd.DataFrame: The stored games.
+    """
+    csv_is_newer = os.path.exists(csv_path) and (not os.path.exists(store_path)
+                                                 or os.path.getmtime(csv_path) > os.path.getmtime(store_path))
+    if csv_is_newer:
+        try:
+            convert_games_csv_to_parquet(csv_path, store_path)
+        except (OSError, ImportError) as e:
+            # No writable data folder or no Parquet engine: fall back to reading the CSV directly
+            print(f"Could not build game store {store_path}: {e}")
+            return optimise_game_dtypes(pd.read_csv(csv_path, usecols=columns, low_memory=False))
+
+    return pd.read_parquet(store_path, columns=columns)
+
+def get_player_partition_path(dataset_path: str, player: str) -> str:
+    """
+    Returns the directory holding a player's partition of a game dataset.
+
+    Args:
+        dataset_path (str): Root directory of the partitioned dataset.
+        player (str): The username of the player.
+
+    Returns:
+        str: The partition directory.
+    """
+    return os.path.join(dataset_path, f"player={player}")
+
+def build_player_partition(dataset_path: str, store_path: str, csv_path: str, player: str) -> None:
+    """
+    (Re)writes a player's partition of a game dataset from the full game store, split by year.
+    This is the only step that scans the whole store, and it runs once per player and store version.
+    The partition is written to a temporary directory and swapped in, so sessions reading it meanwhile 
+    never see it empty or half written.
+
+    Args:
+        dataset_path (str): Root directory of the partitioned dataset.
+        store_path (str): Path of the Parquet game store.
+        csv_path (str): Path of the CSV file the store is built from.
+        player (str): The username of the player.
+    """
+    df = load_game_store(store_path, csv_path)
+    player_df = df[(df['white_username'] == player) | (df['black_username'] == player)].copy()
+    player_df['player'] = player
+    player_df['year'] = player_df['game_date'].dt.year.fillna(0).astype(int)
+
+    partition_path = get_player_partition_path(dataset_path, player)
+
+    # Dot-prefixed directories are skipped when the dataset is read
+    os.makedirs(dataset_path, exist_ok=True)
+    temp_path = tempfile.mkdtemp(prefix='.tmp-', dir=dataset_path)
+    old_path = f"{temp_path}-old"
+    try:
+        if not player_df.empty:
+            player_df.to_parquet(temp_path, partition_cols=['player', 'year'], index=False)
+        new_partition_path = get_player_partition_path(temp_path, player)
+        os.makedirs(new_partition_path, exist_ok=True)  # Marks the player as partitioned even without games
+
+        try:
+            os.replace(partition_path, old_path)
+        except FileNotFoundError:
+            pass  # First build, or another session is swapping its partition in
+        try:
+            os.replace(new_partition_path, partition_path)
+        except OSError:
+            pass  # Another session swapped in its own (equally fresh) partition first
+    finally:
+        shutil.rmtree(temp_path, ignore_errors=True)
+        shutil.rmtree(old_path, ignore_errors=True)
+
+def ensure_player_partition(dataset_path: str, store_path: str, csv_path: str, player: str) -> str:
+    """
+    Builds a player's partition of a game dataset when it is missing or older than the game store 
+    or its CSV (a CSV update is picked up even before the store itself is rebuilt).
+
+    Args:
+        dataset_path (str): Root directory of the partitioned dataset.
+        store_path (str): Path of the Parquet game store the partitions are built from.
+        csv_path (str): Path of the CSV file the store is built from.
+        player (str): The username of the player.
+
+    Returns:
+        str: The partition directory.
+    """
+    partition_path = get_player_partition_path(dataset_path, player)
+    source_mtime = max([os.path.getmtime(path) for path in (store_path, csv_path) if os.path.exists(path)], default=0)
+    if not os.path.isdir(partition_path) or source_mtime > os.path.getmtime(partition_path):
+        build_player_partition(dataset_path, store_path, csv_path, player)
+    return partition_path
+
+def read_player_partition(dataset_path: str, store_path: str, csv_path: str, player: str,
+                          columns: Optional[List[str]] = None, filters: Optional[List[Tuple]] = None) -> pd.DataFrame:
+    """
+    Reads a player's partition directory (built first when missing or stale), with the filters pushed 
+    down to Parquet. A read that loses its files to a rebuild swapped in meanwhile (see 
+    `build_player_partition`) fails instead of returning partial rows, and is retried.
+
+    Args:
+        dataset_path (str): Root directory of the partitioned dataset.
+        store_path (str): Path of the Parquet game store the partitions are built from.
+        csv_path (str): Path of the CSV file the store is built from.
+        player (str): The username of the player.
+        columns (Optional[List[str]]): Columns to load, or None for all of them.
+        filters (Optional[List[Tuple]]): Parquet filters on the game columns or 'year'.
+
+    Returns:
+        pd.DataFrame: The matching games.
+    """
+    for attempt in range(PARTITION_READ_ATTEMPTS):
+        partition_path = ensure_player_partition(dataset_path, store_path, csv_path, player)
+        try:
+            if not any(entry.name.startswith('year=') for entry in os.scandir(partition_path)):
+                return pd.DataFrame(columns=columns or [])  # No games for this player
+            return pd.read_parquet(partition_path, columns=columns, filters=filters or None)
+        except FileNotFoundError:
+            if attempt == PARTITION_READ_ATTEMPTS - 1:
+                raise
+
+def get_period_start_date(dataset_path: str, store_path: str, csv_path: str, player: str,
+                          years: Optional[int]) -> Optional[pd.Timestamp]:
+    """
+    Returns the first day of the last `years` years of a player's games (counted back from their last 
+    game, like `filter_data_by_time_period`). Only the dates of the player's latest year partition are read.
+
+    Args:
+        dataset_path (str): Root directory of the partitioned dataset.
+        store_path (str): Path of the Parquet game store the partitions are built from.
+        csv_path (str): Path of the CSV file the store is built from.
+        player (str): The username of the player.
+        years (Optional[int]): Length of the period, None for all games.
+
+    Returns:
+        Optional[pd.Timestamp]: The start date, or None for all games.
+    """
+    if not years:
+        return None
+
+    partition_path = ensure_player_partition(dataset_path, store_path, csv_path, player)
+    partition_years = [int(entry.name.split('=', 1)[1]) for entry in os.scandir(partition_path) if entry.name.startswith('year=')]
+    if not partition_years:
+        return None
+
+    dates = read_player_partition(dataset_path, store_path, csv_path, player, ['game_date'],
+                                  [('year', '==', max(partition_years))])['game_date']
+    return dates.max() - pd.DateOffset(years=years) if dates.notna().any() else None
+
+def load_player_games(dataset_path: str, store_path: str, csv_path: str, player: str,
+                      columns: Optional[List[str]] = None, start_date: Optional[Any] = None) -> pd.DataFrame:
+    """
+    Loads one player's games from a partitioned game dataset. Only the player's partition (and, with
+    `start_date`, only the years from that date on) is read; the filters are pushed down to Parquet.
+
+    Args:
+        dataset_path (str): Root directory of the partitioned dataset.
+        store_path (str): Path of the Parquet game store the partitions are built from.
+        csv_path (str): Path of the CSV file the store is built from.
+        player (str): The username of the player.
+        columns (Optional[List[str]]): Columns to load, or None for all of them.
+        start_date (Optional[Any]): Only load games played on or after this date.
+
+    Returns:
+        pd.DataFrame: The player's games.
+    """
+    filters = []
+    if start_date is not None:
+        start_date = pd.Timestamp(start_date)
+        filters += [('year', '>=', start_date.year), ('game_date', '>=', start_date)]
+
+    df = read_player_partition(dataset_path, store_path, csv_path, player, columns, filters)
+    return df.drop(columns=['player', 'year'], errors='ignore').reset_index(drop=True)
+
+#Load Jr Data:
+@st.cache_data(show_spinner=False)
+def jr_data(columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Load junior players' statistics from the game store.
+
+    Args:
+    columns (Optional[List[str]]): Columns to load (e.g. PAGE_GAME_COLUMNS), or None for all of them.
+
+    Returns:
+    pd.DataFrame: A DataFrame containing junior players' statistics.
+    """
+    df = load_game_store(JR_GAMES_STORE, JR_GAMES_CSV, columns)
+    return df
+
+#Load Sr Data:
+@st.cache_data(show_spinner=False)
+def sr_data(columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Load senior players' statistics from the game store.
+
+    Args:
+    columns (Optional[List[str]]): Columns to load (e.g. PAGE_GAME_COLUMNS), or None for all of them.
+
+    Returns:
+    pd.DataFrame: A DataFrame containing senior players' statistics, excluding 'daily' game time class.
+    """
+    df = load_game_store(SR_GAMES_STORE, SR_GAMES_CSV, columns)
+    df[df['game_time_class']!='daily']
+    return df
+
+#Load one Jr player's games:
+@st.cache_data(show_spinner=False)
+def jr_player_data(player: str, columns: Optional[List[str]] = None, years: Optional[int] = None) -> pd.DataFrame:
+    """
+    Load a junior player's games from the player's partition of the junior game store.
+
+    Args:
+    player (str): The username of the player.
+    columns (Optional[List[str]]): Columns to load (e.g. PAGE_GAME_COLUMNS), or None for all of them.
+    years (Optional[int]): Only load the games of the player's last `years` years (see PAGE_PERIODS), None for all.
+
+    Returns:
+    pd.DataFrame: A DataFrame containing the player's games.
+    """
+    start_date = get_period_start_date(JR_GAMES_DATASET, JR_GAMES_STORE, JR_GAMES_CSV, player, years)
+    return load_player_games(JR_GAMES_DATASET, JR_GAMES_STORE, JR_GAMES_CSV, player, columns, start_date)
+
+#Load one Sr player's games:
+@st.cache_data(show_spinner=False)
+def sr_player_data(player: str, columns: Optional[List[str]] = None, years: Optional[int] = None) -> pd.DataFrame:
+    """
+    Load a senior player's games from the player's partition of the senior game store.
+
+    Args:
+    player (str): The username of the player.
+    columns (Optional[List[str]]): Columns to load (e.g. PAGE_GAME_COLUMNS), or None for all of them.
+    years (Optional[int]): Only load the games of the player's last `years` years (see PAGE_PERIODS), None for all.
+
+    Returns:
+    pd.DataFrame: A DataFrame containing the player's games.
+    """
+    start_date = get_period_start_date(SR_GAMES_DATASET, SR_GAMES_STORE, SR_GAMES_CSV, player, years)
+    return load_player_games(SR_GAMES_DATASET, SR_GAMES_STORE, SR_GAMES_CSV, player, columns, start_date)
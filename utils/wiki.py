@@ -0,0 +1,120 @@
+import streamlit as st
+import re
+
+
+# Extract Player Summary from Wikipedia API:
+def extract_all_sections_with_summary(player_name: str) -> dict | None:
+    """
+    Extract sections from a Wikipedia page about a player, including the first paragraph and a summary.
+
+    Parameters:
+    player_name (str): The name of the player whose Wikipedia page is to be extracted.
+
+    Returns:
+    dict | None: A dictionary containing section titles, first paragraphs, full content, and summaries,
+                  or None if the page cannot be found or leads to a disambiguation page.
+    """
+
+    import wikipedia  # Loaded on first use (slow to import)
+
+    try:
+        # Fetch the Wikipedia page
+        page = wikipedia.page(player_name)
+        content = page.content
+
+        # Dictionary to hold section titles, content, and summaries
+        sections = {}
+        
+        # Split the content into sections
+        lines = content.split('\n')
+        current_section = None
+        section_content = []
+
+        for line in lines:
+            # Check for section headers (usually they are underlined with '== ... ==')
+            if line.startswith('==') and line.endswith('=='):
+                if current_section:
+                    # Create a summary by taking the first 2-3 sentences
+                    full_text = '\n'.join(section_content) if section_content else 'No content available'
+                    summary = '. '.join(full_text.split('. ')[:2]) + '.' if section_content else 'No content available'
+
+                    # Save the previous section content and summary
+                    sections[current_section] = {
+                        'first_paragraph': section_content[0] if section_content else 'No content available',
+                        'full_content': full_text,
+                        'summary': summary
+                    }
+                # Start a new section
+                current_section = line.strip('== ').strip()
+                section_content = []
+            else:
+                # Collect content for the current section
+                section_content.append(line.strip())
+
+        # Add the last section
+        if current_section:
+            full_text = ''.join(section_content) if section_content else 'No content available'
+            summary = '. '.join(full_text.split('. ')[:2]) + '.' if section_content else 'No content available'
+
+            sections[current_section] = {
+                'first_paragraph': section_content[0] if section_content else 'No content available',
+                'full_content': full_text.strip(),
+                'summary': summary.strip()
+            }
+
+        return sections
+    
+    except wikipedia.exceptions.PageError:
+        st.error(f"Page for '{player_name}' not found. Please check the name and try again.")
+        return None
+    except wikipedia.exceptions.DisambiguationError as e:
+        st.error(f"'{player_name}' leads to a disambiguation page. Please be more specific. Options include: {', '.join(e.options[:5])}...")
+        return None
+
+# Format paragraphs with bullet points:
+def format_with_bullets(content: str) -> str:
+    """
+    Format the provided content into bullet points, grouping lines by year.
+
+    Parameters:
+    content (str): The content to format, where lines may start with a year.
+
+    Returns:
+    str: The formatted content as a Markdown string with bullet points.
+    """
+    # Split content into lines
+    lines = content.split('\n')
+
+    # Regular expression to detect lines starting with a year (e.g., "2016:", "2017:")
+    year_pattern = re.compile(r'^\d{4}:')
+    
+    # List to store formatted content
+    formatted_content = []
+    current_year_line = None
+    
+    for line in lines:
+        line = line.strip()
+
+        # Takes care of extra-bullet point in fulltext:
+        if not line:
+            continue
+
+        if year_pattern.match(line):
+            # If a line starts with a year, save it as the current year line
+            if current_year_line:
+                # If there's an existing year line, append it to the formatted content
+                formatted_content.append(f"* {current_year_line.strip()}")
+            current_year_line = line
+        else:
+            # If the line doesn't start with a year, append it to the current year line
+            if current_year_line:
+                current_year_line += f" {line}"
+            else:
+                formatted_content.append(f"* {line}")  # For lines without a year, add them normally
+
+    # Append the last year line if it exists
+    if current_year_line:
+        formatted_content.append(f"* {current_year_line}")
+
+    # Join the formatted content into paragraphs and return as Markdown
+    return '\n\n'.join(formatted_content)